@@ -0,0 +1,167 @@
+"""Compare the single-pass section parser with the regex post-processing it replaced.
+
+Two workloads: synthetic posts of 50KB and more (long model rambles with
+fenced code, which is where the repeated full-text scans hurt), and a re-score
+of every model response logged in ``llm_runs``. Each workload runs the full
+post-processing path: body cleanup (fence and ``## Code`` removal plus title
+enforcement), appending the code section, quality scoring of the final post
+and line counts. Outputs of both implementations are compared and mismatches
+reported.
+
+Usage:
+    python -m benchmarks.markdown_parse_benchmark --sizes 50,200 --repeats 50
+"""
+
+import argparse
+import re
+import time
+from typing import Any, Callable, Dict, List, Tuple
+
+from config import TITLE_LETTER_COUNT
+from services.markdown_sections import count_lines, parse_post, render_body
+from services.metrics_service import analyze_response_quality, fetch_recent_runs
+
+
+def _legacy_body(text: str) -> str:
+    content = (text or "").strip()
+    if not content:
+        return ""
+    content = re.sub(r"```[\s\S]*?```", "", content)
+    content = re.sub(r"(?ims)^##\s*Code\b[\s\S]*$", "", content).strip()
+
+    def _trim_title(match: re.Match) -> str:
+        title_text = match.group(1)
+        if len(title_text) > TITLE_LETTER_COUNT:
+            title_text = title_text[:TITLE_LETTER_COUNT].rstrip()
+        return f"Title: {title_text}"
+
+    return re.sub(r"(?im)^Title:\s*(.+)$", _trim_title, content)
+
+
+def _legacy_quality(text: str) -> Tuple[int, ...]:
+    content = (text or "").strip()
+    first_non_empty = ""
+    for line in content.splitlines():
+        if line.strip():
+            first_non_empty = line.strip()
+            break
+    flags = re.IGNORECASE | re.MULTILINE
+    return (
+        int(bool(first_non_empty and not first_non_empty.startswith("#"))),
+        int(bool(re.search(r"^##\s+Intuition\b", content, flags=flags))),
+        int(bool(re.search(r"^##\s+Approach\b", content, flags=flags))),
+        int(bool(re.search(r"^##\s+Time\s+Complexity\b", content, flags=flags))),
+        int(bool(re.search(r"^##\s+Space\s+Complexity\b", content, flags=flags))),
+        int("```" in content),
+    )
+
+
+def _with_code(body: str, code: str) -> str:
+    return f"{body}\n\n## Code\n```text\n{code}\n```"
+
+
+def _legacy(llm_text: str, code: str) -> Tuple[Any, ...]:
+    final_text = _with_code(_legacy_body(llm_text), code)
+    return (
+        final_text,
+        _legacy_quality(final_text),
+        len(llm_text.splitlines()),
+        len(final_text.splitlines()),
+    )
+
+
+def _current(llm_text: str, code: str) -> Tuple[Any, ...]:
+    final_text = _with_code(render_body(parse_post(llm_text), TITLE_LETTER_COUNT), code)
+    quality = analyze_response_quality(final_text)
+    return (
+        final_text,
+        (
+            quality["has_title"],
+            quality["has_intuition"],
+            quality["has_approach"],
+            quality["has_time_complexity"],
+            quality["has_space_complexity"],
+            quality["has_code_block"],
+        ),
+        count_lines(llm_text),
+        count_lines(final_text),
+    )
+
+
+def _synthetic_post(target_kb: int) -> str:
+    paragraph = "The window only moves forward, so every index is visited at most twice and `seen` stays small.\n"
+    block = "```python\n" + "total += values[index] * weight\n" * 20 + "```\n"
+    parts = [f"Title: Sliding Window with Hash Map for Longest Substring in O(n) {'Time ' * 20}\n", "## Intuition\n"]
+    size = sum(len(part) for part in parts)
+    while size < target_kb * 1024:
+        for part in (paragraph * 8, block):
+            parts.append(part)
+            size += len(part)
+    parts.append("## Approach\n1. Expand.\n2. Shrink.\n## Time Complexity\nO(n)\n## Space Complexity\nO(k)\n")
+    parts.append("## Code\n```python\nclass Solution:\n    pass\n```\n")
+    return "".join(parts)
+
+
+_SYNTHETIC_CODE = "class Solution:\n    def solve(self, values):\n        return sum(values)"
+
+
+def _time_per_item(
+    implementation: Callable[[str, str], Tuple[Any, ...]],
+    samples: List[Tuple[str, str]],
+    repeats: int,
+) -> float:
+    started_at = time.perf_counter()
+    for _ in range(repeats):
+        for llm_text, code in samples:
+            implementation(llm_text, code)
+    elapsed = time.perf_counter() - started_at
+    return elapsed / max(repeats * len(samples), 1) * 1_000_000
+
+
+def _compare(label: str, samples: List[Tuple[str, str]], repeats: int) -> Dict[str, Any]:
+    mismatches = sum(1 for llm_text, code in samples if _legacy(llm_text, code) != _current(llm_text, code))
+    legacy_us = _time_per_item(_legacy, samples, repeats)
+    current_us = _time_per_item(_current, samples, repeats)
+    return {
+        "workload": label,
+        "items": len(samples),
+        "legacy_us": round(legacy_us, 1),
+        "current_us": round(current_us, 1),
+        "speedup": round(legacy_us / current_us, 2) if current_us > 0 else 0.0,
+        "mismatches": mismatches,
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmark post parsing and quality scoring")
+    parser.add_argument("--sizes", default="50,200", help="Comma-separated synthetic post sizes in KB")
+    parser.add_argument("--repeats", type=int, default=50, help="Passes over each workload")
+    parser.add_argument("--history-limit", type=int, default=100000, help="Most recent llm_runs rows to re-score")
+    args = parser.parse_args()
+
+    results: List[Dict[str, Any]] = []
+    for size in [int(value) for value in args.sizes.split(",") if value.strip()]:
+        post = _synthetic_post(size)
+        results.append(_compare(f"synthetic {len(post) // 1024}KB", [(post, _SYNTHETIC_CODE)], args.repeats))
+
+    history = [
+        (row.get("llm_response_text") or "", row.get("code_text") or "")
+        for row in fetch_recent_runs(limit=args.history_limit)
+        if row.get("llm_response_text")
+    ]
+    if history:
+        results.append(_compare("llm_runs history", history, max(args.repeats // 10, 1)))
+    else:
+        print("llm_runs is empty; only the synthetic workloads were run.")
+
+    print(f"{'workload':<22}{'items':>8}{'legacy_us':>12}{'current_us':>12}{'speedup':>10}{'mismatches':>12}")
+    for result in results:
+        print(
+            f"{result['workload']:<22}{result['items']:>8}{result['legacy_us']:>12}"
+            f"{result['current_us']:>12}{result['speedup']:>10}{result['mismatches']:>12}"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
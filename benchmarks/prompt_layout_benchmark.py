@@ -0,0 +1,121 @@
+"""Compare prompt-eval cost of the inline and system_prefix prompt layouts.
+
+Replays recent distinct problems from ``llm_runs`` through each layout with
+``num_predict=1`` so only prompt processing is measured, bypassing the response
+cache. Within a layout the problems are sent back to back, which is when the
+shared system prefix can be served from the server's KV cache. Requests go
+through the configured LLM_BACKEND; prompt-eval time needs a server that
+reports it (Ollama, llama.cpp).
+
+Usage:
+    python -m benchmarks.prompt_layout_benchmark --limit 10 --repeats 2
+"""
+
+import argparse
+import statistics
+from typing import Any, Dict, List
+
+import requests
+
+from config import LLM_TIMEOUT_SECONDS, OLLAMA_BASE_URL, OLLAMA_MODEL
+from services.backends import get_backend
+from services.generation_service import build_generation_request
+from services.metrics_service import fetch_recent_runs
+from services.ollama_client import post_json
+
+
+LAYOUTS = ["inline", "system_prefix"]
+
+
+def _load_problems(limit: int) -> List[Dict[str, Any]]:
+    problems: List[Dict[str, Any]] = []
+    seen = set()
+    for row in fetch_recent_runs(limit=1000):
+        key = (row.get("problem_number"), row.get("language"))
+        code = row.get("code_text") or ""
+        if key in seen or not code or code == "—":
+            continue
+        seen.add(key)
+        problems.append(row)
+        if len(problems) >= limit:
+            break
+    return problems
+
+
+def _measure(problem: Dict[str, Any], layout: str) -> Dict[str, float]:
+    prompt_request = build_generation_request(
+        problem_number=problem.get("problem_number") or "",
+        problem_name=problem.get("problem_name") or "",
+        difficulty=problem.get("difficulty") or "",
+        link=problem.get("problem_link") or "",
+        code=problem["code_text"],
+        language=problem.get("language") or "",
+        layout=layout,
+    )
+    backend = get_backend()
+    options = {"model": OLLAMA_MODEL, "num_predict": 1, "temperature": 0.0}
+    response = post_json(
+        backend.generate_url(OLLAMA_BASE_URL),
+        backend.build_payload(prompt_request, options, stream=False),
+        timeout_seconds=LLM_TIMEOUT_SECONDS,
+        headers=backend.request_headers(),
+    )
+    response.raise_for_status()
+    data = backend.parse_response(response.json(), {})
+    return {
+        "prompt_eval_ms": data["prompt_eval_ms"],
+        "prompt_eval_count": float(data["prompt_tokens"]),
+    }
+
+
+def _summarize(samples: List[Dict[str, float]]) -> Dict[str, float]:
+    eval_ms = [sample["prompt_eval_ms"] for sample in samples]
+    counts = [sample["prompt_eval_count"] for sample in samples]
+    return {
+        "requests": len(samples),
+        "mean_prompt_eval_ms": round(statistics.mean(eval_ms), 2) if eval_ms else 0.0,
+        "median_prompt_eval_ms": round(statistics.median(eval_ms), 2) if eval_ms else 0.0,
+        "mean_prompt_eval_count": round(statistics.mean(counts), 1) if counts else 0.0,
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmark prompt_eval time per PROMPT_LAYOUT")
+    parser.add_argument("--limit", type=int, default=10, help="Distinct problems to replay")
+    parser.add_argument("--repeats", type=int, default=1, help="Passes over the problem set per layout")
+    args = parser.parse_args()
+
+    problems = _load_problems(args.limit)
+    if not problems:
+        print("No logged runs with solution code found in llm_runs; generate a few posts first.")
+        return 1
+
+    print(f"Model: {OLLAMA_MODEL} | problems: {len(problems)} | repeats: {args.repeats}")
+    results: Dict[str, Dict[str, float]] = {}
+    for layout in LAYOUTS:
+        samples: List[Dict[str, float]] = []
+        try:
+            for _ in range(max(args.repeats, 1)):
+                for problem in problems:
+                    samples.append(_measure(problem, layout))
+        except requests.exceptions.RequestException as exc:
+            print(f"{layout}: request failed: {exc}")
+            return 1
+        results[layout] = _summarize(samples)
+
+    print(f"{'layout':<15}{'requests':>10}{'mean_ms':>12}{'median_ms':>12}{'mean_tokens':>14}")
+    for layout, summary in results.items():
+        print(
+            f"{layout:<15}{summary['requests']:>10}{summary['mean_prompt_eval_ms']:>12}"
+            f"{summary['median_prompt_eval_ms']:>12}{summary['mean_prompt_eval_count']:>14}"
+        )
+
+    baseline = results["inline"]["mean_prompt_eval_ms"]
+    if baseline > 0:
+        change = (results["system_prefix"]["mean_prompt_eval_ms"] - baseline) / baseline * 100
+        print(f"system_prefix vs inline mean prompt_eval: {change:+.1f}%")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -1,10 +1,10 @@
-"""Compatibility shim for bulk generation entrypoint.
-
-Legacy implementations are archived under archive/legacy_versions/.
-"""
-
-from current.bulk_generate import main
-
-
-if __name__ == "__main__":
-    main()
+"""Compatibility shim for bulk generation entrypoint.
+
+Legacy implementations are archived under archive/legacy_versions/.
+"""
+
+from current.bulk_generate import main
+
+
+if __name__ == "__main__":
+    main()
@@ -1,6 +1,6 @@
-"""Compatibility shim for configuration imports.
-
-Legacy implementations are archived under archive/legacy_versions/.
-"""
-
-from current.config import *  # noqa: F401,F403
+"""Compatibility shim for configuration imports.
+
+Legacy implementations are archived under archive/legacy_versions/.
+"""
+
+from current.config import *  # noqa: F401,F403
@@ -1 +1 @@
-"""Current active application modules."""
+"""Current active application modules."""
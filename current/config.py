@@ -1,25 +1,127 @@
-import os
-from dotenv import load_dotenv
-
-load_dotenv()
-
-LEETCODE_REPO_PATH = os.getenv("LEETCODE_REPO_PATH")
-
-GITHUB_REPO_URL = os.getenv("GITHUB_REPO_URL", "")
-
-# Optional legacy key. Kept for backward compatibility if Gemini is re-enabled.
-GEMINI_API_KEY = os.getenv("GEMINI_API_KEY")
-
-OLLAMA_BASE_URL = os.getenv("OLLAMA_URL", "http://localhost:11434").rstrip("/")
-OLLAMA_GENERATE_URL = os.getenv("OLLAMA_GENERATE_URL", f"{OLLAMA_BASE_URL}/api/generate")
-OLLAMA_MODEL = os.getenv("OLLAMA_MODEL", "mistral")
-
-LLM_NUM_PREDICT = int(os.getenv("LLM_NUM_PREDICT", "800"))
-LLM_TEMPERATURE = float(os.getenv("LLM_TEMPERATURE", "0.2"))
-LLM_TIMEOUT_SECONDS = int(os.getenv("LLM_TIMEOUT_SECONDS", "600"))
-PROMPT_VERSION = os.getenv("PROMPT_VERSION", "v1.0.0")
-PROMPT_STRATEGY = os.getenv("PROMPT_STRATEGY", "analysis_only_append_code_v1")
-TITLE_LETTER_COUNT = int(os.getenv("TITLE_LETTER_COUNT", "75"))
-
-if not LEETCODE_REPO_PATH:
-    raise ValueError("LEETCODE_REPO_PATH not set")
+import os
+from dotenv import load_dotenv
+
+from services.artifacts import resolve_artifacts
+
+load_dotenv()
+
+LEETCODE_REPO_PATH = os.getenv("LEETCODE_REPO_PATH")
+
+GITHUB_REPO_URL = os.getenv("GITHUB_REPO_URL", "")
+
+# Optional legacy key. Kept for backward compatibility if Gemini is re-enabled.
+GEMINI_API_KEY = os.getenv("GEMINI_API_KEY")
+
+OLLAMA_BASE_URL = os.getenv("OLLAMA_URL", "http://localhost:11434").rstrip("/")
+OLLAMA_GENERATE_URL = os.getenv("OLLAMA_GENERATE_URL", f"{OLLAMA_BASE_URL}/api/generate")
+OLLAMA_MODEL = os.getenv("OLLAMA_MODEL", "mistral")
+# Server API spoken to every endpoint: "ollama" (/api/generate) or "openai" (/v1/chat/completions,
+# e.g. a llama.cpp server or vLLM). OLLAMA_URL / OLLAMA_ENDPOINTS / OLLAMA_MODEL apply to both.
+LLM_BACKEND = os.getenv("LLM_BACKEND", "ollama").strip().lower()
+# Bearer token for OpenAI-compatible servers that require one (vLLM --api-key); unused by Ollama.
+LLM_API_KEY = os.getenv("LLM_API_KEY", "")
+# LLM_BACKEND=llama_cpp runs a GGUF model inside this process (optional llama-cpp-python), no server.
+LLAMA_CPP_MODEL_PATH = os.getenv("LLAMA_CPP_MODEL_PATH", "")
+# CPU threads used for generation; 0 keeps llama.cpp's default (half the cores).
+LLAMA_CPP_N_THREADS = int(os.getenv("LLAMA_CPP_N_THREADS", "0"))
+# Prompt tokens evaluated per batch; larger batches speed up long prompts at the cost of memory.
+LLAMA_CPP_N_BATCH = int(os.getenv("LLAMA_CPP_N_BATCH", "512"))
+LLAMA_CPP_N_CTX = int(os.getenv("LLAMA_CPP_N_CTX", "4096"))
+# Comma-separated base URLs of every Ollama server to balance across; defaults to OLLAMA_URL.
+OLLAMA_ENDPOINTS = [
+    url.strip().rstrip("/") for url in os.getenv("OLLAMA_ENDPOINTS", "").split(",") if url.strip()
+] or [OLLAMA_BASE_URL]
+OLLAMA_HEALTH_CHECK_INTERVAL_SECONDS = int(os.getenv("OLLAMA_HEALTH_CHECK_INTERVAL_SECONDS", "30"))
+OLLAMA_POOL_SIZE = int(os.getenv("OLLAMA_POOL_SIZE", "4"))
+OLLAMA_CONNECT_TIMEOUT_SECONDS = float(os.getenv("OLLAMA_CONNECT_TIMEOUT_SECONDS", "5"))
+
+LLM_NUM_PREDICT = int(os.getenv("LLM_NUM_PREDICT", "800"))
+LLM_TEMPERATURE = float(os.getenv("LLM_TEMPERATURE", "0.2"))
+LLM_TIMEOUT_SECONDS = int(os.getenv("LLM_TIMEOUT_SECONDS", "600"))
+# Ollama stops generating at any of these (comma-separated); streamed runs are also cut
+# as soon as every required section is finished.
+LLM_STOP_SEQUENCES = [
+    stop for stop in os.getenv("LLM_STOP_SEQUENCES", "## Code").split(",") if stop.strip()
+]
+LLM_EARLY_STOP_ENABLED = os.getenv("LLM_EARLY_STOP_ENABLED", "true").strip().lower() in {"1", "true", "yes"}
+# Adaptive per-request deadline: p99 history * margin, clamped to [LLM_TIMEOUT_MIN_SECONDS, LLM_TIMEOUT_SECONDS].
+LLM_TIMEOUT_MARGIN = float(os.getenv("LLM_TIMEOUT_MARGIN", "1.5"))
+LLM_TIMEOUT_MIN_SECONDS = float(os.getenv("LLM_TIMEOUT_MIN_SECONDS", "30"))
+LLM_TIMEOUT_MIN_SAMPLES = int(os.getenv("LLM_TIMEOUT_MIN_SAMPLES", "20"))
+LLM_MAX_RETRIES = int(os.getenv("LLM_MAX_RETRIES", "2"))
+LLM_RETRY_BACKOFF_SECONDS = float(os.getenv("LLM_RETRY_BACKOFF_SECONDS", "1.0"))
+LLM_RETRY_BACKOFF_MAX_SECONDS = float(os.getenv("LLM_RETRY_BACKOFF_MAX_SECONDS", "30"))
+LLM_CIRCUIT_FAILURE_THRESHOLD = int(os.getenv("LLM_CIRCUIT_FAILURE_THRESHOLD", "3"))
+LLM_CIRCUIT_RESET_SECONDS = float(os.getenv("LLM_CIRCUIT_RESET_SECONDS", "30"))
+# Keep in line with the server's OLLAMA_NUM_PARALLEL so extra requests do not just queue.
+LLM_MAX_CONCURRENCY = int(os.getenv("LLM_MAX_CONCURRENCY", "2"))
+# Best-of-N: fire this many attempts per post (capped by LLM_MAX_CONCURRENCY per endpoint) and keep
+# the first whose format_score reaches LLM_BEST_OF_MIN_FORMAT_SCORE; 1 disables it.
+LLM_BEST_OF_N = int(os.getenv("LLM_BEST_OF_N", "1"))
+LLM_BEST_OF_MIN_FORMAT_SCORE = float(os.getenv("LLM_BEST_OF_MIN_FORMAT_SCORE", "100"))
+# Hedging: when a request has no first token (unstreamed bulk requests: no reply) after this
+# percentile of the model's history, a duplicate goes to the least-loaded endpoint slot and the
+# first to finish wins; the other is cancelled.
+LLM_HEDGE_ENABLED = os.getenv("LLM_HEDGE_ENABLED", "false").strip().lower() in {"1", "true", "yes"}
+LLM_HEDGE_PERCENTILE = float(os.getenv("LLM_HEDGE_PERCENTILE", "95"))
+# Model cascade: comma-separated faster models tried in order before OLLAMA_MODEL. A post moves on
+# to the next model when its format_score is below LLM_CASCADE_MIN_FORMAT_SCORE or its title is
+# missing or longer than TITLE_LETTER_COUNT; empty disables the cascade.
+LLM_CASCADE_MODELS = [
+    model.strip() for model in os.getenv("LLM_CASCADE_MODELS", "").split(",") if model.strip()
+]
+LLM_CASCADE_MIN_FORMAT_SCORE = float(os.getenv("LLM_CASCADE_MIN_FORMAT_SCORE", "100"))
+# Section repair: a post missing a required section, or whose title is missing or over
+# TITLE_LETTER_COUNT, gets one small request per broken piece instead of a full regeneration.
+LLM_REPAIR_ENABLED = os.getenv("LLM_REPAIR_ENABLED", "true").strip().lower() in {"1", "true", "yes"}
+LLM_REPAIR_NUM_PREDICT = int(os.getenv("LLM_REPAIR_NUM_PREDICT", "200"))
+# Explanation reuse: a problem already explained in another language with the same algorithm
+# fingerprint gets a delta request for the sections that change instead of a full generation.
+LLM_REUSE_ENABLED = os.getenv("LLM_REUSE_ENABLED", "true").strip().lower() in {"1", "true", "yes"}
+LLM_REUSE_NUM_PREDICT = int(os.getenv("LLM_REUSE_NUM_PREDICT", "400"))
+# Extra artifacts generated in the same request as each post and saved next to it
+# (comma-separated, see services/artifacts.py: readme_blurb, changelog_line); empty = post only.
+# An unknown name stops startup here instead of failing every generation.
+try:
+    LLM_ARTIFACTS = resolve_artifacts([name for name in os.getenv("LLM_ARTIFACTS", "").split(",") if name.strip()])
+except ValueError as exc:
+    raise ValueError(f"LLM_ARTIFACTS: {exc}") from None
+# Ollama keep_alive values: idle timeout for normal use, pinned (negative = never unload) during bulk runs.
+LLM_KEEP_ALIVE_IDLE = os.getenv("LLM_KEEP_ALIVE_IDLE", "30m")
+LLM_KEEP_ALIVE_PINNED = os.getenv("LLM_KEEP_ALIVE_PINNED", "-1")
+# Per-request Ollama context window: estimated prompt tokens + num_predict, rounded up to the smallest
+# of these sizes (comma-separated) so the model is only reloaded when a request needs another size;
+# larger requests use a multiple of the largest. Empty leaves num_ctx to the server.
+LLM_NUM_CTX_BUCKETS = sorted(
+    int(size) for size in os.getenv("LLM_NUM_CTX_BUCKETS", "2048,4096,8192").split(",") if size.strip()
+)
+# CPU threads Ollama uses for each request (num_thread); 0 leaves it to the server.
+LLM_NUM_THREAD = int(os.getenv("LLM_NUM_THREAD", "0"))
+LLM_CACHE_ENABLED = os.getenv("LLM_CACHE_ENABLED", "true").strip().lower() in {"1", "true", "yes"}
+LLM_CACHE_TTL_SECONDS = int(os.getenv("LLM_CACHE_TTL_SECONDS", str(7 * 24 * 3600)))
+LLM_CACHE_MAX_ENTRIES = int(os.getenv("LLM_CACHE_MAX_ENTRIES", "2000"))
+LLM_CACHE_MEMORY_ENTRIES = int(os.getenv("LLM_CACHE_MEMORY_ENTRIES", "128"))
+# Refinement sessions: the model context of this many recent runs is kept in memory (least recently
+# used evicted) so follow-up edits only send the new instruction.
+REFINEMENT_SESSION_MAX_ENTRIES = int(os.getenv("REFINEMENT_SESSION_MAX_ENTRIES", "32"))
+PROMPT_VERSION = os.getenv("PROMPT_VERSION", "v1.0.0")
+PROMPT_STRATEGY = os.getenv("PROMPT_STRATEGY", "analysis_only_append_code_v1")
+# "inline" keeps the original single prompt; "system_prefix" sends the constant instructions
+# as a stable system block so Ollama can reuse the cached prefix across problems.
+PROMPT_LAYOUT = os.getenv("PROMPT_LAYOUT", "inline")
+# Strip comments/docstrings/whitespace from the code sent to the model (the post keeps the original),
+# and optionally cap the estimated prompt size by cutting the code; 0 (the default) disables the cap.
+# The cap is skipped when it would leave the code fewer than PROMPT_MIN_CODE_TOKENS.
+PROMPT_COMPACTION_ENABLED = os.getenv("PROMPT_COMPACTION_ENABLED", "true").strip().lower() in {"1", "true", "yes"}
+PROMPT_TOKEN_BUDGET = int(os.getenv("PROMPT_TOKEN_BUDGET", "0"))
+PROMPT_MIN_CODE_TOKENS = int(os.getenv("PROMPT_MIN_CODE_TOKENS", "400"))
+TITLE_LETTER_COUNT = int(os.getenv("TITLE_LETTER_COUNT", "75"))
+# Local prompt token counting before dispatch: a Hugging Face tokenizer.json matching the model
+# family (file path, or a hub repo id fetched once into the Hugging Face cache). Empty, or a
+# tokenizer that fails to load, uses the chars-per-token ratio fitted on llm_runs history.
+LLM_TOKENIZER = os.getenv("LLM_TOKENIZER", "").strip()
+# Successful runs needed before the fitted ratio replaces the 4 chars-per-token default.
+TOKEN_ESTIMATE_MIN_SAMPLES = int(os.getenv("TOKEN_ESTIMATE_MIN_SAMPLES", "20"))
+
+if not LEETCODE_REPO_PATH:
+    raise ValueError("LEETCODE_REPO_PATH not set")
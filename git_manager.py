@@ -1,6 +1,6 @@
-"""Compatibility shim for git manager imports.
-
-Legacy implementations are archived under archive/legacy_versions/.
-"""
-
-from current.git_manager import *  # noqa: F401,F403
+"""Compatibility shim for git manager imports.
+
+Legacy implementations are archived under archive/legacy_versions/.
+"""
+
+from current.git_manager import *  # noqa: F401,F403
@@ -1,6 +1,6 @@
-"""Compatibility shim for LLM generator imports.
-
-Legacy implementations are archived under archive/legacy_versions/.
-"""
-
-from current.llm_generator import *  # noqa: F401,F403
+"""Compatibility shim for LLM generator imports.
+
+Legacy implementations are archived under archive/legacy_versions/.
+"""
+
+from current.llm_generator import *  # noqa: F401,F403
@@ -1 +1 @@
-"""Service layer for generation, metrics, and repo operations."""
+"""Service layer for generation, metrics, and repo operations."""
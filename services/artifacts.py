@@ -0,0 +1,131 @@
+"""Named artifacts generated in the same request as the post (README blurb, changelog line).
+
+Asking for them separately would evaluate the problem and code context once per
+artifact. Instead the generation prompt asks for them after the post: as
+``## Artifact: <name>`` sections in markdown mode, or as extra fields of the
+output schema under PROMPT_STRATEGY=json_schema_v1. ``split_artifacts`` takes
+them back out of the response before the post is composed, and
+``save_artifacts`` writes each one to its own file next to the post.
+"""
+
+import json
+import os
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from services.markdown_sections import parse_post
+
+
+_HEADING_PREFIX = "artifact:"
+
+# name -> what the model is asked for, the file extension and the extra num_predict it needs.
+ARTIFACTS: Dict[str, Dict[str, Any]] = {
+    "readme_blurb": {
+        "description": (
+            "two or three sentences for the repository README summarizing the problem and the solution's "
+            "technique and complexity; plain markdown, no headings, no code"
+        ),
+        "extension": ".md",
+        "num_predict": 120,
+    },
+    "changelog_line": {
+        "description": (
+            'one changelog line in the form "Add <number>. <name> (<language>): <technique>, <time complexity>"'
+        ),
+        "extension": ".txt",
+        "num_predict": 40,
+    },
+}
+
+
+def resolve_artifacts(names: Optional[Sequence[str]]) -> List[str]:
+    """Validated, de-duplicated artifact names in request order."""
+    resolved: List[str] = []
+    for name in names or []:
+        key = name.strip().lower()
+        if key not in ARTIFACTS:
+            raise ValueError(f"Unknown artifact {key!r}; expected one of {', '.join(sorted(ARTIFACTS))}")
+        if key not in resolved:
+            resolved.append(key)
+    return resolved
+
+
+def artifacts_num_predict(names: Sequence[str]) -> int:
+    return sum(ARTIFACTS[name]["num_predict"] for name in names)
+
+
+def build_artifact_instructions(names: Sequence[str], json_mode: bool) -> str:
+    if not names:
+        return ""
+    if json_mode:
+        fields = "\n".join(f'- "{name}": {ARTIFACTS[name]["description"]}.' for name in names)
+        return f"""
+5. Also include these string fields in the same JSON object:
+{fields}
+"""
+    sections = "\n".join(f"## Artifact: {name}\n<{ARTIFACTS[name]['description']}>" for name in names)
+    return f"""
+5. After the Space Complexity section, add these extra sections in this order, with the headings exactly
+as written. They are removed from the post and saved separately:
+
+{sections}
+"""
+
+
+def artifact_schema(schema: Dict[str, Any], names: Sequence[str]) -> Dict[str, Any]:
+    """``schema`` with a required string field per artifact."""
+    if not names:
+        return schema
+    return {
+        **schema,
+        "properties": {**schema["properties"], **{name: {"type": "string"} for name in names}},
+        "required": list(schema["required"]) + list(names),
+    }
+
+
+def split_artifacts(text: str, names: Sequence[str], json_mode: bool) -> Tuple[str, Dict[str, str]]:
+    """Return the response without its artifacts, and the artifacts found by name.
+
+    JSON responses are returned unchanged: the post renderer ignores the extra
+    fields. Missing or empty artifacts are left out of the result.
+    """
+    if not names:
+        return text, {}
+    if json_mode:
+        try:
+            data = json.loads(text or "")
+        except ValueError:
+            return text, {}
+        if not isinstance(data, dict):
+            return text, {}
+        return text, {name: str(data[name]).strip() for name in names if str(data.get(name) or "").strip()}
+
+    post = parse_post(text)
+    content, starts = post["text"], post["section_starts"]
+    found: Dict[str, str] = {}
+    kept: List[str] = []
+    cursor = 0
+    for index, (offset, key) in enumerate(starts):
+        if not key.startswith(_HEADING_PREFIX):
+            continue
+        end = starts[index + 1][0] if index + 1 < len(starts) else len(content)
+        line_end = content.find("\n", offset, end)
+        name = key[len(_HEADING_PREFIX):].strip().replace(" ", "_")
+        body = content[line_end + 1:end].strip() if line_end != -1 else ""
+        if name in names and body:
+            found[name] = body
+        kept.append(content[cursor:offset])
+        cursor = end
+    kept.append(content[cursor:])
+    return "".join(kept).strip(), found
+
+
+def save_artifacts(post_path: str, artifacts: Dict[str, str]) -> Dict[str, str]:
+    """Write each artifact next to ``post_path`` as ``<post name>_<artifact><ext>``; returns the paths."""
+    stem = os.path.splitext(post_path)[0]
+    paths: Dict[str, str] = {}
+    for name, text in artifacts.items():
+        path = f"{stem}_{name}{ARTIFACTS[name]['extension']}"
+        with open(path, "w", encoding="utf-8") as handle:
+            handle.write(text.rstrip() + "\n")
+        paths[name] = path
+    return paths
@@ -0,0 +1,83 @@
+"""Pluggable LLM server backends selected with LLM_BACKEND.
+
+A backend is a module that turns the generation request into the server's
+payload and parses the server's reply into one normalized ``response_data``
+dict, so routing, retries, streaming, caching and metrics never depend on the
+wire format. The ``llama_cpp`` backend has no server: it runs the model in
+this process and hands back a response-like object from ``complete``. Durations are normalized to milliseconds and token counts to
+``prompt_tokens`` / ``response_tokens``; a field the server does not report
+stays 0 unless it could be measured locally. Ollama also passes its
+``context`` token ids through for refinement sessions.
+
+Besides ``system`` and ``prompt``, a prompt request may carry ``history``
+(earlier user/assistant turns) and ``context`` (token ids from the previous
+reply); each backend sends whichever its server can reuse.
+"""
+
+from typing import Any, Dict, Optional, Protocol, Tuple
+
+from config import LLM_BACKEND
+
+
+class LLMBackend(Protocol):
+    NAME: str
+    # Whether the server understands Ollama's keep_alive (model residency control).
+    SUPPORTS_KEEP_ALIVE: bool
+    # Whether num_ctx / num_thread can be chosen per request (Ollama options).
+    SUPPORTS_NUM_CTX: bool
+    # In-process backends run the model themselves: ``complete`` replaces the HTTP post.
+    IN_PROCESS: bool
+
+    def generate_url(self, base_url: str) -> str: ...
+
+    def health_url(self, base_url: str) -> str: ...
+
+    def request_headers(self) -> Dict[str, str]: ...
+
+    def build_payload(
+        self, prompt_request: Dict[str, Any], options: Dict[str, Any], stream: bool
+    ) -> Dict[str, Any]: ...
+
+    # Only defined when IN_PROCESS.
+    def complete(self, payload: Dict[str, Any], timeout_seconds: float, stream: bool) -> Any: ...
+
+    def parse_response(self, body: Dict[str, Any], local_timing: Dict[str, float]) -> Dict[str, Any]: ...
+
+    def parse_stream_line(self, line: bytes, state: Dict[str, Any]) -> Tuple[str, bool]: ...
+
+    def finish_stream(
+        self, state: Dict[str, Any], text: str, local_timing: Dict[str, float]
+    ) -> Dict[str, Any]: ...
+
+
+def normalized_response(
+    text: str,
+    done_reason: str = "",
+    prompt_tokens: int = 0,
+    response_tokens: int = 0,
+    total_duration_ms: float = 0.0,
+    load_duration_ms: float = 0.0,
+    prompt_eval_ms: float = 0.0,
+    generation_ms: float = 0.0,
+) -> Dict[str, Any]:
+    return {
+        "response": text or "",
+        "done_reason": str(done_reason or ""),
+        "prompt_tokens": int(prompt_tokens or 0),
+        "response_tokens": int(response_tokens or 0),
+        "total_duration_ms": float(total_duration_ms or 0.0),
+        "load_duration_ms": float(load_duration_ms or 0.0),
+        "prompt_eval_ms": float(prompt_eval_ms or 0.0),
+        "generation_ms": float(generation_ms or 0.0),
+    }
+
+
+def get_backend(name: Optional[str] = None) -> LLMBackend:
+    """Return the backend module for ``name`` (default LLM_BACKEND)."""
+    from services.backends import llama_cpp, ollama, openai_compatible
+
+    backends = {ollama.NAME: ollama, openai_compatible.NAME: openai_compatible, llama_cpp.NAME: llama_cpp}
+    key = (name or LLM_BACKEND).strip().lower()
+    if key not in backends:
+        raise ValueError(f"Unknown LLM_BACKEND {key!r}; expected one of {', '.join(sorted(backends))}")
+    return backends[key]
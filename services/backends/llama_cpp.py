@@ -0,0 +1,245 @@
+"""In-process GGUF backend (optional ``llama-cpp-python``), for CPU-only hosts without a server.
+
+The model is loaded once per process from LLAMA_CPP_MODEL_PATH with
+LLAMA_CPP_N_THREADS, LLAMA_CPP_N_BATCH and LLAMA_CPP_N_CTX, and generation is
+serialized on it (one context, one request at a time). ``complete`` returns a
+response-like object so the generation path reads it exactly like an HTTP
+reply: streams come out as OpenAI-style SSE lines, which keeps early stop,
+deadlines and cancellation unchanged. Timings are measured around the model
+call; the request that loads the model reports the load as ``load_duration_ms``.
+"""
+
+import json
+import os
+import threading
+import time
+from typing import Any, Dict, Iterator, Optional, Tuple
+
+import requests
+
+from config import (
+    LLAMA_CPP_MODEL_PATH,
+    LLAMA_CPP_N_BATCH,
+    LLAMA_CPP_N_CTX,
+    LLAMA_CPP_N_THREADS,
+)
+from services.backends import openai_compatible
+
+
+NAME = "llama_cpp"
+SUPPORTS_KEEP_ALIVE = False
+# Set once at load from LLAMA_CPP_N_CTX / LLAMA_CPP_N_THREADS.
+SUPPORTS_NUM_CTX = False
+IN_PROCESS = True
+
+# How often a request waiting for the model re-checks its deadline and cancellation.
+_WAIT_POLL_SECONDS = 0.1
+
+_model_lock = threading.Lock()
+_generation_lock = threading.Lock()
+_model_state: Dict[str, Any] = {}
+
+
+def generate_url(base_url: str) -> str:
+    # There is no server; the model file stands in as the single endpoint.
+    return f"llama_cpp://{os.path.basename(LLAMA_CPP_MODEL_PATH) or 'unconfigured'}"
+
+
+def health_url(base_url: str) -> str:
+    return ""
+
+
+def request_headers() -> Dict[str, str]:
+    return {}
+
+
+def _load_model() -> Tuple[Any, float]:
+    """Return the shared model and the load time in ms if this call loaded it (else 0)."""
+    with _model_lock:
+        if "model" in _model_state:
+            return _model_state["model"], 0.0
+        if not LLAMA_CPP_MODEL_PATH or not os.path.isfile(LLAMA_CPP_MODEL_PATH):
+            raise RuntimeError(f"LLAMA_CPP_MODEL_PATH does not point to a GGUF file: {LLAMA_CPP_MODEL_PATH!r}")
+        try:
+            from llama_cpp import Llama
+        except ImportError as exc:
+            raise RuntimeError("LLM_BACKEND=llama_cpp requires the llama-cpp-python package") from exc
+
+        started_at = time.perf_counter()
+        model = Llama(
+            model_path=LLAMA_CPP_MODEL_PATH,
+            n_ctx=LLAMA_CPP_N_CTX,
+            n_batch=LLAMA_CPP_N_BATCH,
+            n_threads=LLAMA_CPP_N_THREADS or None,
+            n_threads_batch=LLAMA_CPP_N_THREADS or None,
+            verbose=False,
+        )
+        load_ms = (time.perf_counter() - started_at) * 1000
+        _model_state["model"] = model
+        _model_state["load_ms"] = load_ms
+        return model, load_ms
+
+
+def load_model() -> bool:
+    """Load the model now (warm-up); False when it cannot be loaded."""
+    try:
+        _load_model()
+    except Exception:
+        return False
+    return True
+
+
+def model_status() -> Dict[str, str]:
+    """Health in the shape of ``system_service.check_ollama_health``."""
+    model_name = os.path.basename(LLAMA_CPP_MODEL_PATH)
+    with _model_lock:
+        loaded = "model" in _model_state
+    if loaded:
+        message = f"In-process model loaded ({_model_state['load_ms'] / 1000:.1f}s load)"
+    elif os.path.isfile(LLAMA_CPP_MODEL_PATH):
+        message = "In-process model not loaded yet"
+    else:
+        message = "LLAMA_CPP_MODEL_PATH is not set to a GGUF file"
+    return {
+        "reachable": str(loaded or os.path.isfile(LLAMA_CPP_MODEL_PATH)),
+        "message": message,
+        "model_loaded": str(loaded),
+        "models": model_name,
+    }
+
+
+def build_payload(prompt_request: Dict[str, Any], options: Dict[str, Any], stream: bool) -> Dict[str, Any]:
+    # Same messages as the OpenAI-compatible backend; the model's own chat template is applied in-process.
+    messages = openai_compatible.build_payload(prompt_request, options, stream=False)["messages"]
+    payload: Dict[str, Any] = {
+        "messages": messages,
+        "max_tokens": options["num_predict"],
+        "temperature": options["temperature"],
+    }
+    if options.get("json_schema"):
+        payload["response_format"] = {"type": "json_object", "schema": options["json_schema"]}
+    elif options.get("stop"):
+        payload["stop"] = options["stop"]
+    return payload
+
+
+class _Completion:
+    """Response-like wrapper around one in-process chat completion.
+
+    ``close`` may be called from another thread (hedging); it is noticed before
+    the model is acquired and between generated tokens.
+    """
+
+    status_code = 200
+
+    def __init__(self, model: Any, load_ms: float, payload: Dict[str, Any], timeout_seconds: float) -> None:
+        self._model = model
+        self._load_ms = load_ms
+        self._payload = payload
+        self._deadline_at = time.perf_counter() + timeout_seconds
+        self._closed = threading.Event()
+        self._lines: Optional[Iterator[str]] = None
+
+    def __enter__(self) -> "_Completion":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    def close(self) -> None:
+        self._closed.set()
+        if self._lines is not None:
+            try:
+                # Releases the model right away when the reader stopped early (early stop).
+                self._lines.close()
+            except ValueError:
+                # Still running in another thread; it stops at the next token.
+                pass
+
+    def _acquire(self) -> bool:
+        while not _generation_lock.acquire(timeout=_WAIT_POLL_SECONDS):
+            if self._closed.is_set():
+                return False
+            if time.perf_counter() > self._deadline_at:
+                raise requests.exceptions.ReadTimeout("Timed out waiting for the in-process model")
+        if self._closed.is_set():
+            _generation_lock.release()
+            return False
+        return True
+
+    def json(self) -> Dict[str, Any]:
+        if not self._acquire():
+            return {}
+        try:
+            started_at = time.perf_counter()
+            body = self._model.create_chat_completion(**self._payload, stream=False)
+            total_ms = (time.perf_counter() - started_at) * 1000
+        finally:
+            _generation_lock.release()
+        # Without streaming the prompt and generation phases cannot be told apart.
+        body["timings"] = {"predicted_ms": total_ms, "load_ms": self._load_ms}
+        return body
+
+    def iter_lines(self) -> Iterator[str]:
+        self._lines = self._generate_lines()
+        return self._lines
+
+    def _generate_lines(self) -> Iterator[str]:
+        if not self._acquire():
+            return
+        try:
+            started_at = time.perf_counter()
+            first_token_at: Optional[float] = None
+            completion_tokens = 0
+            for chunk in self._model.create_chat_completion(**self._payload, stream=True):
+                if self._closed.is_set():
+                    # Leaving the generator stops generation after the current token.
+                    return
+                if first_token_at is None:
+                    first_token_at = time.perf_counter()
+                if (chunk.get("choices") or [{}])[0].get("delta", {}).get("content"):
+                    completion_tokens += 1
+                yield "data: " + json.dumps(chunk)
+
+            finished_at = time.perf_counter()
+            first_token_at = first_token_at or finished_at
+            # The context holds the prompt plus every generated token after the call.
+            prompt_tokens = max(int(getattr(self._model, "n_tokens", 0) or 0) - completion_tokens, 0)
+            yield "data: " + json.dumps(
+                {
+                    "usage": {"prompt_tokens": prompt_tokens, "completion_tokens": completion_tokens},
+                    "timings": {
+                        "prompt_ms": (first_token_at - started_at) * 1000,
+                        "predicted_ms": (finished_at - first_token_at) * 1000,
+                        "load_ms": self._load_ms,
+                    },
+                }
+            )
+            yield "data: [DONE]"
+        finally:
+            _generation_lock.release()
+
+
+def complete(payload: Dict[str, Any], timeout_seconds: float, stream: bool) -> _Completion:
+    """Load the model if needed and return the pending completion; generation starts when the body is read."""
+    model, load_ms = _load_model()
+    return _Completion(model, load_ms, payload, timeout_seconds)
+
+
+def _with_load_time(response_data: Dict[str, Any], timings: Dict[str, Any]) -> Dict[str, Any]:
+    response_data["load_duration_ms"] = float(timings.get("load_ms") or 0.0)
+    return response_data
+
+
+def parse_response(body: Dict[str, Any], local_timing: Dict[str, float]) -> Dict[str, Any]:
+    return _with_load_time(openai_compatible.parse_response(body, local_timing), body.get("timings") or {})
+
+
+def parse_stream_line(line: bytes, state: Dict[str, Any]) -> Tuple[str, bool]:
+    return openai_compatible.parse_stream_line(line, state)
+
+
+def finish_stream(state: Dict[str, Any], text: str, local_timing: Dict[str, float]) -> Dict[str, Any]:
+    return _with_load_time(
+        openai_compatible.finish_stream(state, text, local_timing), state.get("timings") or {}
+    )
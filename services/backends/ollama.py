@@ -0,0 +1,105 @@
+"""Ollama ``/api/generate`` backend (NDJSON streaming, durations in nanoseconds).
+
+Follow-up turns send Ollama's ``context`` token ids from the previous reply,
+so only the new prompt is evaluated; without them the earlier turns are
+replayed as plain text.
+"""
+
+import json
+from typing import Any, Dict, Tuple
+
+from config import OLLAMA_BASE_URL, OLLAMA_GENERATE_URL
+from services.backends import normalized_response
+
+
+NAME = "ollama"
+SUPPORTS_KEEP_ALIVE = True
+SUPPORTS_NUM_CTX = True
+IN_PROCESS = False
+
+
+def generate_url(base_url: str) -> str:
+    # Keep honouring an explicit OLLAMA_GENERATE_URL for the default server.
+    if base_url == OLLAMA_BASE_URL:
+        return OLLAMA_GENERATE_URL
+    return f"{base_url}/api/generate"
+
+
+def health_url(base_url: str) -> str:
+    return f"{base_url}/api/tags"
+
+
+def request_headers() -> Dict[str, str]:
+    return {}
+
+
+def build_payload(prompt_request: Dict[str, Any], options: Dict[str, Any], stream: bool) -> Dict[str, Any]:
+    ollama_options: Dict[str, Any] = {
+        "num_predict": options["num_predict"],
+        "temperature": options["temperature"],
+    }
+    for name in ("num_ctx", "num_thread"):
+        if options.get(name):
+            ollama_options[name] = options[name]
+    payload: Dict[str, Any] = {
+        "model": options["model"],
+        "prompt": prompt_request["prompt"],
+        "stream": stream,
+        "options": ollama_options,
+    }
+    if options.get("keep_alive") is not None:
+        payload["keep_alive"] = options["keep_alive"]
+    if prompt_request.get("context"):
+        # The system block and earlier turns are already part of the context.
+        payload["context"] = prompt_request["context"]
+    else:
+        if prompt_request.get("history"):
+            turns = [turn["content"] for turn in prompt_request["history"]]
+            payload["prompt"] = "\n\n".join(turns + [prompt_request["prompt"]])
+        if prompt_request.get("system"):
+            payload["system"] = prompt_request["system"]
+    if options.get("json_schema"):
+        payload["format"] = options["json_schema"]
+    elif options.get("stop"):
+        ollama_options["stop"] = options["stop"]
+    return payload
+
+
+def _ns_to_ms(value: Any) -> float:
+    try:
+        return float(value or 0) / 1_000_000
+    except (TypeError, ValueError):
+        return 0.0
+
+
+def parse_response(body: Dict[str, Any], local_timing: Dict[str, float]) -> Dict[str, Any]:
+    # Ollama reports every field itself; local timing only fills a missing total.
+    response_data = normalized_response(
+        text=body.get("response", ""),
+        done_reason=body.get("done_reason", ""),
+        prompt_tokens=body.get("prompt_eval_count") or 0,
+        response_tokens=body.get("eval_count") or 0,
+        total_duration_ms=_ns_to_ms(body.get("total_duration")) or local_timing.get("total_ms", 0.0),
+        load_duration_ms=_ns_to_ms(body.get("load_duration")),
+        prompt_eval_ms=_ns_to_ms(body.get("prompt_eval_duration")),
+        generation_ms=_ns_to_ms(body.get("eval_duration")),
+    )
+    if body.get("context"):
+        response_data["context"] = body["context"]
+    return response_data
+
+
+def parse_stream_line(line: bytes, state: Dict[str, Any]) -> Tuple[str, bool]:
+    chunk = json.loads(line)
+    if chunk.get("error"):
+        raise RuntimeError(chunk["error"])
+    if chunk.get("done"):
+        state["final"] = chunk
+        return chunk.get("response", ""), True
+    return chunk.get("response", ""), False
+
+
+def finish_stream(state: Dict[str, Any], text: str, local_timing: Dict[str, float]) -> Dict[str, Any]:
+    response_data = parse_response(state.get("final", {}), local_timing)
+    response_data["response"] = text
+    return response_data
@@ -0,0 +1,133 @@
+"""OpenAI-compatible ``/v1/chat/completions`` backend (llama.cpp server, vLLM).
+
+Token counts come from ``usage`` (streams ask for it with
+``stream_options.include_usage``). llama.cpp also returns ``timings`` with
+prompt and generation milliseconds; servers without it, such as vLLM, get
+durations measured locally, where generation time is counted from the first
+token when streaming and equals the whole request otherwise.
+"""
+
+import json
+from typing import Any, Dict, List, Tuple
+
+from config import LLM_API_KEY
+from services.backends import normalized_response
+
+
+NAME = "openai"
+SUPPORTS_KEEP_ALIVE = False
+# The context size and threads are fixed when the server starts (llama-server -c / -t).
+SUPPORTS_NUM_CTX = False
+IN_PROCESS = False
+
+
+def generate_url(base_url: str) -> str:
+    return f"{base_url}/v1/chat/completions"
+
+
+def health_url(base_url: str) -> str:
+    return f"{base_url}/v1/models"
+
+
+def request_headers() -> Dict[str, str]:
+    return {"Authorization": f"Bearer {LLM_API_KEY}"} if LLM_API_KEY else {}
+
+
+def build_payload(prompt_request: Dict[str, Any], options: Dict[str, Any], stream: bool) -> Dict[str, Any]:
+    messages: List[Dict[str, str]] = []
+    if prompt_request.get("system"):
+        messages.append({"role": "system", "content": prompt_request["system"]})
+    # Earlier turns are resent; servers with prompt caching (llama.cpp) reuse their KV state.
+    messages.extend({"role": turn["role"], "content": turn["content"]} for turn in prompt_request.get("history", []))
+    messages.append({"role": "user", "content": prompt_request["prompt"]})
+
+    payload: Dict[str, Any] = {
+        "model": options["model"],
+        "messages": messages,
+        "max_tokens": options["num_predict"],
+        "temperature": options["temperature"],
+        "stream": stream,
+    }
+    if stream:
+        payload["stream_options"] = {"include_usage": True}
+    if options.get("json_schema"):
+        payload["response_format"] = {
+            "type": "json_schema",
+            "json_schema": {"name": "solution_post", "schema": options["json_schema"]},
+        }
+    elif options.get("stop"):
+        payload["stop"] = options["stop"]
+    return payload
+
+
+def _from_usage_and_timings(
+    text: str,
+    finish_reason: str,
+    usage: Dict[str, Any],
+    timings: Dict[str, Any],
+    local_timing: Dict[str, float],
+) -> Dict[str, Any]:
+    prompt_ms = float(timings.get("prompt_ms") or 0.0)
+    generation_ms = float(timings.get("predicted_ms") or 0.0)
+    total_ms = local_timing.get("total_ms", 0.0)
+    if not generation_ms:
+        generation_ms = local_timing.get("generation_ms", 0.0)
+    return normalized_response(
+        text=text,
+        done_reason=finish_reason,
+        prompt_tokens=usage.get("prompt_tokens") or timings.get("prompt_n") or 0,
+        # Without usage, a stream still gives roughly one token per chunk.
+        response_tokens=(
+            usage.get("completion_tokens") or timings.get("predicted_n") or int(local_timing.get("chunks", 0))
+        ),
+        total_duration_ms=total_ms,
+        prompt_eval_ms=prompt_ms,
+        generation_ms=generation_ms,
+    )
+
+
+def parse_response(body: Dict[str, Any], local_timing: Dict[str, float]) -> Dict[str, Any]:
+    choice = (body.get("choices") or [{}])[0]
+    return _from_usage_and_timings(
+        text=(choice.get("message") or {}).get("content") or "",
+        finish_reason=choice.get("finish_reason") or "",
+        usage=body.get("usage") or {},
+        timings=body.get("timings") or {},
+        local_timing=local_timing,
+    )
+
+
+def parse_stream_line(line: bytes, state: Dict[str, Any]) -> Tuple[str, bool]:
+    text = line.decode("utf-8") if isinstance(line, bytes) else line
+    if not text.startswith("data:"):
+        # SSE comments and keep-alive lines carry no data.
+        return "", False
+    data = text[len("data:"):].strip()
+    if data == "[DONE]":
+        return "", True
+
+    chunk = json.loads(data)
+    if chunk.get("error"):
+        error = chunk["error"]
+        raise RuntimeError(error.get("message", error) if isinstance(error, dict) else error)
+    if chunk.get("usage"):
+        state["usage"] = chunk["usage"]
+    if chunk.get("timings"):
+        state["timings"] = chunk["timings"]
+
+    piece = ""
+    for choice in chunk.get("choices") or []:
+        piece += (choice.get("delta") or {}).get("content") or ""
+        if choice.get("finish_reason"):
+            state["finish_reason"] = choice["finish_reason"]
+    return piece, False
+
+
+def finish_stream(state: Dict[str, Any], text: str, local_timing: Dict[str, float]) -> Dict[str, Any]:
+    return _from_usage_and_timings(
+        text=text,
+        finish_reason=state.get("finish_reason", ""),
+        usage=state.get("usage") or {},
+        timings=state.get("timings") or {},
+        local_timing=local_timing,
+    )
@@ -0,0 +1,94 @@
+"""Per-endpoint circuit breaker for Ollama requests.
+
+After LLM_CIRCUIT_FAILURE_THRESHOLD consecutive retryable failures an endpoint
+is opened and requests to it fail fast. Once LLM_CIRCUIT_RESET_SECONDS have
+passed, a single probe request is let through (half-open); its result closes
+the breaker again or re-opens it for another cooldown.
+"""
+
+import threading
+import time
+from typing import Any, Dict
+
+from config import LLM_CIRCUIT_FAILURE_THRESHOLD, LLM_CIRCUIT_RESET_SECONDS
+
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+_lock = threading.Lock()
+_breakers: Dict[str, Dict[str, Any]] = {}
+
+
+def _breaker(key: str) -> Dict[str, Any]:
+    if key not in _breakers:
+        _breakers[key] = {
+            "state": CLOSED,
+            "consecutive_failures": 0,
+            "opened_at": 0.0,
+            "probe_in_flight": False,
+        }
+    return _breakers[key]
+
+
+def is_open(key: str) -> bool:
+    """True while the endpoint is cooling down; does not change breaker state."""
+    with _lock:
+        breaker = _breaker(key)
+        if breaker["state"] == OPEN:
+            return time.monotonic() - breaker["opened_at"] < LLM_CIRCUIT_RESET_SECONDS
+        if breaker["state"] == HALF_OPEN:
+            return breaker["probe_in_flight"]
+        return False
+
+
+def allow_request(key: str) -> bool:
+    with _lock:
+        breaker = _breaker(key)
+        if breaker["state"] == CLOSED:
+            return True
+        if breaker["state"] == OPEN:
+            if time.monotonic() - breaker["opened_at"] < LLM_CIRCUIT_RESET_SECONDS:
+                return False
+            breaker["state"] = HALF_OPEN
+            breaker["probe_in_flight"] = False
+        if breaker["probe_in_flight"]:
+            return False
+        breaker["probe_in_flight"] = True
+        return True
+
+
+def record_success(key: str) -> None:
+    with _lock:
+        breaker = _breaker(key)
+        breaker["state"] = CLOSED
+        breaker["consecutive_failures"] = 0
+        breaker["probe_in_flight"] = False
+
+
+def record_failure(key: str) -> None:
+    with _lock:
+        breaker = _breaker(key)
+        breaker["consecutive_failures"] += 1
+        breaker["probe_in_flight"] = False
+        if breaker["state"] == HALF_OPEN or breaker["consecutive_failures"] >= LLM_CIRCUIT_FAILURE_THRESHOLD:
+            breaker["state"] = OPEN
+            breaker["opened_at"] = time.monotonic()
+
+
+def get_breaker_states() -> Dict[str, Dict[str, Any]]:
+    now = time.monotonic()
+    with _lock:
+        return {
+            key: {
+                "state": breaker["state"],
+                "consecutive_failures": breaker["consecutive_failures"],
+                "seconds_until_probe": (
+                    round(max(LLM_CIRCUIT_RESET_SECONDS - (now - breaker["opened_at"]), 0.0), 1)
+                    if breaker["state"] == OPEN
+                    else 0.0
+                ),
+            }
+            for key, breaker in _breakers.items()
+        }
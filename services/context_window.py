@@ -0,0 +1,67 @@
+"""Per-request ``num_ctx`` and ``num_thread`` for Ollama.
+
+Without ``num_ctx`` Ollama allocates its default context for every request,
+however small the prompt. Each request instead gets the smallest
+LLM_NUM_CTX_BUCKETS size that holds its estimated prompt tokens (plus the
+context ids of a refinement conversation) and its ``num_predict``. Ollama
+reloads the model whenever ``num_ctx`` changes, so sizes are rounded to a few
+buckets rather than fitted exactly. For the same reason the keep-alive pings
+in ``services.model_residency`` send the size the model was last loaded with
+(``resident_options``) instead of none, which would reload it at the default.
+"""
+
+import sqlite3
+import threading
+from typing import Any, Dict
+
+from config import LLM_NUM_CTX_BUCKETS, LLM_NUM_PREDICT, LLM_NUM_THREAD
+from services.metrics_service import fetch_common_num_ctx
+
+
+_last_num_ctx: Dict[str, int] = {}
+_last_lock = threading.Lock()
+
+
+def bucket_num_ctx(needed_tokens: int) -> int:
+    """Smallest configured size holding ``needed_tokens`` (a multiple of the largest past it); 0 = unset."""
+    if not LLM_NUM_CTX_BUCKETS:
+        return 0
+    for size in LLM_NUM_CTX_BUCKETS:
+        if needed_tokens <= size:
+            return size
+    largest = LLM_NUM_CTX_BUCKETS[-1]
+    return -(-needed_tokens // largest) * largest
+
+
+def request_options(prompt_request: Dict[str, Any]) -> Dict[str, int]:
+    """``num_ctx`` and ``num_thread`` for ``prompt_request``; 0 leaves a value to the server."""
+    needed_tokens = (
+        int(prompt_request.get("estimated_prompt_tokens") or 0)
+        + len(prompt_request.get("context") or [])
+        + int(prompt_request.get("num_predict") or LLM_NUM_PREDICT)
+    )
+    return {"num_ctx": bucket_num_ctx(needed_tokens), "num_thread": max(LLM_NUM_THREAD, 0)}
+
+
+def remember_num_ctx(model: str, num_ctx: int) -> None:
+    """Record the size ``model`` is about to be loaded with."""
+    if num_ctx:
+        with _last_lock:
+            _last_num_ctx[model] = num_ctx
+
+
+def resident_options(model: str) -> Dict[str, int]:
+    """Options for a request that only loads ``model``, matching what the next real request will send.
+
+    The last size sent from this process wins; a fresh process uses the most
+    common size in the run history, then the smallest bucket.
+    """
+    with _last_lock:
+        num_ctx = _last_num_ctx.get(model, 0)
+    if not num_ctx and LLM_NUM_CTX_BUCKETS:
+        try:
+            num_ctx = fetch_common_num_ctx(model)
+        except sqlite3.Error:
+            num_ctx = 0
+        num_ctx = num_ctx or LLM_NUM_CTX_BUCKETS[0]
+    return {"num_ctx": num_ctx, "num_thread": max(LLM_NUM_THREAD, 0)}
@@ -0,0 +1,215 @@
+"""Least-outstanding-requests routing across several LLM servers.
+
+Each request goes to the healthy endpoint with the lowest
+``(outstanding + 1) / tokens_per_sec`` score, where throughput comes from
+recent ``llm_runs`` history and is updated as runs finish. Endpoints that fail
+the backend's health check (``/api/tags`` or ``/v1/models``), or refuse a
+connection, are ejected until the next successful health check.
+"""
+
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, List, Optional
+
+import requests
+
+from config import OLLAMA_ENDPOINTS, OLLAMA_HEALTH_CHECK_INTERVAL_SECONDS
+from services.backends import get_backend
+from services.circuit_breaker import get_breaker_states, is_open
+from services.metrics_service import fetch_endpoint_throughput
+from services.ollama_client import get
+
+
+# Weight of the newest run when folding it into an endpoint's throughput estimate.
+_THROUGHPUT_SMOOTHING = 0.3
+
+_lock = threading.Lock()
+_endpoints: Dict[str, Dict[str, Any]] = {}
+_last_health_check = 0.0
+_health_check_running = False
+_throughput_loaded = False
+
+
+def _state() -> Dict[str, Dict[str, Any]]:
+    if not _endpoints:
+        backend = get_backend()
+        # An in-process model is one endpoint whatever OLLAMA_ENDPOINTS lists.
+        base_urls = [backend.generate_url("")] if backend.IN_PROCESS else OLLAMA_ENDPOINTS
+        for base_url in base_urls:
+            _endpoints[base_url] = {
+                "base_url": base_url,
+                "generate_url": backend.generate_url(base_url),
+                "outstanding": 0,
+                "healthy": True,
+                "tokens_per_sec": 0.0,
+                "last_error": "",
+            }
+    return _endpoints
+
+
+def get_generate_urls() -> List[str]:
+    with _lock:
+        return [endpoint["generate_url"] for endpoint in _state().values()]
+
+
+def _load_throughput_history() -> None:
+    global _throughput_loaded
+    with _lock:
+        if _throughput_loaded:
+            return
+        _throughput_loaded = True
+
+    try:
+        history = fetch_endpoint_throughput()
+    except Exception:
+        return
+
+    with _lock:
+        for base_url, endpoint in _state().items():
+            if history.get(base_url, 0.0) > 0 and endpoint["tokens_per_sec"] <= 0:
+                endpoint["tokens_per_sec"] = history[base_url]
+
+
+def refresh_endpoint_health() -> Dict[str, bool]:
+    """Probe every endpoint's health URL and eject the ones that fail."""
+    global _last_health_check
+    backend = get_backend()
+    with _lock:
+        base_urls = list(_state().keys())
+
+    results: Dict[str, bool] = {}
+    for base_url in base_urls:
+        error = ""
+        health_url = backend.health_url(base_url)
+        try:
+            response = get(health_url, timeout_seconds=3, headers=backend.request_headers())
+            healthy = response.status_code == 200
+            if not healthy:
+                error = f"{health_url} returned {response.status_code}"
+        except requests.exceptions.RequestException as exc:
+            healthy = False
+            error = str(exc)
+        results[base_url] = healthy
+        with _lock:
+            _endpoints[base_url]["healthy"] = healthy
+            _endpoints[base_url]["last_error"] = error
+
+    with _lock:
+        _last_health_check = time.monotonic()
+    return results
+
+
+def refresh_endpoint_health_if_stale() -> Optional[Dict[str, bool]]:
+    """``refresh_endpoint_health`` unless the last probe is under OLLAMA_HEALTH_CHECK_INTERVAL_SECONDS old.
+
+    For views redrawn on every interaction; returns None when the probe was skipped.
+    """
+    with _lock:
+        checked = _last_health_check > 0
+        if checked and time.monotonic() - _last_health_check < OLLAMA_HEALTH_CHECK_INTERVAL_SECONDS:
+            return None
+    return refresh_endpoint_health()
+
+
+def _maybe_refresh_in_background() -> None:
+    global _health_check_running
+    with _lock:
+        if len(_state()) < 2 or _health_check_running:
+            return
+        if time.monotonic() - _last_health_check < OLLAMA_HEALTH_CHECK_INTERVAL_SECONDS:
+            return
+        _health_check_running = True
+
+    def _run() -> None:
+        global _health_check_running
+        try:
+            refresh_endpoint_health()
+        finally:
+            with _lock:
+                _health_check_running = False
+
+    threading.Thread(target=_run, daemon=True).start()
+
+
+def _score(endpoint: Dict[str, Any], fallback_speed: float) -> float:
+    speed = endpoint["tokens_per_sec"] if endpoint["tokens_per_sec"] > 0 else fallback_speed
+    return (endpoint["outstanding"] + 1) / max(speed, 1e-6)
+
+
+def acquire_endpoint() -> Dict[str, str]:
+    """Reserve the best endpoint and return its ``base_url`` and ``generate_url``."""
+    _load_throughput_history()
+    _maybe_refresh_in_background()
+
+    with _lock:
+        endpoints = list(_state().values())
+        candidates = [
+            endpoint
+            for endpoint in endpoints
+            if endpoint["healthy"] and not is_open(endpoint["base_url"])
+        ]
+        # With everything ejected, still try them all so the caller sees the real error.
+        candidates = candidates or endpoints
+
+        known_speeds = [e["tokens_per_sec"] for e in candidates if e["tokens_per_sec"] > 0]
+        fallback_speed = sum(known_speeds) / len(known_speeds) if known_speeds else 1.0
+        chosen = min(candidates, key=lambda endpoint: _score(endpoint, fallback_speed))
+        chosen["outstanding"] += 1
+        return {"base_url": chosen["base_url"], "generate_url": chosen["generate_url"]}
+
+
+def release_endpoint(
+    base_url: str,
+    tokens_per_sec: Optional[float] = None,
+    connection_failed: bool = False,
+) -> None:
+    with _lock:
+        endpoint = _state().get(base_url)
+        if endpoint is None:
+            return
+        endpoint["outstanding"] = max(endpoint["outstanding"] - 1, 0)
+        if connection_failed and len(_endpoints) > 1:
+            endpoint["healthy"] = False
+            endpoint["last_error"] = "connection failed"
+        if tokens_per_sec and tokens_per_sec > 0:
+            previous = endpoint["tokens_per_sec"]
+            endpoint["tokens_per_sec"] = (
+                tokens_per_sec
+                if previous <= 0
+                else (1 - _THROUGHPUT_SMOOTHING) * previous + _THROUGHPUT_SMOOTHING * tokens_per_sec
+            )
+
+
+@contextmanager
+def endpoint_slot() -> Iterator[Dict[str, str]]:
+    """Acquire an endpoint for one request; the caller reports results via the yielded dict.
+
+    Set ``slot["tokens_per_sec"]`` and ``slot["connection_failed"]`` before leaving
+    the block so the balancer can update its throughput estimate and ejections.
+    """
+    slot: Dict[str, Any] = acquire_endpoint()
+    try:
+        yield slot
+    finally:
+        release_endpoint(
+            slot["base_url"],
+            tokens_per_sec=slot.get("tokens_per_sec"),
+            connection_failed=bool(slot.get("connection_failed")),
+        )
+
+
+def get_endpoint_snapshot() -> List[Dict[str, Any]]:
+    breakers = get_breaker_states()
+    with _lock:
+        return [
+            {
+                "base_url": endpoint["base_url"],
+                "healthy": endpoint["healthy"],
+                "circuit": breakers.get(endpoint["base_url"], {}).get("state", "closed"),
+                "outstanding": endpoint["outstanding"],
+                "tokens_per_sec": round(endpoint["tokens_per_sec"], 2),
+                "last_error": endpoint["last_error"],
+            }
+            for endpoint in _state().values()
+        ]
@@ -0,0 +1,149 @@
+"""Per-problem store of finished explanations, reused when the same problem comes in another language.
+
+Intuition, Approach and most of the complexity discussion do not depend on
+the language a solution is written in. Every complete post is kept in the
+``explanation_store`` table of ``llm_stats/runs.db`` under its problem number,
+language and an algorithm fingerprint. A later submission of that problem in
+another language with the same fingerprint is adapted from the stored text
+(see ``generation_service._reuse_explanation``) instead of generated cold.
+
+The fingerprint is deliberately coarse: the set of techniques the code visibly
+uses (hash maps, sorting, heaps, queues, library binary search, memoization,
+two pointers), read from the code with comments stripped. Patterns only count
+names that mean the same thing in every language, so one algorithm gets one
+fingerprint whichever language it is written in. Two solutions of one
+problem with different fingerprints are treated as different algorithms, so a
+wrong guess only costs a full generation.
+"""
+
+import os
+import re
+import sqlite3
+import time
+from typing import Any, Dict, Optional
+
+from config import LLM_REUSE_ENABLED, PROMPT_VERSION
+from services.metrics_service import get_metrics_paths
+from services.prompt_compaction import compact_code
+
+
+_TECHNIQUE_PATTERNS = {
+    "hash": re.compile(
+        r"\b(?:dict|defaultdict|Counter|OrderedDict|unordered_map|unordered_set|HashMap|HashSet"
+        r"|LinkedHashMap|TreeMap|TreeSet)\b|\b(?:map|set|Map|Set)\s*<|\bnew\s+(?:Map|Set)\b|\bset\("
+    ),
+    "sort": re.compile(r"\bsorted\(|\.sort\(|\bsort\(|\bORDER\s+BY\b", re.IGNORECASE),
+    "heap": re.compile(r"\bheapq\b|\bheappush\b|priority_queue|PriorityQueue"),
+    "queue": re.compile(r"\bdeque\b|\bqueue\b|\bQueue\b|ArrayDeque"),
+    "stack": re.compile(r"\b[Ss]tack\b"),
+    "binary_search": re.compile(r"\bbisect\w*|\blower_bound\b|\bupper_bound\b|\bbinarySearch\b"),
+    "memoization": re.compile(r"\bdp\b|\bmemo\w*|\blru_cache\b|@cache\b"),
+}
+# In Python alone an empty brace literal is always a dict; elsewhere it is an array or object initializer.
+_PYTHON_EMPTY_DICT = re.compile(r"=\s*\{\s*\}")
+# Two pointers: both ends named in the code. Single letters and ``mid`` name too many other things.
+_LEFT_POINTER = re.compile(r"\b(?:left|lo|low)\b")
+_RIGHT_POINTER = re.compile(r"\b(?:right|hi|high)\b")
+
+
+def algorithm_fingerprint(code: str, language: str) -> str:
+    """Comma-separated techniques visible in ``code`` (comments ignored), or ``plain``."""
+    compacted = compact_code(code, language)
+    techniques = {name for name, pattern in _TECHNIQUE_PATTERNS.items() if pattern.search(compacted)}
+    if (language or "").strip().lower() == "python" and _PYTHON_EMPTY_DICT.search(compacted):
+        techniques.add("hash")
+    if _LEFT_POINTER.search(compacted) and _RIGHT_POINTER.search(compacted):
+        techniques.add("two_pointers")
+    return ",".join(sorted(techniques)) or "plain"
+
+
+def _connect() -> sqlite3.Connection:
+    paths = get_metrics_paths()
+    os.makedirs(paths["stats_dir"], exist_ok=True)
+    conn = sqlite3.connect(paths["db_path"])
+    conn.row_factory = sqlite3.Row
+    conn.execute(
+        """
+        CREATE TABLE IF NOT EXISTS explanation_store (
+            problem_number TEXT NOT NULL,
+            fingerprint TEXT NOT NULL,
+            language TEXT NOT NULL,
+            prompt_version TEXT NOT NULL,
+            run_id TEXT,
+            model TEXT,
+            analysis_text TEXT NOT NULL,
+            total_tokens INTEGER,
+            created_at REAL NOT NULL,
+            PRIMARY KEY (problem_number, fingerprint, language, prompt_version)
+        )
+        """
+    )
+    return conn
+
+
+def find_explanation(problem_number: str, fingerprint: str, language: str) -> Optional[Dict[str, Any]]:
+    """Most recent stored explanation of this problem and fingerprint written for another language."""
+    if not LLM_REUSE_ENABLED or not str(problem_number or "").strip():
+        return None
+    try:
+        conn = _connect()
+        try:
+            row = conn.execute(
+                """
+                SELECT language, run_id, model, analysis_text, total_tokens
+                FROM explanation_store
+                WHERE problem_number = ?
+                  AND fingerprint = ?
+                  AND language != ?
+                  AND prompt_version = ?
+                ORDER BY created_at DESC
+                LIMIT 1
+                """,
+                (str(problem_number).strip(), fingerprint, (language or "").strip().lower(), PROMPT_VERSION),
+            ).fetchone()
+        finally:
+            conn.close()
+    except sqlite3.Error:
+        return None
+    return dict(row) if row is not None else None
+
+
+def store_explanation(
+    problem_number: str,
+    fingerprint: str,
+    language: str,
+    run_id: str,
+    model: str,
+    analysis_text: str,
+    total_tokens: int,
+) -> None:
+    """Keep a complete explanation; replaces the previous one for the same problem, fingerprint and language."""
+    if not LLM_REUSE_ENABLED or not str(problem_number or "").strip() or not analysis_text:
+        return
+    try:
+        conn = _connect()
+        try:
+            conn.execute(
+                """
+                INSERT OR REPLACE INTO explanation_store
+                    (problem_number, fingerprint, language, prompt_version, run_id, model,
+                     analysis_text, total_tokens, created_at)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+                """,
+                (
+                    str(problem_number).strip(),
+                    fingerprint,
+                    (language or "").strip().lower(),
+                    PROMPT_VERSION,
+                    run_id,
+                    model,
+                    analysis_text,
+                    int(total_tokens or 0),
+                    time.time(),
+                ),
+            )
+            conn.commit()
+        finally:
+            conn.close()
+    except sqlite3.Error:
+        pass
@@ -1,269 +1,2410 @@
-import re
-from typing import Any, Dict, Optional
-
-import requests
-
-from config import (
-    GITHUB_REPO_URL,
-    LLM_NUM_PREDICT,
-    LLM_TEMPERATURE,
-    LLM_TIMEOUT_SECONDS,
-    OLLAMA_GENERATE_URL,
-    OLLAMA_MODEL,
-    PROMPT_STRATEGY,
-    PROMPT_VERSION,
-    TITLE_LETTER_COUNT,
-)
-from services.metrics_service import build_run_record, log_run_record
-
-
-def build_generation_prompt(
-    problem_number: str,
-    problem_name: str,
-    difficulty: str,
-    link: str,
-    code: str,
-    language: str,
-) -> str:
-    return f"""You are an expert technical writer creating a high-quality LeetCode solution post.
-
-Problem Details:
-Number: {problem_number}
-Name: {problem_name}
-Difficulty: {difficulty}
-Link: {link}
-
-{language} Solution:
-{code}
-
-Instructions:
-
-1. Generate a strong, descriptive, professional Title.
-- The title MUST mention:
-    - The core technique used
-    - The time complexity (Big-O notation)
-- The explanation must match the provided language
-- IMPORTANT: The title text (after "Title: ") must be {TITLE_LETTER_COUNT} characters or fewer.
-- **IMPORTANT: The title MUST be a fully complete, grammatically whole phrase — never cut off mid-word or mid-sentence. Plan the title length upfront so that the entire title fits within {TITLE_LETTER_COUNT} characters naturally. If a draft title is too long, shorten it by simplifying words, not by truncating.**
-
-2. Generate markdown using exactly these sections and no additional top-level sections:
-
-Title: <single line title, max {TITLE_LETTER_COUNT} characters>
-## Intuition
-## Approach
-## Time Complexity
-## Space Complexity
-
-3. Do NOT include any code block and do NOT add a ## Code section.
-4. Keep the response concise, technical, and ready for markdown publishing.
-"""
-
-
-def _markdown_language_tag(language: str) -> str:
-    mapping = {
-        "python": "python",
-        "sql": "sql",
-        "c++": "cpp",
-        "java": "java",
-    }
-    return mapping.get((language or "").strip().lower(), "text")
-
-
-def _strip_code_sections(text: str) -> str:
-    content = (text or "").strip()
-    if not content:
-        return ""
-
-    # Remove fenced code blocks if model accidentally returns them.
-    content = re.sub(r"```[\s\S]*?```", "", content)
-    # Remove trailing explicit code sections if present.
-    content = re.sub(r"(?ims)^##\s*Code\b[\s\S]*$", "", content).strip()
-    return content
-
-
-def _enforce_title_limit(text: str) -> str:
-    """Truncate the title value on the 'Title: ' line to TITLE_LETTER_COUNT characters."""
-    def _trim_title(match: re.Match) -> str:
-        title_text = match.group(1)
-        if len(title_text) > TITLE_LETTER_COUNT:
-            title_text = title_text[:TITLE_LETTER_COUNT].rstrip()
-        return f"Title: {title_text}"
-
-    return re.sub(r"(?im)^Title:\s*(.+)$", _trim_title, text)
-
-
-def _compose_final_output(
-    analysis_text: str,
-    code: str,
-    language: str,
-    include_repo_link: bool,
-) -> str:
-    cleaned_body = _strip_code_sections(analysis_text)
-    if not cleaned_body:
-        cleaned_body = "Title: Solution Explanation\n\n## Intuition\nUnable to generate model explanation."
-
-    cleaned_body = _enforce_title_limit(cleaned_body)
-
-    lang_tag = _markdown_language_tag(language)
-    final_text = (
-        f"{cleaned_body}\n\n## Code\n"
-        f"```{lang_tag}\n{code}\n```"
-    )
-
-    if include_repo_link and GITHUB_REPO_URL:
-        final_text += "\n\n---\n" + f"Repository: {GITHUB_REPO_URL}\n"
-
-    return final_text
-
-
-def _classify_http_error(status_code: Optional[int]) -> str:
-    if status_code is None:
-        return ""
-    if 500 <= status_code <= 599:
-        return "HTTP_SERVER_ERROR"
-    if 400 <= status_code <= 499:
-        return "HTTP_CLIENT_ERROR"
-    if status_code != 200:
-        return "HTTP_UNEXPECTED_STATUS"
-    return ""
-
-
-def generate_solution_post_with_metadata(
-    problem_number: str,
-    problem_name: str,
-    difficulty: str,
-    link: str,
-    code: str,
-    language: str,
-    include_repo_link: bool = True,
-) -> Dict[str, Any]:
-    """Generate a structured post through Ollama and return text plus run metadata."""
-
-    prompt = build_generation_prompt(
-        problem_number=problem_number,
-        problem_name=problem_name,
-        difficulty=difficulty,
-        link=link,
-        code=code,
-        language=language,
-    )
-
-    response_data: Dict[str, Any] = {}
-    response_text = ""
-    llm_response_text = ""
-    error_type = ""
-    error_message = ""
-    timeout_flag = 0
-    http_status: Optional[int] = None
-    code_appended_externally = 0
-    llm_returned_code_block = 0
-
-    try:
-        response = requests.post(
-            OLLAMA_GENERATE_URL,
-            json={
-                "model": OLLAMA_MODEL,
-                "num_predict": LLM_NUM_PREDICT,
-                "prompt": prompt,
-                "stream": False,
-                "temperature": LLM_TEMPERATURE,
-            },
-            timeout=LLM_TIMEOUT_SECONDS,
-        )
-
-        http_status = response.status_code
-        if response.status_code != 200:
-            error_type = _classify_http_error(response.status_code)
-            error_message = f"Ollama returned status code {response.status_code}"
-            response_text = f"Warning: {error_message}"
-        else:
-            response_data = response.json()
-            llm_response_text = response_data.get("response", "").strip()
-            if not llm_response_text:
-                error_type = "EMPTY_RESPONSE"
-                error_message = "Model returned empty response"
-                response_text = "Warning: Mistral returned empty response."
-            else:
-                llm_returned_code_block = int("```" in llm_response_text or "## Code" in llm_response_text)
-                response_text = _compose_final_output(
-                    analysis_text=llm_response_text,
-                    code=code,
-                    language=language,
-                    include_repo_link=include_repo_link,
-                )
-                code_appended_externally = 1
-
-    except requests.exceptions.Timeout:
-        timeout_flag = 1
-        error_type = "TIMEOUT"
-        error_message = "Request timed out"
-        response_text = "Warning: Request timed out."
-
-    except requests.exceptions.ConnectionError as exc:
-        error_type = "CONNECTION_ERROR"
-        error_message = str(exc)
-        response_text = "Warning: Could not connect to Ollama. Check if it is running."
-
-    except requests.exceptions.RequestException as exc:
-        error_type = "REQUEST_ERROR"
-        error_message = str(exc)
-        response_text = f"Warning: Network error: {str(exc)}"
-
-    except Exception as exc:
-        error_type = "UNEXPECTED_ERROR"
-        error_message = str(exc)
-        response_text = f"Warning: Error generating solution post: {str(exc)}"
-
-    record = build_run_record(
-        problem_number=problem_number,
-        problem_name=problem_name,
-        problem_link=link,
-        difficulty=difficulty,
-        language=language,
-        model=OLLAMA_MODEL,
-        prompt_version=PROMPT_VERSION,
-        prompt_strategy=PROMPT_STRATEGY,
-        prompt=prompt,
-        code=code,
-        response_text=response_text,
-        llm_response_text=llm_response_text,
-        response_data=response_data,
-        http_status=http_status,
-        error_type=error_type,
-        error_message=error_message,
-        timeout_flag=timeout_flag,
-        llm_returned_code_block=llm_returned_code_block,
-        code_appended_externally=code_appended_externally,
-        retry_count=0,
-        manual_edit_distance=None,
-        accepted_for_posting=None,
-    )
-    log_run_record(record)
-
-    return {
-        "text": response_text,
-        "run_id": record["run_id"],
-        "error_type": error_type,
-        "http_status": http_status,
-    }
-
-
-def generate_solution_post(
-    problem_number: str,
-    problem_name: str,
-    difficulty: str,
-    link: str,
-    code: str,
-    language: str,
-    include_repo_link: bool = True,
-) -> str:
-    result = generate_solution_post_with_metadata(
-        problem_number=problem_number,
-        problem_name=problem_name,
-        difficulty=difficulty,
-        link=link,
-        code=code,
-        language=language,
-        include_repo_link=include_repo_link,
-    )
-    return result["text"]
+import asyncio
+import hashlib
+import random
+import re
+import threading
+import time
+import uuid
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from typing import Any, AsyncIterator, Callable, Dict, List, Optional, Sequence, Tuple
+
+import requests
+
+from config import (
+    GITHUB_REPO_URL,
+    LLM_BEST_OF_MIN_FORMAT_SCORE,
+    LLM_BEST_OF_N,
+    LLM_CASCADE_MIN_FORMAT_SCORE,
+    LLM_CASCADE_MODELS,
+    LLM_EARLY_STOP_ENABLED,
+    LLM_HEDGE_ENABLED,
+    LLM_MAX_CONCURRENCY,
+    LLM_MAX_RETRIES,
+    LLM_NUM_PREDICT,
+    LLM_REPAIR_ENABLED,
+    LLM_REPAIR_NUM_PREDICT,
+    LLM_REUSE_NUM_PREDICT,
+    LLM_RETRY_BACKOFF_MAX_SECONDS,
+    LLM_RETRY_BACKOFF_SECONDS,
+    LLM_STOP_SEQUENCES,
+    LLM_TEMPERATURE,
+    LLM_TIMEOUT_SECONDS,
+    OLLAMA_CONNECT_TIMEOUT_SECONDS,
+    OLLAMA_ENDPOINTS,
+    OLLAMA_MODEL,
+    OLLAMA_POOL_SIZE,
+    PROMPT_LAYOUT,
+    PROMPT_STRATEGY,
+    PROMPT_VERSION,
+    TITLE_LETTER_COUNT,
+)
+from services.artifacts import (
+    artifact_schema,
+    artifacts_num_predict,
+    build_artifact_instructions,
+    resolve_artifacts,
+    split_artifacts,
+)
+from services.backends import get_backend, normalized_response
+from services.circuit_breaker import allow_request, record_failure, record_success
+from services.context_window import remember_num_ctx, request_options
+from services.endpoint_pool import endpoint_slot
+from services.explanation_store import algorithm_fingerprint, find_explanation, store_explanation
+from services.metrics_service import (
+    analyze_response_quality,
+    build_run_record,
+    fetch_baseline_response_tokens,
+    log_run_record,
+)
+from services.markdown_sections import (
+    has_section,
+    insert_section,
+    parse_post,
+    render_body,
+    replace_section,
+    section_body,
+    set_title,
+)
+from services.model_residency import get_keep_alive
+from services.ollama_client import post_json, trace_async_connection
+from services.prompt_compaction import prepare_prompt_code
+from services.refinement_sessions import get_session, remember_session
+from services.response_cache import build_cache_key, get_cached_response, store_cached_response
+from services.single_flight import await_flight, join_flight, land_flight, wait_for_flight
+from services.structured_output import (
+    OUTPUT_SCHEMA,
+    build_json_instructions,
+    is_json_strategy,
+    render_post_from_json,
+)
+from services.timeout_policy import compute_hedge_delay, compute_request_timeout
+from services.token_estimator import estimate_prompt_tokens, estimate_tokens
+
+
+_GENERATION_ROLE = "You are an expert technical writer creating a high-quality LeetCode solution post."
+
+
+def build_generation_instructions() -> str:
+    """Constant part of the prompt; identical for every problem."""
+    if is_json_strategy():
+        return build_json_instructions()
+    return f"""Instructions:
+
+1. Generate a strong, descriptive, professional Title.
+- The title MUST mention:
+    - The core technique used
+    - The time complexity (Big-O notation)
+- The explanation must match the provided language
+- IMPORTANT: The title text (after "Title: ") must be {TITLE_LETTER_COUNT} characters or fewer.
+- **IMPORTANT: The title MUST be a fully complete, grammatically whole phrase — never cut off mid-word or mid-sentence. Plan the title length upfront so that the entire title fits within {TITLE_LETTER_COUNT} characters naturally. If a draft title is too long, shorten it by simplifying words, not by truncating.**
+
+2. Generate markdown using exactly these sections and no additional top-level sections:
+
+Title: <single line title, max {TITLE_LETTER_COUNT} characters>
+## Intuition
+## Approach
+## Time Complexity
+## Space Complexity
+
+3. Do NOT include any code block and do NOT add a ## Code section.
+4. Keep the response concise, technical, and ready for markdown publishing.
+"""
+
+
+def _build_problem_details(
+    problem_number: str,
+    problem_name: str,
+    difficulty: str,
+    link: str,
+    code: str,
+    language: str,
+) -> str:
+    return f"""Problem Details:
+Number: {problem_number}
+Name: {problem_name}
+Difficulty: {difficulty}
+Link: {link}
+
+{language} Solution:
+{code}
+"""
+
+
+def build_generation_prompt(
+    problem_number: str,
+    problem_name: str,
+    difficulty: str,
+    link: str,
+    code: str,
+    language: str,
+) -> str:
+    details = _build_problem_details(problem_number, problem_name, difficulty, link, code, language)
+    return f"""{_GENERATION_ROLE}
+
+{details}
+{build_generation_instructions()}"""
+
+
+def build_generation_request(
+    problem_number: str,
+    problem_name: str,
+    difficulty: str,
+    link: str,
+    code: str,
+    language: str,
+    layout: Optional[str] = None,
+    artifacts: Optional[Sequence[str]] = None,
+) -> Dict[str, Any]:
+    """Build the system/prompt pair for the configured PROMPT_LAYOUT.
+
+    ``inline`` sends everything as one prompt with the problem first.
+    ``system_prefix`` moves the role and instructions into Ollama's ``system``
+    field, which the chat template places before the prompt, so every request
+    shares the same token prefix and Ollama can reuse its cached KV state for
+    it. ``full_prompt`` is the exact text the model sees and is what gets
+    hashed, cached and logged.
+
+    The code is compacted (and fitted to PROMPT_TOKEN_BUDGET, when set) first;
+    ``tokens_saved`` and ``code_truncated`` report what that removed.
+    ``estimated_prompt_tokens`` is the local count of ``full_prompt`` (see
+    ``services.token_estimator``), known before anything is sent.
+
+    ``artifacts`` names extra outputs (see ``services.artifacts``) asked for
+    after the post in the same request; their instructions go at the end of
+    the prompt, so the system block stays identical across requests, and
+    ``num_predict`` grows by what they need.
+    """
+    layout = (layout or PROMPT_LAYOUT).strip().lower()
+    if layout != "system_prefix":
+        layout = "inline"
+    artifact_names = resolve_artifacts(artifacts)
+    artifact_instructions = build_artifact_instructions(artifact_names, is_json_strategy())
+
+    def _render(prompt_code: str) -> Dict[str, Any]:
+        if layout == "system_prefix":
+            system = f"{_GENERATION_ROLE}\n\n{build_generation_instructions()}"
+            prompt = _build_problem_details(
+                problem_number, problem_name, difficulty, link, prompt_code, language
+            ) + artifact_instructions
+            return {"layout": layout, "system": system, "prompt": prompt, "full_prompt": f"{system}\n{prompt}"}
+
+        prompt = build_generation_prompt(
+            problem_number=problem_number,
+            problem_name=problem_name,
+            difficulty=difficulty,
+            link=link,
+            code=prompt_code,
+            language=language,
+        ) + artifact_instructions
+        return {"layout": layout, "system": "", "prompt": prompt, "full_prompt": prompt}
+
+    overhead_tokens = estimate_tokens(_render("")["full_prompt"])
+    compaction = prepare_prompt_code(code, language, overhead_tokens)
+    prompt_request = _render(compaction["code"])
+    prompt_request["prompt_code"] = compaction["code"]
+    prompt_request["tokens_saved"] = compaction["tokens_saved"]
+    prompt_request["code_truncated"] = compaction["truncated"]
+    estimate = estimate_prompt_tokens(prompt_request["full_prompt"])
+    prompt_request["estimated_prompt_tokens"] = estimate["tokens"]
+    prompt_request["token_estimate_method"] = estimate["method"]
+    prompt_request["artifacts"] = artifact_names
+    if artifact_names:
+        prompt_request["num_predict"] = LLM_NUM_PREDICT + artifacts_num_predict(artifact_names)
+    return prompt_request
+
+
+def estimate_generation_tokens(
+    problem_number: str,
+    problem_name: str,
+    difficulty: str,
+    link: str,
+    code: str,
+    language: str,
+    artifacts: Optional[Sequence[str]] = None,
+) -> int:
+    """Estimated prompt tokens for a queued problem, for enqueue-time budget and scheduling checks."""
+    return build_generation_request(
+        problem_number=problem_number,
+        problem_name=problem_name,
+        difficulty=difficulty,
+        link=link,
+        code=code,
+        language=language,
+        artifacts=artifacts,
+    )["estimated_prompt_tokens"]
+
+
+def _markdown_language_tag(language: str) -> str:
+    mapping = {
+        "python": "python",
+        "sql": "sql",
+        "c++": "cpp",
+        "java": "java",
+    }
+    return mapping.get((language or "").strip().lower(), "text")
+
+
+def _compose_final_output(
+    analysis_text: str,
+    code: str,
+    language: str,
+    include_repo_link: bool,
+) -> str:
+    # Fenced blocks and any "## Code" section are dropped; the real code is appended below.
+    cleaned_body = render_body(parse_post(analysis_text), TITLE_LETTER_COUNT)
+    if not cleaned_body:
+        cleaned_body = "Title: Solution Explanation\n\n## Intuition\nUnable to generate model explanation."
+
+    lang_tag = _markdown_language_tag(language)
+    final_text = (
+        f"{cleaned_body}\n\n## Code\n"
+        f"```{lang_tag}\n{code}\n```"
+    )
+
+    if include_repo_link and GITHUB_REPO_URL:
+        final_text += "\n\n---\n" + f"Repository: {GITHUB_REPO_URL}\n"
+
+    return final_text
+
+
+# Failures worth retrying (and counted by the circuit breaker): the server may recover.
+RETRYABLE_ERROR_TYPES = {"TIMEOUT", "CONNECTION_ERROR", "HTTP_SERVER_ERROR"}
+
+
+def _classify_http_error(status_code: Optional[int]) -> str:
+    if status_code is None:
+        return ""
+    if 500 <= status_code <= 599:
+        return "HTTP_SERVER_ERROR"
+    if 400 <= status_code <= 499:
+        return "HTTP_CLIENT_ERROR"
+    if status_code != 200:
+        return "HTTP_UNEXPECTED_STATUS"
+    return ""
+
+
+def _request_model(prompt_request: Dict[str, Any]) -> str:
+    # Cascade hops (and their repairs) name their own model; everything else runs on OLLAMA_MODEL.
+    return prompt_request.get("model") or OLLAMA_MODEL
+
+
+def _outcome_model(prompt_request: Dict[str, Any], outcome: Dict[str, Any]) -> str:
+    # Cache hits and coalesced followers replay a post whose response_data names the cascade hop that wrote it.
+    return outcome["response_data"].get("model") or _request_model(prompt_request)
+
+
+def _runtime_options(prompt_request: Dict[str, Any]) -> Dict[str, int]:
+    # Servers that fix the context at startup get neither; 0 is recorded for them.
+    if not get_backend().SUPPORTS_NUM_CTX:
+        return {"num_ctx": 0, "num_thread": 0}
+    return request_options(prompt_request)
+
+
+def _build_generation_payload(prompt_request: Dict[str, Any], stream: bool) -> Dict[str, Any]:
+    backend = get_backend()
+    model = _request_model(prompt_request)
+    runtime_options = _runtime_options(prompt_request)
+    remember_num_ctx(model, runtime_options["num_ctx"])
+    options: Dict[str, Any] = {
+        "model": model,
+        "num_predict": prompt_request.get("num_predict") or LLM_NUM_PREDICT,
+        "temperature": LLM_TEMPERATURE,
+        "keep_alive": get_keep_alive() if backend.SUPPORTS_KEEP_ALIVE else None,
+        "json_schema": artifact_schema(OUTPUT_SCHEMA, prompt_request.get("artifacts") or [])
+        if is_json_strategy()
+        else None,
+        "stop": LLM_STOP_SEQUENCES,
+        **runtime_options,
+    }
+    return backend.build_payload(prompt_request, options, stream)
+
+
+# done_reason recorded when the stream is cut because every required section is finished.
+EARLY_STOP_REASON = "sections_complete"
+# done_reason recorded when a best-of-N attempt is abandoned because another attempt won.
+CANCELLED_REASON = "cancelled"
+# How long a cancelled best-of-N loser gets to return its partial stats before it is left behind.
+_CANCEL_GRACE_SECONDS = 0.2
+
+_REQUIRED_SECTIONS = ("intuition", "approach", "time complexity", "space complexity")
+_BLOCK_BOUNDARY = re.compile(r"^(?:(?P<hashes>#{1,6})[ \t]*(?P<name>[^\n]*)\n|---|```)", re.MULTILINE)
+
+
+def _last_required_heading(text: str) -> Optional[re.Match]:
+    """Heading of the section written last, once every required section has started; else None."""
+    found: Dict[str, re.Match] = {}
+    for match in _BLOCK_BOUNDARY.finditer(text):
+        name = (match.group("name") or "").strip().lower()
+        for section in _REQUIRED_SECTIONS:
+            if section not in found and name.startswith(section):
+                found[section] = match
+    if len(found) < len(_REQUIRED_SECTIONS):
+        return None
+    return max(found.values(), key=lambda match: match.start())
+
+
+def _completed_sections_end(text: str) -> Optional[int]:
+    """Offset where trailing extra content starts once all required sections are written.
+
+    The last section ends at the first heading of its own level or higher, rule
+    or code fence after its body; its paragraphs and subheadings are kept.
+    None means the model is still inside the post.
+    """
+    last = _last_required_heading(text)
+    if last is None:
+        return None
+
+    level = len(last.group("hashes") or "")
+    body_start = last.end()
+    for match in _BLOCK_BOUNDARY.finditer(text, body_start):
+        hashes = match.group("hashes")
+        if hashes and len(hashes) > level:
+            continue
+        if text[body_start:match.start()].strip():
+            return match.start()
+    return None
+
+
+def _local_timing(
+    started_at: float,
+    time_to_first_token_ms: Optional[float],
+    chunk_count: int,
+) -> Dict[str, float]:
+    """Client-side timings, used by backends for whatever the server does not report."""
+    total_ms = (time.perf_counter() - started_at) * 1000
+    generation_ms = total_ms
+    if time_to_first_token_ms is not None:
+        generation_ms = total_ms - time_to_first_token_ms
+    return {"total_ms": total_ms, "generation_ms": generation_ms, "chunks": float(chunk_count)}
+
+
+def _local_stream_stats(
+    text: str,
+    chunk_count: int,
+    started_at: float,
+    time_to_first_token_ms: Optional[float],
+    done_reason: str,
+) -> Dict[str, Any]:
+    timing = _local_timing(started_at, time_to_first_token_ms, chunk_count)
+    return normalized_response(
+        text=text,
+        done_reason=done_reason,
+        response_tokens=chunk_count,
+        total_duration_ms=timing["total_ms"],
+        generation_ms=timing["generation_ms"] if time_to_first_token_ms is not None else 0.0,
+    )
+
+
+def _consume_stream(
+    response: requests.Response,
+    on_chunk: Callable[[str], None],
+    started_at: float,
+    deadline_at: float,
+    stop_when_complete: bool = False,
+    cancel_event: Optional[threading.Event] = None,
+) -> Tuple[Dict[str, Any], Optional[float]]:
+    """Read the backend's stream, forward text, and return final stats plus time to first token.
+
+    The socket read timeout only bounds the gap between chunks, so the overall
+    request deadline is enforced here. With ``stop_when_complete`` the stream
+    is closed (which makes the server stop generating) as soon as the post's
+    required sections are finished, and likewise once ``cancel_event`` is set;
+    token and timing stats are then measured locally, one token per chunk.
+    Inside the last required section ``on_chunk`` only gets whole lines, so
+    nothing past the cut is forwarded.
+    """
+    backend = get_backend()
+    stream_state: Dict[str, Any] = {}
+    text = ""
+    forwarded = 0
+    in_last_section = False
+    chunk_count = 0
+    time_to_first_token_ms: Optional[float] = None
+
+    def _forward(end: int) -> None:
+        nonlocal forwarded
+        if end > forwarded:
+            on_chunk(text[forwarded:end])
+            forwarded = end
+
+    for line in response.iter_lines():
+        if time.perf_counter() > deadline_at:
+            raise requests.exceptions.ReadTimeout("Streaming response exceeded the request deadline")
+        if not line:
+            continue
+        piece, done = backend.parse_stream_line(line, stream_state)
+        if piece:
+            if time_to_first_token_ms is None:
+                time_to_first_token_ms = (time.perf_counter() - started_at) * 1000
+            text += piece
+            chunk_count += 1
+
+            # Only a line break, heading, rule or fence can finish a section.
+            if stop_when_complete and any(marker in piece for marker in "\n#-`"):
+                in_last_section = in_last_section or _last_required_heading(text) is not None
+                cut_at = _completed_sections_end(text) if in_last_section else None
+                if cut_at is not None:
+                    _forward(cut_at)
+                    response.close()
+                    stats = _local_stream_stats(
+                        text[:cut_at], chunk_count, started_at, time_to_first_token_ms, EARLY_STOP_REASON
+                    )
+                    return stats, time_to_first_token_ms
+            _forward(text.rfind("\n") + 1 if in_last_section else len(text))
+
+        if cancel_event is not None and cancel_event.is_set():
+            _forward(len(text))
+            response.close()
+            stats = _local_stream_stats(text, chunk_count, started_at, time_to_first_token_ms, CANCELLED_REASON)
+            return stats, time_to_first_token_ms
+
+        if done:
+            break
+
+    _forward(len(text))
+    if cancel_event is not None and cancel_event.is_set():
+        # The response was closed from another thread (see _ClosingCancel).
+        stats = _local_stream_stats(text, chunk_count, started_at, time_to_first_token_ms, CANCELLED_REASON)
+        return stats, time_to_first_token_ms
+
+    timing = _local_timing(started_at, time_to_first_token_ms, chunk_count)
+    return backend.finish_stream(stream_state, text, timing), time_to_first_token_ms
+
+
+class _ClosingCancel(threading.Event):
+    """Cancel event that also closes the attached responses when set.
+
+    A hedged request or best-of-N loser may be stalled, with no chunk arriving
+    to notice a plain event; closing its response makes the blocked read return.
+    """
+
+    def __init__(self) -> None:
+        super().__init__()
+        self._responses: List[requests.Response] = []
+        self._responses_lock = threading.Lock()
+
+    def attach(self, response: requests.Response) -> None:
+        with self._responses_lock:
+            if not self.is_set():
+                self._responses.append(response)
+                return
+        response.close()
+
+    def set(self) -> None:
+        super().set()
+        with self._responses_lock:
+            responses, self._responses = self._responses, []
+        for response in responses:
+            response.close()
+
+
+def _new_outcome() -> Dict[str, Any]:
+    return {
+        "response_data": {},
+        "response_text": "",
+        "llm_response_text": "",
+        "error_type": "",
+        "error_message": "",
+        "timeout_flag": 0,
+        "http_status": None,
+        "code_appended_externally": 0,
+        "llm_returned_code_block": 0,
+        "time_to_first_token_ms": None,
+        "cache_hit": 0,
+        "coalesced": 0,
+        "endpoint": "",
+        "retry_count": 0,
+        "request_timeout_seconds": float(LLM_TIMEOUT_SECONDS),
+        "repaired_sections": "",
+        "reused_from_run_id": "",
+        "reuse_tokens_saved": 0,
+    }
+
+
+def _apply_http_status(outcome: Dict[str, Any], status_code: int) -> None:
+    outcome["http_status"] = status_code
+    outcome["error_type"] = _classify_http_error(status_code)
+    outcome["error_message"] = f"{get_backend().NAME} server returned status code {status_code}"
+    outcome["response_text"] = f"Warning: {outcome['error_message']}"
+
+
+def _apply_response_data(
+    outcome: Dict[str, Any],
+    response_data: Dict[str, Any],
+    code: str,
+    language: str,
+    include_repo_link: bool,
+) -> None:
+    outcome["response_data"] = response_data
+    llm_response_text = response_data.get("response", "").strip()
+    outcome["llm_response_text"] = llm_response_text
+    if not llm_response_text:
+        outcome["error_type"] = "EMPTY_RESPONSE"
+        outcome["error_message"] = "Model returned empty response"
+        outcome["response_text"] = "Warning: Mistral returned empty response."
+        return
+
+    outcome["llm_returned_code_block"] = int("```" in llm_response_text or "## Code" in llm_response_text)
+    analysis_text = llm_response_text
+    if is_json_strategy():
+        analysis_text = render_post_from_json(llm_response_text)
+        if analysis_text is None:
+            outcome["error_type"] = "INVALID_JSON_RESPONSE"
+            outcome["error_message"] = "Model response did not match the output schema"
+            outcome["response_text"] = "Warning: Model returned malformed JSON output."
+            return
+
+    outcome["response_text"] = _compose_final_output(
+        analysis_text=analysis_text,
+        code=code,
+        language=language,
+        include_repo_link=include_repo_link,
+    )
+    outcome["code_appended_externally"] = 1
+
+
+def _extract_artifacts(
+    outcome: Dict[str, Any],
+    prompt_request: Dict[str, Any],
+    code: str,
+    language: str,
+    include_repo_link: bool,
+) -> None:
+    """Move the requested artifacts out of the post into ``response_data["artifacts"]``, which is cached with it."""
+    names = prompt_request.get("artifacts")
+    if not names or outcome["error_type"]:
+        return
+    text, found = split_artifacts(outcome["response_data"].get("response", ""), names, is_json_strategy())
+    outcome["response_data"] = dict(outcome["response_data"], response=text, artifacts=found)
+    if not is_json_strategy():
+        outcome["response_text"] = _compose_final_output(text, code, language, include_repo_link)
+
+
+def _apply_cancelled(outcome: Dict[str, Any], response_data: Dict[str, Any]) -> None:
+    outcome["response_data"] = response_data
+    outcome["llm_response_text"] = response_data.get("response", "")
+    outcome["error_type"] = "CANCELLED"
+    outcome["error_message"] = "Cancelled after another attempt was accepted"
+    outcome["response_text"] = "Warning: Generation cancelled."
+
+
+def _apply_error(outcome: Dict[str, Any], error_type: str, exc: BaseException) -> None:
+    """Fill the outcome for a failed request using the shared error vocabulary."""
+    outcome["error_type"] = error_type
+    if error_type == "TIMEOUT":
+        outcome["timeout_flag"] = 1
+        outcome["error_message"] = "Request timed out"
+        outcome["response_text"] = "Warning: Request timed out."
+    elif error_type == "CONNECTION_ERROR":
+        outcome["error_message"] = str(exc)
+        outcome["response_text"] = "Warning: Could not connect to Ollama. Check if it is running."
+    elif error_type == "REQUEST_ERROR":
+        outcome["error_message"] = str(exc)
+        outcome["response_text"] = f"Warning: Network error: {str(exc)}"
+    else:
+        outcome["error_message"] = str(exc)
+        outcome["response_text"] = f"Warning: Error generating solution post: {str(exc)}"
+
+
+def _classify_requests_exception(exc: BaseException) -> str:
+    if isinstance(exc, requests.exceptions.Timeout):
+        return "TIMEOUT"
+    if isinstance(exc, requests.exceptions.ConnectionError):
+        return "CONNECTION_ERROR"
+    if isinstance(exc, requests.exceptions.RequestException):
+        return "REQUEST_ERROR"
+    return "UNEXPECTED_ERROR"
+
+
+def _prompt_hash(prompt: str) -> str:
+    return hashlib.sha256((prompt or "").encode("utf-8")).hexdigest()
+
+
+def _response_cache_key(prompt: str) -> str:
+    # With a cascade the post may come from any of its models, so the whole cascade is the key's model.
+    models = ",".join(_cascade_models()) or OLLAMA_MODEL
+    return build_cache_key(models, _prompt_hash(prompt), LLM_TEMPERATURE, LLM_NUM_PREDICT)
+
+
+def _replayed_response(response_data: Dict[str, Any], text: str) -> Dict[str, Any]:
+    replayed: Dict[str, Any] = {"response": text}
+    for key in ("artifacts", "model"):
+        if response_data.get(key):
+            replayed[key] = response_data[key]
+    return replayed
+
+
+def _apply_cached_response(
+    outcome: Dict[str, Any],
+    cached: Dict[str, Any],
+    code: str,
+    language: str,
+    include_repo_link: bool,
+) -> None:
+    # Only the text is replayed: Ollama did no work for this run, so token and
+    # timing fields stay empty and cache hits do not inflate throughput metrics.
+    outcome["cache_hit"] = 1
+    outcome["http_status"] = 200
+    _apply_response_data(
+        outcome, _replayed_response(cached, cached.get("response", "")), code, language, include_repo_link
+    )
+
+
+def _apply_coalesced_response(
+    outcome: Dict[str, Any],
+    shared: Dict[str, Any],
+    code: str,
+    language: str,
+    include_repo_link: bool,
+) -> None:
+    # Like a cache hit: the leader's run already carries the tokens and timings.
+    outcome["coalesced"] = 1
+    outcome["http_status"] = shared["http_status"]
+    if shared["error_type"]:
+        for key in ("error_type", "error_message", "response_text", "timeout_flag"):
+            outcome[key] = shared[key]
+        return
+    # response_data holds the repaired text when the leader's post was repaired.
+    _apply_response_data(
+        outcome,
+        _replayed_response(
+            shared["response_data"], shared["response_data"].get("response") or shared["llm_response_text"]
+        ),
+        code,
+        language,
+        include_repo_link,
+    )
+
+
+def _titles_fit(analysis_text: str) -> bool:
+    """Whether the model's post text has a title and none longer than TITLE_LETTER_COUNT."""
+    if is_json_strategy():
+        analysis_text = render_post_from_json(analysis_text) or ""
+    titles = parse_post(analysis_text)["titles"]
+    return bool(titles) and all(len(value) <= TITLE_LETTER_COUNT for _, _, value in titles)
+
+
+def _passes_validation(outcome: Dict[str, Any]) -> bool:
+    """A finished post (after any repair) with every required section and a title that fits."""
+    if outcome["error_type"]:
+        return False
+    if analyze_response_quality(outcome["response_text"])["format_score"] < 100:
+        return False
+    return _titles_fit(outcome["response_data"].get("response") or outcome["llm_response_text"])
+
+
+def _store_in_cache(cache_key: str, prompt: str, outcome: Dict[str, Any]) -> None:
+    # A post that still fails validation would be replayed for the whole TTL, even on regenerate.
+    if outcome["cache_hit"] or not _passes_validation(outcome):
+        return
+    store_cached_response(
+        cache_key=cache_key,
+        model=outcome["response_data"].get("model") or OLLAMA_MODEL,
+        prompt_hash=_prompt_hash(prompt),
+        temperature=LLM_TEMPERATURE,
+        num_predict=LLM_NUM_PREDICT,
+        response_data=outcome["response_data"],
+    )
+
+
+def _log_generation_run(
+    problem_number: str,
+    problem_name: str,
+    difficulty: str,
+    link: str,
+    code: str,
+    language: str,
+    prompt: str,
+    prompt_request: Dict[str, Any],
+    outcome: Dict[str, Any],
+    streamed: int,
+    wall_clock_ms: float,
+    run_group_id: str = "",
+    run_kind: str = "",
+    selected: int = 1,
+    parent_run_id: str = "",
+    is_hedge: int = 0,
+    include_repo_link: bool = True,
+    repairs: Optional[List[Tuple[Dict[str, Any], Dict[str, Any], float]]] = None,
+) -> Dict[str, Any]:
+    """Log one run, then the section repairs made to its post as child runs (``run_kind`` = ``repair``)."""
+    model = _outcome_model(prompt_request, outcome)
+    response_tokens_saved = 0
+    if outcome["response_data"].get("done_reason") == EARLY_STOP_REASON:
+        # Compared with how long uncut responses for this prompt version usually run.
+        baseline = fetch_baseline_response_tokens(model, PROMPT_VERSION)
+        response_tokens_saved = max(int(round(baseline - outcome["response_data"].get("response_tokens", 0))), 0)
+    # Cache hits and coalesced followers never reached the server.
+    if outcome["cache_hit"] or outcome["coalesced"]:
+        runtime_options = {"num_ctx": 0, "num_thread": 0}
+    else:
+        runtime_options = _runtime_options(prompt_request)
+
+    record = build_run_record(
+        problem_number=problem_number,
+        problem_name=problem_name,
+        problem_link=link,
+        difficulty=difficulty,
+        language=language,
+        model=model,
+        prompt_version=PROMPT_VERSION,
+        prompt_strategy=PROMPT_STRATEGY,
+        prompt_layout=prompt_request["layout"],
+        prompt_tokens_saved=prompt_request["tokens_saved"],
+        code_truncated=prompt_request["code_truncated"],
+        estimated_prompt_tokens=prompt_request["estimated_prompt_tokens"],
+        token_estimate_method=prompt_request["token_estimate_method"],
+        num_ctx=runtime_options["num_ctx"],
+        num_thread=runtime_options["num_thread"],
+        prompt=prompt,
+        code=code,
+        response_text=outcome["response_text"],
+        llm_response_text=outcome["llm_response_text"],
+        response_data=outcome["response_data"],
+        http_status=outcome["http_status"],
+        error_type=outcome["error_type"],
+        error_message=outcome["error_message"],
+        timeout_flag=outcome["timeout_flag"],
+        llm_returned_code_block=outcome["llm_returned_code_block"],
+        code_appended_externally=outcome["code_appended_externally"],
+        retry_count=outcome["retry_count"],
+        streamed=streamed,
+        time_to_first_token_ms=outcome["time_to_first_token_ms"],
+        wall_clock_ms=wall_clock_ms,
+        cache_hit=outcome["cache_hit"],
+        coalesced=outcome["coalesced"],
+        endpoint=outcome["endpoint"],
+        request_timeout_seconds=outcome["request_timeout_seconds"],
+        response_tokens_saved=response_tokens_saved,
+        run_group_id=run_group_id,
+        run_kind=run_kind,
+        selected=selected,
+        parent_run_id=parent_run_id,
+        is_hedge=is_hedge,
+        repaired_sections=outcome["repaired_sections"],
+        reused_from_run_id=outcome["reused_from_run_id"],
+        reuse_tokens_saved=outcome["reuse_tokens_saved"],
+        artifacts=",".join(outcome["response_data"].get("artifacts") or {}),
+        manual_edit_distance=None,
+        accepted_for_posting=None,
+    )
+    log_run_record(record)
+
+    for repair_request, repair_outcome, repair_wall_clock_ms in repairs or []:
+        _log_generation_run(
+            problem_number=problem_number,
+            problem_name=problem_name,
+            difficulty=difficulty,
+            link=link,
+            code=code,
+            language=language,
+            prompt=repair_request["full_prompt"],
+            prompt_request=repair_request,
+            outcome=repair_outcome,
+            streamed=0,
+            wall_clock_ms=repair_wall_clock_ms,
+            run_kind="repair",
+            parent_run_id=record["run_id"],
+            include_repo_link=include_repo_link,
+        )
+
+    # A repair answers one targeted question; there is no post conversation to continue.
+    if run_kind != "repair" and not outcome["error_type"] and outcome["llm_response_text"]:
+        problem = {
+            "problem_number": problem_number,
+            "problem_name": problem_name,
+            "difficulty": difficulty,
+            "link": link,
+            "code": code,
+            "language": language,
+        }
+        remember_session(record["run_id"], _next_session(problem, include_repo_link, prompt_request, outcome))
+        if selected and run_kind not in ("refinement", "reuse") and not (outcome["cache_hit"] or outcome["coalesced"]):
+            _remember_explanation(problem, record, outcome)
+
+    return {
+        "text": outcome["response_text"],
+        "run_id": record["run_id"],
+        "model": record["model"],
+        "error_type": outcome["error_type"],
+        "http_status": outcome["http_status"],
+        "time_to_first_token_ms": record["time_to_first_token_ms"],
+        "wall_clock_ms": record["wall_clock_ms"],
+        "cache_hit": outcome["cache_hit"],
+        "coalesced": outcome["coalesced"],
+        "endpoint": outcome["endpoint"],
+        "request_timeout_seconds": record["request_timeout_seconds"],
+        "run_group_id": record["run_group_id"],
+        "parent_run_id": record["parent_run_id"],
+        "repaired_sections": record["repaired_sections"],
+        "reused_from_run_id": record["reused_from_run_id"],
+        "artifacts": outcome["response_data"].get("artifacts") or {},
+    }
+
+
+def _next_session(
+    problem: Dict[str, str],
+    include_repo_link: bool,
+    prompt_request: Dict[str, Any],
+    outcome: Dict[str, Any],
+) -> Dict[str, Any]:
+    """Refinement session for a finished run: the conversation so far plus Ollama's context ids.
+
+    ``model`` is the model that wrote the post (a cascade hop's, not always
+    OLLAMA_MODEL): its context ids mean nothing to any other model.
+    """
+    return {
+        "problem": problem,
+        "include_repo_link": include_repo_link,
+        "model": _outcome_model(prompt_request, outcome),
+        "layout": prompt_request["layout"],
+        "system": prompt_request["system"],
+        "history": prompt_request.get("history", []) + [
+            {"role": "user", "content": prompt_request["prompt"]},
+            # The post as returned: section repairs and explanation reuse splice into the model's text.
+            {"role": "assistant", "content": outcome["response_data"].get("response") or outcome["llm_response_text"]},
+        ],
+        "context": outcome["response_data"].get("context", []),
+    }
+
+
+def _tokens_per_sec(response_data: Dict[str, Any]) -> float:
+    response_tokens = response_data.get("response_tokens") or 0
+    generation_seconds = (response_data.get("generation_ms") or 0) / 1000
+    return response_tokens / generation_seconds if generation_seconds > 0 else 0.0
+
+
+def _report_to_slot(slot: Dict[str, Any], outcome: Dict[str, Any]) -> None:
+    outcome["endpoint"] = slot["base_url"]
+    slot["tokens_per_sec"] = _tokens_per_sec(outcome["response_data"])
+    slot["connection_failed"] = outcome["error_type"] == "CONNECTION_ERROR"
+    if outcome["error_type"] in RETRYABLE_ERROR_TYPES:
+        record_failure(slot["base_url"])
+    else:
+        record_success(slot["base_url"])
+
+
+def _apply_circuit_open(outcome: Dict[str, Any], base_url: str) -> None:
+    outcome["endpoint"] = base_url
+    outcome["error_type"] = "CIRCUIT_OPEN"
+    outcome["error_message"] = f"Circuit breaker open for {base_url}"
+    outcome["response_text"] = (
+        "Warning: Could not connect to Ollama (circuit breaker open after repeated failures)."
+    )
+
+
+def _should_retry(outcome: Dict[str, Any], attempt: int) -> bool:
+    # A streamed response that already reached the caller cannot be replayed cleanly.
+    return (
+        attempt < LLM_MAX_RETRIES
+        and outcome["error_type"] in RETRYABLE_ERROR_TYPES
+        and outcome["time_to_first_token_ms"] is None
+    )
+
+
+def _backoff_seconds(attempt: int) -> float:
+    """Exponential backoff with full jitter for the given (1-based) retry number."""
+    ceiling = min(LLM_RETRY_BACKOFF_MAX_SECONDS, LLM_RETRY_BACKOFF_SECONDS * (2 ** (attempt - 1)))
+    return random.uniform(0, ceiling)
+
+
+def _reset_outcome_for_retry(outcome: Dict[str, Any], retry_count: int) -> None:
+    request_timeout_seconds = outcome["request_timeout_seconds"]
+    outcome.update(_new_outcome())
+    outcome["retry_count"] = retry_count
+    outcome["request_timeout_seconds"] = request_timeout_seconds
+
+
+def _begin_attempt(slot: Dict[str, Any], outcome: Dict[str, Any], attempt: int) -> bool:
+    """Whether attempt number ``attempt`` (0 = first) may be sent to ``slot``; False ends the request."""
+    if not allow_request(slot["base_url"]):
+        # Mid-retry, keep the real error from the previous attempt.
+        if attempt == 0:
+            _apply_circuit_open(outcome, slot["base_url"])
+        return False
+    if attempt:
+        _reset_outcome_for_retry(outcome, attempt)
+    return True
+
+
+def _retry_delay(
+    outcome: Dict[str, Any], attempt: int, cancel_event: Optional[threading.Event] = None
+) -> Optional[float]:
+    """Backoff before retrying after attempt number ``attempt``, or None when ``outcome`` is final."""
+    if not _should_retry(outcome, attempt):
+        return None
+    if cancel_event is not None and cancel_event.is_set():
+        return None
+    return _backoff_seconds(attempt + 1)
+
+
+def _post_generation(
+    backend: Any,
+    generate_url: str,
+    payload: Dict[str, Any],
+    timeout_seconds: float,
+    stream: bool,
+) -> Any:
+    """POST to the server, or start the completion for an in-process backend (same response interface)."""
+    if backend.IN_PROCESS:
+        return backend.complete(payload, timeout_seconds=timeout_seconds, stream=stream)
+    return post_json(
+        generate_url,
+        payload,
+        timeout_seconds=timeout_seconds,
+        stream=stream,
+        headers=backend.request_headers(),
+    )
+
+
+def _send_generation_request(
+    slot: Dict[str, Any],
+    outcome: Dict[str, Any],
+    prompt_request: Dict[str, Any],
+    code: str,
+    language: str,
+    include_repo_link: bool,
+    on_chunk: Optional[Callable[[str], None]],
+    started_at: float,
+    cancel_event: Optional[threading.Event] = None,
+) -> None:
+    streamed = on_chunk is not None
+    backend = get_backend()
+    request_started_at = time.perf_counter()
+    deadline_at = request_started_at + outcome["request_timeout_seconds"]
+    try:
+        response = _post_generation(
+            backend,
+            slot["generate_url"],
+            _build_generation_payload(prompt_request, stream=streamed),
+            outcome["request_timeout_seconds"],
+            streamed,
+        )
+        if isinstance(cancel_event, _ClosingCancel):
+            cancel_event.attach(response)
+
+        if response.status_code != 200:
+            response.close()
+            _apply_http_status(outcome, response.status_code)
+        else:
+            outcome["http_status"] = response.status_code
+            if streamed:
+                with response:
+                    response_data, outcome["time_to_first_token_ms"] = _consume_stream(
+                        response,
+                        on_chunk,
+                        started_at,
+                        deadline_at,
+                        # Artifacts follow the last required section, so the stream must not be cut there.
+                        stop_when_complete=LLM_EARLY_STOP_ENABLED
+                        and not is_json_strategy()
+                        and not prompt_request.get("artifacts"),
+                        cancel_event=cancel_event,
+                    )
+            else:
+                response_data = backend.parse_response(
+                    response.json(), _local_timing(request_started_at, None, 0)
+                )
+            if response_data.get("done_reason") == CANCELLED_REASON:
+                _apply_cancelled(outcome, response_data)
+            else:
+                _apply_response_data(outcome, response_data, code, language, include_repo_link)
+                _extract_artifacts(outcome, prompt_request, code, language, include_repo_link)
+
+    except Exception as exc:
+        if cancel_event is not None and cancel_event.is_set():
+            _apply_cancelled(outcome, normalized_response(text="", done_reason=CANCELLED_REASON))
+        else:
+            _apply_error(outcome, _classify_requests_exception(exc), exc)
+
+
+def _request_generation(
+    outcome: Dict[str, Any],
+    prompt_request: Dict[str, Any],
+    code: str,
+    language: str,
+    include_repo_link: bool,
+    on_chunk: Optional[Callable[[str], None]],
+    started_at: float,
+    cancel_event: Optional[threading.Event] = None,
+) -> None:
+    """Send the generation request, retrying retryable failures with backoff."""
+    attempt = 0
+    while True:
+        with endpoint_slot() as slot:
+            if not _begin_attempt(slot, outcome, attempt):
+                return
+            _send_generation_request(
+                slot,
+                outcome,
+                prompt_request,
+                code,
+                language,
+                include_repo_link,
+                on_chunk,
+                started_at,
+                cancel_event=cancel_event,
+            )
+            _report_to_slot(slot, outcome)
+
+        delay_seconds = _retry_delay(outcome, attempt, cancel_event)
+        if delay_seconds is None:
+            return
+        attempt += 1
+        time.sleep(delay_seconds)
+
+
+# (analyze_response_quality flag, heading) of each required section, in post order.
+_REPAIRABLE_SECTIONS = [
+    ("has_intuition", "Intuition"),
+    ("has_approach", "Approach"),
+    ("has_time_complexity", "Time Complexity"),
+    ("has_space_complexity", "Space Complexity"),
+]
+
+_SECTION_REPAIR_PROMPT = """{details}
+A post explaining this solution is missing its "{heading}" section. The post so far:
+
+{post}
+
+Write only the missing section: the line "## {heading}" followed by its content, concise and technical.
+Do not repeat the other sections and do not include any code."""
+
+_TITLE_REPAIR_PROMPT = """{details}
+Write a new title for this post explaining the solution:
+
+{post}
+
+The title must mention the core technique and the time complexity (Big-O notation), be a complete
+phrase and be {limit} characters or fewer. Reply with one line: "Title: <title>"."""
+
+
+def _build_targeted_request(
+    prompt_request: Dict[str, Any], prompt: str, num_predict: int = LLM_REPAIR_NUM_PREDICT
+) -> Dict[str, Any]:
+    """Inline single-prompt request for a small follow-up question about ``prompt_request``'s post."""
+    estimate = estimate_prompt_tokens(prompt)
+    return {
+        "layout": "inline",
+        "system": "",
+        "prompt": prompt,
+        "full_prompt": prompt,
+        "tokens_saved": 0,
+        "code_truncated": prompt_request["code_truncated"],
+        "estimated_prompt_tokens": estimate["tokens"],
+        "token_estimate_method": estimate["method"],
+        "model": _request_model(prompt_request),
+        "num_predict": num_predict,
+    }
+
+
+def _send_targeted_request(
+    repair_request: Dict[str, Any], code: str, language: str
+) -> Tuple[Dict[str, Any], float]:
+    outcome = _new_outcome()
+    outcome["request_timeout_seconds"] = compute_request_timeout(
+        repair_request["estimated_prompt_tokens"], repair_request["model"]
+    )
+    started_at = time.perf_counter()
+    _request_generation(outcome, repair_request, code, language, False, None, started_at)
+    return outcome, (time.perf_counter() - started_at) * 1000
+
+
+def _repaired_section_body(text: str, heading: str) -> str:
+    """What the model wrote under ``## <heading>``, without the heading, code or any other section."""
+    post = parse_post(render_body(parse_post(text), TITLE_LETTER_COUNT))
+    body, starts = post["text"], post["section_starts"]
+    begin, end = 0, starts[0][0] if starts else len(body)
+    for index, (offset, key) in enumerate(starts):
+        if key.startswith(heading.lower()):
+            line_end = body.find("\n", offset)
+            begin = line_end + 1 if line_end != -1 else len(body)
+            end = starts[index + 1][0] if index + 1 < len(starts) else len(body)
+            break
+    return body[begin:end].strip()
+
+
+def _repaired_title(text: str) -> str:
+    post = parse_post(text)
+    value = post["titles"][0][2] if post["titles"] else post["first_line"]
+    value = " ".join(value.strip("\"'*# ").split())
+    if len(value) > TITLE_LETTER_COUNT:
+        # Still too long: cut at a word boundary rather than mid-word.
+        value = value[:TITLE_LETTER_COUNT + 1].rsplit(" ", 1)[0].rstrip(" ,:;-")
+    return value
+
+
+def _repair_post(
+    problem: Dict[str, str],
+    prompt_request: Dict[str, Any],
+    outcome: Dict[str, Any],
+    include_repo_link: bool,
+) -> List[Tuple[Dict[str, Any], Dict[str, Any], float]]:
+    """Fix a post's missing or empty sections and missing or over-long title in place, one small request each.
+
+    The per-section flags of ``analyze_response_quality``, plus any required
+    heading left empty, pick what to repair; each answer is spliced into the
+    model text and the post is recomposed, so the rest of the post is kept
+    byte for byte instead of regenerated. ``response_data``
+    then carries the repaired text, which is what gets cached and shared with
+    coalesced followers; ``llm_response_text`` keeps the model's original.
+    Returns (repair request, outcome, wall_clock_ms) per request, to be logged
+    as child runs. Off for LLM_REPAIR_ENABLED=false and the JSON strategy,
+    whose schema already requires every field.
+    """
+    if not LLM_REPAIR_ENABLED or outcome["error_type"] or is_json_strategy():
+        return []
+
+    # Artifacts, when requested, are already split off response_data's text.
+    analysis_text = outcome["response_data"].get("response") or outcome["llm_response_text"]
+    quality = analyze_response_quality(outcome["response_text"])
+    post = parse_post(analysis_text)
+    # A heading with nothing under it counts as present for the score but still needs writing.
+    missing = [
+        heading for flag, heading in _REPAIRABLE_SECTIONS if not quality[flag] or not section_body(post, heading)
+    ]
+    titles = post["titles"]
+    title_broken = not titles or len(titles[0][2]) > TITLE_LETTER_COUNT
+    if not missing and not title_broken:
+        return []
+
+    code, language = problem["code"], problem["language"]
+    details = _build_problem_details(
+        problem["problem_number"],
+        problem["problem_name"],
+        problem["difficulty"],
+        problem["link"],
+        prompt_request.get("prompt_code", code),
+        language,
+    )
+    repairs: List[Tuple[Dict[str, Any], Dict[str, Any], float]] = []
+    repaired: List[str] = []
+    for heading in missing:
+        post = parse_post(analysis_text)
+        repair_request = _build_targeted_request(
+            prompt_request,
+            _SECTION_REPAIR_PROMPT.format(
+                details=details, heading=heading, post=render_body(post, TITLE_LETTER_COUNT)
+            ),
+        )
+        repair_outcome, wall_clock_ms = _send_targeted_request(repair_request, code, language)
+        repairs.append((repair_request, repair_outcome, wall_clock_ms))
+        body = "" if repair_outcome["error_type"] else _repaired_section_body(
+            repair_outcome["llm_response_text"], heading
+        )
+        if body:
+            if section_body(post, heading) is not None:
+                analysis_text = replace_section(post, heading, body)
+            else:
+                later = [name.lower() for _, name in _REPAIRABLE_SECTIONS]
+                later = later[later.index(heading.lower()) + 1:]
+                analysis_text = insert_section(post, heading, body, before=later)
+            repaired.append(heading.lower().replace(" ", "_"))
+
+    if title_broken:
+        post = parse_post(analysis_text)
+        repair_request = _build_targeted_request(
+            prompt_request,
+            _TITLE_REPAIR_PROMPT.format(
+                details=details, post=render_body(post, TITLE_LETTER_COUNT), limit=TITLE_LETTER_COUNT
+            ),
+        )
+        repair_outcome, wall_clock_ms = _send_targeted_request(repair_request, code, language)
+        repairs.append((repair_request, repair_outcome, wall_clock_ms))
+        title = "" if repair_outcome["error_type"] else _repaired_title(repair_outcome["llm_response_text"])
+        if title:
+            analysis_text = set_title(post, title)
+            repaired.append("title")
+
+    if repaired:
+        outcome["response_text"] = _compose_final_output(analysis_text, code, language, include_repo_link)
+        # Ollama's context ids hold the unrepaired text; refinements replay the repaired history instead.
+        response_data = {key: value for key, value in outcome["response_data"].items() if key != "context"}
+        outcome["response_data"] = dict(response_data, response=analysis_text)
+        outcome["repaired_sections"] = ",".join(repaired)
+    return repairs
+
+
+_REUSE_PROMPT = """{details}
+This post was already written for the {source_language} solution of the same problem, which uses the
+same algorithm:
+
+{post}
+
+Adapt it to the {language} solution above. Reply only with the sections whose content must change for
+this code (data structures, library calls, complexity details), each starting with its "## " heading,
+in the same style. Do not repeat unchanged sections, do not write a title and do not include any code.
+Reply with NONE if nothing needs to change."""
+
+
+def _remember_explanation(problem: Dict[str, str], record: Dict[str, Any], outcome: Dict[str, Any]) -> None:
+    """Keep a complete post's explanation for later submissions of the problem in other languages."""
+    if is_json_strategy() or analyze_response_quality(outcome["response_text"])["format_score"] < 100:
+        return
+    store_explanation(
+        problem["problem_number"],
+        algorithm_fingerprint(problem["code"], problem["language"]),
+        problem["language"],
+        record["run_id"],
+        record["model"],
+        render_body(
+            parse_post(outcome["response_data"].get("response") or outcome["llm_response_text"]), TITLE_LETTER_COUNT
+        ),
+        record["total_tokens"],
+    )
+
+
+def _reuse_explanation(
+    problem: Dict[str, str],
+    prompt_request: Dict[str, Any],
+    include_repo_link: bool,
+) -> Optional[Tuple[Dict[str, Any], Dict[str, Any], float]]:
+    """Adapt a stored explanation of this problem from another language instead of generating cold.
+
+    Returns None when no explanation with the same algorithm fingerprint is
+    stored (or reuse is off, the JSON strategy is used, or artifacts are
+    requested, which a delta cannot produce). Otherwise one
+    delta request asks only for the sections that change for this code; they
+    replace their counterparts in the stored text, and the title, the
+    unchanged sections and the rest are kept. The returned outcome is the
+    finished post, with ``reused_from_run_id`` and ``reuse_tokens_saved``
+    (stored run's total tokens minus the delta's) set. A failed delta is
+    returned with its error so the caller can log it and fall back.
+    """
+    if is_json_strategy() or prompt_request.get("artifacts"):
+        return None
+    code, language = problem["code"], problem["language"]
+    source = find_explanation(problem["problem_number"], algorithm_fingerprint(code, language), language)
+    if source is None:
+        return None
+
+    details = _build_problem_details(
+        problem["problem_number"],
+        problem["problem_name"],
+        problem["difficulty"],
+        problem["link"],
+        prompt_request.get("prompt_code", code),
+        language,
+    )
+    reuse_request = _build_targeted_request(
+        prompt_request,
+        _REUSE_PROMPT.format(
+            details=details, source_language=source["language"], post=source["analysis_text"], language=language
+        ),
+        num_predict=LLM_REUSE_NUM_PREDICT,
+    )
+    outcome, wall_clock_ms = _send_targeted_request(reuse_request, code, language)
+    if outcome["error_type"]:
+        return reuse_request, outcome, wall_clock_ms
+
+    analysis_text = source["analysis_text"]
+    reply = parse_post(outcome["llm_response_text"])
+    for _, heading in _REPAIRABLE_SECTIONS:
+        if has_section(reply, heading.lower()):
+            body = _repaired_section_body(outcome["llm_response_text"], heading)
+            if body:
+                analysis_text = replace_section(parse_post(analysis_text), heading, body)
+
+    response_data = {key: value for key, value in outcome["response_data"].items() if key != "context"}
+    response_data["response"] = analysis_text
+    outcome["response_data"] = response_data
+    outcome["response_text"] = _compose_final_output(analysis_text, code, language, include_repo_link)
+    outcome["reused_from_run_id"] = source["run_id"] or ""
+    delta_tokens = response_data.get("prompt_tokens", 0) + response_data.get("response_tokens", 0)
+    outcome["reuse_tokens_saved"] = max(int(source["total_tokens"] or 0) - delta_tokens, 0)
+    return reuse_request, outcome, wall_clock_ms
+
+
+def _new_generation(
+    kind: str,
+    attempts: List[Tuple[Dict[str, Any], Dict[str, Any], float]],
+    winner: int,
+    started_at: float,
+    streamed: int = 0,
+    live: bool = False,
+) -> Dict[str, Any]:
+    """A finished generation strategy, in the same shape from the sync and async paths.
+
+    ``kind`` is the logged ``run_kind``: "" for one request, ``reuse`` for an
+    adapted explanation, and ``best_of_n``, ``hedge`` or ``cascade``, whose
+    attempts are logged as a group. ``attempts`` holds (request, outcome,
+    wall_clock_ms) per request sent and ``winner`` the one returned. ``live``
+    means the winner's text already reached ``on_chunk`` as it streamed.
+    """
+    return {
+        "kind": kind,
+        "attempts": attempts,
+        "winner": winner,
+        "started_at": started_at,
+        "streamed": streamed,
+        "live": live,
+        "repairs": [],
+    }
+
+
+def _raced_attempts(
+    prompt_request: Dict[str, Any], results: Dict[int, Tuple[Dict[str, Any], float]]
+) -> List[Tuple[Dict[str, Any], Dict[str, Any], float]]:
+    # Raced attempts all send the same request.
+    return [(prompt_request, *results[index]) for index in sorted(results)]
+
+
+def _winning_outcome(generation: Dict[str, Any]) -> Dict[str, Any]:
+    return generation["attempts"][generation["winner"]][1]
+
+
+def _cancelled_outcome(request_timeout_seconds: float) -> Dict[str, Any]:
+    """Outcome of an attempt that was abandoned before it reported anything."""
+    outcome = _new_outcome()
+    outcome["request_timeout_seconds"] = request_timeout_seconds
+    _apply_cancelled(outcome, normalized_response(text="", done_reason=CANCELLED_REASON))
+    return outcome
+
+
+def _reuse_generation(
+    problem: Dict[str, str],
+    prompt_request: Dict[str, Any],
+    include_repo_link: bool,
+) -> Optional[Dict[str, Any]]:
+    """The post adapted from a stored explanation (see ``_reuse_explanation``), or None.
+
+    A failed delta is logged on its own and None is returned, so the post is
+    generated in full.
+    """
+    started_at = time.perf_counter()
+    reuse = _reuse_explanation(problem, prompt_request, include_repo_link)
+    if reuse is None:
+        return None
+    reuse_request, outcome, wall_clock_ms = reuse
+    if outcome["error_type"]:
+        _log_generation_run(
+            **problem,
+            prompt=reuse_request["full_prompt"],
+            prompt_request=reuse_request,
+            outcome=outcome,
+            streamed=0,
+            wall_clock_ms=wall_clock_ms,
+            run_kind="reuse",
+            include_repo_link=include_repo_link,
+        )
+        return None
+    return _new_generation("reuse", [reuse], 0, started_at)
+
+
+def _generation_plan(best_of: Optional[int], streamed: bool) -> Dict[str, Any]:
+    """How a fresh post is generated; the sync and async paths only differ in how they send it.
+
+    Best-of-N (``best_of``, default LLM_BEST_OF_N) comes first, then the
+    cascade, then hedging, whose delay is the time to first token for
+    ``streamed`` requests and whole-request latency otherwise; else one
+    request.
+    """
+    attempts = _best_of_attempts(best_of)
+    if attempts > 1:
+        return {"strategy": "best_of_n", "attempts": attempts}
+    models = _cascade_models()
+    if models:
+        return {"strategy": "cascade", "models": models}
+    hedge_delay_seconds = compute_hedge_delay(streamed=streamed) if LLM_HEDGE_ENABLED else None
+    if hedge_delay_seconds is not None:
+        return {"strategy": "hedge", "hedge_delay_seconds": hedge_delay_seconds}
+    return {"strategy": "single"}
+
+
+def _run_generation_plan(
+    plan: Dict[str, Any],
+    problem: Dict[str, str],
+    prompt_request: Dict[str, Any],
+    outcome: Dict[str, Any],
+    include_repo_link: bool,
+    on_chunk: Optional[Callable[[str], None]],
+    started_at: float,
+) -> Dict[str, Any]:
+    """Send the requests of ``plan`` (see ``_generation_plan``); ``outcome`` is filled by a single request."""
+    if plan["strategy"] == "best_of_n":
+        return _generate_best_of_n(problem, prompt_request, plan["attempts"], include_repo_link)
+    if plan["strategy"] == "cascade":
+        return _generate_cascade(problem, prompt_request, plan["models"], include_repo_link, on_chunk)
+    if plan["strategy"] == "hedge":
+        return _generate_hedged(problem, prompt_request, plan["hedge_delay_seconds"], include_repo_link, on_chunk)
+    _request_generation(
+        outcome, prompt_request, problem["code"], problem["language"], include_repo_link, on_chunk, started_at
+    )
+    wall_clock_ms = (time.perf_counter() - started_at) * 1000
+    return _new_generation(
+        "", [(prompt_request, outcome, wall_clock_ms)], 0, started_at, int(on_chunk is not None), live=True
+    )
+
+
+def _repair_winner(problem: Dict[str, str], generation: Dict[str, Any], include_repo_link: bool) -> None:
+    """Repair the returned post (see ``_repair_post``); its latency then includes the repairs.
+
+    An adapted explanation is stitched from a complete post and is left alone.
+    """
+    if generation["kind"] == "reuse":
+        return
+    winner = generation["winner"]
+    request, outcome, _ = generation["attempts"][winner]
+    generation["repairs"] = _repair_post(problem, request, outcome, include_repo_link)
+    if generation["repairs"]:
+        wall_clock_ms = (time.perf_counter() - generation["started_at"]) * 1000
+        generation["attempts"][winner] = (request, outcome, wall_clock_ms)
+
+
+def _settle_generation(
+    problem: Dict[str, str],
+    prompt_request: Dict[str, Any],
+    cache_key: str,
+    generation: Dict[str, Any],
+    include_repo_link: bool,
+    on_chunk: Optional[Callable[[str], None]],
+) -> Dict[str, Any]:
+    """Cache the returned post, pass it to ``on_chunk`` unless it streamed there live, and log the generation."""
+    request, outcome, wall_clock_ms = generation["attempts"][generation["winner"]]
+    _store_in_cache(cache_key, prompt_request["full_prompt"], outcome)
+    text = outcome["response_data"].get("response") or outcome["llm_response_text"]
+    if on_chunk is not None and not generation["live"] and text:
+        on_chunk(text)
+
+    if generation["kind"] in ("", "reuse"):
+        return _log_generation_run(
+            **problem,
+            prompt=request["full_prompt"],
+            prompt_request=request,
+            outcome=outcome,
+            streamed=generation["streamed"],
+            wall_clock_ms=wall_clock_ms,
+            run_kind=generation["kind"],
+            include_repo_link=include_repo_link,
+            repairs=generation["repairs"],
+        )
+    return _log_run_group(problem, generation, include_repo_link)
+
+
+def _log_run_group(problem: Dict[str, str], generation: Dict[str, Any], include_repo_link: bool) -> Dict[str, Any]:
+    """Log every attempt of a best-of-N, hedged or cascade generation under one ``run_group_id``.
+
+    ``selected`` marks the returned attempt and ``is_hedge`` a hedge's
+    duplicate. Each attempt's ``wall_clock_ms`` runs from the start of the
+    generation, so the selected one carries the latency the caller actually
+    waited. Returns the selected attempt's result.
+    """
+    kind, winner = generation["kind"], generation["winner"]
+    run_group_id = str(uuid.uuid4())
+    selected_result: Dict[str, Any] = {}
+    for index, (request, outcome, wall_clock_ms) in enumerate(generation["attempts"]):
+        logged = _log_generation_run(
+            **problem,
+            prompt=request["full_prompt"],
+            prompt_request=request,
+            outcome=outcome,
+            streamed=generation["streamed"],
+            wall_clock_ms=wall_clock_ms,
+            run_group_id=run_group_id,
+            run_kind=kind,
+            selected=int(index == winner),
+            is_hedge=index if kind == "hedge" else 0,
+            include_repo_link=include_repo_link,
+            repairs=generation["repairs"] if index == winner else None,
+        )
+        if index == winner:
+            selected_result = logged
+    if kind == "best_of_n":
+        selected_result["attempts"] = len(generation["attempts"])
+    elif kind == "hedge":
+        selected_result["hedged"] = 1
+    elif kind == "cascade":
+        selected_result["model"] = _request_model(generation["attempts"][winner][0])
+        selected_result["cascade_hops"] = len(generation["attempts"])
+    return selected_result
+
+
+def _best_of_attempts(best_of: Optional[int]) -> int:
+    # More attempts than the servers run in parallel would only queue behind each other.
+    requested = LLM_BEST_OF_N if best_of is None else best_of
+    return max(1, min(requested, LLM_MAX_CONCURRENCY * len(OLLAMA_ENDPOINTS)))
+
+
+def _passes_quality_gate(outcome: Dict[str, Any]) -> bool:
+    if outcome["error_type"]:
+        return False
+    quality = analyze_response_quality(outcome["response_text"])
+    return quality["format_score"] >= LLM_BEST_OF_MIN_FORMAT_SCORE
+
+
+def _succeeded(outcome: Dict[str, Any]) -> bool:
+    return not outcome["error_type"]
+
+
+def _best_of_n_winner(results: Dict[int, Tuple[Dict[str, Any], float]], winner: Optional[int]) -> int:
+    """The attempt that passed the quality gate, else the best ``format_score`` (earliest on ties)."""
+    if winner is not None:
+        return winner
+    scored = [
+        (analyze_response_quality(outcome["response_text"])["format_score"], -index)
+        for index, (outcome, _) in results.items()
+        if not outcome["error_type"]
+    ]
+    return -max(scored)[1] if scored else 0
+
+
+def _generate_best_of_n(
+    problem: Dict[str, str],
+    prompt_request: Dict[str, Any],
+    attempts: int,
+    include_repo_link: bool,
+) -> Dict[str, Any]:
+    """Race ``attempts`` identical requests and keep the first that passes the quality gate.
+
+    Attempts are streamed internally so the losers can be cancelled mid-
+    generation once a winner is accepted; if none passes, the best
+    ``format_score`` wins. Every attempt is logged under one ``run_group_id``
+    with ``selected`` marking the returned run, so the extra token cost stays
+    visible next to the latency.
+    """
+    code, language = problem["code"], problem["language"]
+    request_timeout_seconds = compute_request_timeout(prompt_request["estimated_prompt_tokens"])
+    cancel_event = _ClosingCancel()
+    started_at = time.perf_counter()
+
+    def _attempt() -> Tuple[Dict[str, Any], float]:
+        outcome = _new_outcome()
+        outcome["request_timeout_seconds"] = request_timeout_seconds
+        _request_generation(
+            outcome,
+            prompt_request,
+            code,
+            language,
+            include_repo_link,
+            lambda piece: None,
+            started_at,
+            cancel_event=cancel_event,
+        )
+        return outcome, (time.perf_counter() - started_at) * 1000
+
+    results: Dict[int, Tuple[Dict[str, Any], float]] = {}
+    winner: Optional[int] = None
+    executor = ThreadPoolExecutor(max_workers=attempts)
+    try:
+        futures = {executor.submit(_attempt): index for index in range(attempts)}
+        pending = set(futures)
+        while pending and winner is None:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                index = futures[future]
+                results[index] = future.result()
+                if winner is None and _passes_quality_gate(results[index][0]):
+                    winner = index
+        if pending:
+            cancel_event.set()
+            # Closed streams return at once with their partial token counts.
+            done, _ = wait(pending, timeout=_CANCEL_GRACE_SECONDS)
+            for future in done:
+                results[futures[future]] = future.result()
+    finally:
+        # A loser still waiting for response headers cannot be interrupted; it is
+        # closed as soon as they arrive, without holding up the winner.
+        cancel_event.set()
+        executor.shutdown(wait=False)
+
+    for index in futures.values():
+        if index not in results:
+            results[index] = _cancelled_outcome(request_timeout_seconds), (time.perf_counter() - started_at) * 1000
+
+    winner = _best_of_n_winner(results, winner)
+    return _new_generation("best_of_n", _raced_attempts(prompt_request, results), winner, started_at, streamed=1)
+
+
+def _generate_hedged(
+    problem: Dict[str, str],
+    prompt_request: Dict[str, Any],
+    hedge_delay_seconds: float,
+    include_repo_link: bool,
+    on_chunk: Optional[Callable[[str], None]],
+) -> Dict[str, Any]:
+    """Send a duplicate request if the first has no token after ``hedge_delay_seconds``.
+
+    The request is streamed internally so its first token is visible; chunks
+    reach ``on_chunk`` live unless a hedge was sent, in which case the
+    winner's text is passed on once. The first attempt to finish without an
+    error wins and the other is cancelled. A hedged pair is logged under one
+    ``run_group_id`` (``run_kind`` = ``hedge``, ``is_hedge`` marks the
+    duplicate); an unhedged request is logged as an ordinary run.
+    """
+    code, language = problem["code"], problem["language"]
+    request_timeout_seconds = compute_request_timeout(prompt_request["estimated_prompt_tokens"])
+    started_at = time.perf_counter()
+    # Set on the primary's first token or when it finishes, whichever comes first.
+    primary_progress = threading.Event()
+    forward_lock = threading.Lock()
+    hedge_state = {"hedged": False}
+    cancels = [_ClosingCancel(), _ClosingCancel()]
+
+    def _attempt(index: int) -> Tuple[Dict[str, Any], float]:
+        outcome = _new_outcome()
+        outcome["request_timeout_seconds"] = request_timeout_seconds
+
+        def _forward(piece: str) -> None:
+            with forward_lock:
+                if index == 0 and not hedge_state["hedged"]:
+                    primary_progress.set()
+                    if on_chunk is not None:
+                        on_chunk(piece)
+
+        try:
+            _request_generation(
+                outcome,
+                prompt_request,
+                code,
+                language,
+                include_repo_link,
+                _forward,
+                started_at,
+                cancel_event=cancels[index],
+            )
+        finally:
+            if index == 0:
+                primary_progress.set()
+        return outcome, (time.perf_counter() - started_at) * 1000
+
+    results: Dict[int, Tuple[Dict[str, Any], float]] = {}
+    winner: Optional[int] = None
+    executor = ThreadPoolExecutor(max_workers=2)
+    try:
+        futures = {executor.submit(_attempt, 0): 0}
+        primary_progress.wait(hedge_delay_seconds)
+        with forward_lock:
+            hedge_state["hedged"] = not primary_progress.is_set()
+        if hedge_state["hedged"]:
+            futures[executor.submit(_attempt, 1)] = 1
+
+        pending = set(futures)
+        while pending and winner is None:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                index = futures[future]
+                results[index] = future.result()
+                if winner is None and _succeeded(results[index][0]):
+                    winner = index
+    finally:
+        # A loser still waiting for response headers cannot be interrupted; it is
+        # closed as soon as they arrive, without holding up the winner.
+        for index in futures.values():
+            if index not in results:
+                cancels[index].set()
+        executor.shutdown(wait=False)
+
+    for index in futures.values():
+        if index not in results:
+            results[index] = _cancelled_outcome(request_timeout_seconds), (time.perf_counter() - started_at) * 1000
+
+    hedged = hedge_state["hedged"]
+    return _new_generation(
+        "hedge" if hedged else "",
+        _raced_attempts(prompt_request, results),
+        winner if winner is not None else 0,
+        started_at,
+        streamed=1,
+        live=not hedged,
+    )
+
+
+def _cascade_models() -> List[str]:
+    """Models to try in order (LLM_CASCADE_MODELS, then OLLAMA_MODEL); empty when the cascade is off."""
+    # An in-process backend serves a single model file, so there is nothing to escalate to.
+    if get_backend().IN_PROCESS:
+        return []
+    fast_models = [model for model in LLM_CASCADE_MODELS if model != OLLAMA_MODEL]
+    return fast_models + [OLLAMA_MODEL] if fast_models else []
+
+
+def _passes_cascade_gate(outcome: Dict[str, Any]) -> bool:
+    """Accept a post whose format score is high enough and whose title needed no cut."""
+    if outcome["error_type"]:
+        return False
+    if analyze_response_quality(outcome["response_text"])["format_score"] < LLM_CASCADE_MIN_FORMAT_SCORE:
+        return False
+    # The final post has titles cut to TITLE_LETTER_COUNT already, so check the model's own text.
+    return _titles_fit(outcome["llm_response_text"])
+
+
+def _cascade_hop(prompt_request: Dict[str, Any], model: str) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+    """Request and fresh outcome for the cascade hop to ``model``."""
+    hop_request = dict(prompt_request, model=model)
+    outcome = _new_outcome()
+    outcome["request_timeout_seconds"] = compute_request_timeout(prompt_request["estimated_prompt_tokens"], model)
+    return hop_request, outcome
+
+
+def _cascade_winner(hops: List[Tuple[Dict[str, Any], Dict[str, Any], float]]) -> int:
+    """Index of the hop to return.
+
+    A hop that passed the gate is always the last one tried. Without one the
+    largest model's post is returned, or the best-scoring earlier post when
+    that request failed.
+    """
+    last = len(hops) - 1
+    if not hops[last][1]["error_type"]:
+        return last
+    scored = [
+        (analyze_response_quality(outcome["response_text"])["format_score"], index)
+        for index, (_, outcome, _) in enumerate(hops)
+        if not outcome["error_type"]
+    ]
+    return max(scored)[1] if scored else last
+
+
+def _cascade_generation(
+    hops: List[Tuple[Dict[str, Any], Dict[str, Any], float]],
+    models: List[str],
+    started_at: float,
+    streamed: int,
+) -> Dict[str, Any]:
+    """Pick and label the returned hop; only the last model streams to ``on_chunk`` live."""
+    winner = _cascade_winner(hops)
+    winning_request, winning_outcome, _ = hops[winner]
+    # The cache entry and coalesced followers get the text without the hop's request; they log this model.
+    if not winning_outcome["error_type"]:
+        winning_outcome["response_data"]["model"] = _request_model(winning_request)
+    return _new_generation("cascade", hops, winner, started_at, streamed, live=winner == len(models) - 1)
+
+
+def _generate_cascade(
+    problem: Dict[str, str],
+    prompt_request: Dict[str, Any],
+    models: List[str],
+    include_repo_link: bool,
+    on_chunk: Optional[Callable[[str], None]],
+) -> Dict[str, Any]:
+    """Try ``models`` from fastest to largest and stop at the first post that passes the cascade gate.
+
+    Only the last model's text is final, so earlier hops stream internally
+    (early stop still applies) and an accepted early post reaches ``on_chunk``
+    once; the last model streams live. Every hop is logged under one
+    ``run_group_id`` (``run_kind`` = ``cascade``).
+    """
+    code, language = problem["code"], problem["language"]
+    started_at = time.perf_counter()
+    hops: List[Tuple[Dict[str, Any], Dict[str, Any], float]] = []
+    for index, model in enumerate(models):
+        is_last = index == len(models) - 1
+        hop_request, outcome = _cascade_hop(prompt_request, model)
+        hop_chunk = on_chunk if is_last or on_chunk is None else (lambda piece: None)
+        _request_generation(outcome, hop_request, code, language, include_repo_link, hop_chunk, started_at)
+        hops.append((hop_request, outcome, (time.perf_counter() - started_at) * 1000))
+        if _passes_cascade_gate(outcome):
+            break
+    return _cascade_generation(hops, models, started_at, int(on_chunk is not None))
+
+
+def generate_solution_post_with_metadata(
+    problem_number: str,
+    problem_name: str,
+    difficulty: str,
+    link: str,
+    code: str,
+    language: str,
+    include_repo_link: bool = True,
+    on_chunk: Optional[Callable[[str], None]] = None,
+    best_of: Optional[int] = None,
+    artifacts: Optional[Sequence[str]] = None,
+    bypass_cache: bool = False,
+) -> Dict[str, Any]:
+    """Generate a structured post through Ollama and return text plus run metadata.
+
+    When ``on_chunk`` is given the request is streamed and each incremental
+    piece of model text is passed to it as soon as it arrives. ``best_of``
+    (default LLM_BEST_OF_N) above 1 races that many attempts instead; see
+    ``_generate_best_of_n``. Otherwise LLM_CASCADE_MODELS are tried before
+    OLLAMA_MODEL (``_generate_cascade``), or with LLM_HEDGE_ENABLED a stalled
+    request is hedged; see ``_generate_hedged``. A problem already explained
+    in another language is adapted from that explanation first; see
+    ``_reuse_explanation``.
+
+    ``artifacts`` (e.g. ``["readme_blurb", "changelog_line"]``, see
+    ``services.artifacts``) are generated in the same request and returned
+    by name in ``result["artifacts"]``; the post text never contains them.
+
+    ``bypass_cache`` regenerates for real: the cached post, an identical
+    request already in flight and a stored explanation are all ignored. Only
+    a post that passes validation replaces the cached one.
+    """
+
+    prompt_request = build_generation_request(
+        problem_number=problem_number,
+        problem_name=problem_name,
+        difficulty=difficulty,
+        link=link,
+        code=code,
+        language=language,
+        artifacts=artifacts,
+    )
+    prompt = prompt_request["full_prompt"]
+
+    outcome = _new_outcome()
+    outcome["request_timeout_seconds"] = compute_request_timeout(prompt_request["estimated_prompt_tokens"])
+    streamed = int(on_chunk is not None)
+    cache_key = _response_cache_key(prompt)
+
+    started_at = time.perf_counter()
+    cached = None if bypass_cache else get_cached_response(cache_key)
+    flight, shared = None, None
+    if cached is None and not bypass_cache:
+        # An identical request already running elsewhere in this process is joined, not repeated.
+        flight, is_leader = join_flight(cache_key)
+        if not is_leader:
+            shared = wait_for_flight(flight, outcome["request_timeout_seconds"])
+            flight = None
+
+    landed = None
+    try:
+        if cached is not None or shared is not None:
+            if cached is not None:
+                _apply_cached_response(outcome, cached, code, language, include_repo_link)
+            else:
+                _apply_coalesced_response(outcome, shared, code, language, include_repo_link)
+            if on_chunk is not None and outcome["llm_response_text"]:
+                on_chunk(outcome["llm_response_text"])
+        else:
+            problem = {
+                "problem_number": problem_number,
+                "problem_name": problem_name,
+                "difficulty": difficulty,
+                "link": link,
+                "code": code,
+                "language": language,
+            }
+            generation = None if bypass_cache else _reuse_generation(problem, prompt_request, include_repo_link)
+            if generation is None:
+                plan = _generation_plan(best_of, streamed=True)
+                generation = _run_generation_plan(
+                    plan, problem, prompt_request, outcome, include_repo_link, on_chunk, started_at
+                )
+                _repair_winner(problem, generation, include_repo_link)
+            landed = _winning_outcome(generation)
+            return _settle_generation(problem, prompt_request, cache_key, generation, include_repo_link, on_chunk)
+    finally:
+        if flight is not None:
+            land_flight(cache_key, flight, landed)
+
+    wall_clock_ms = (time.perf_counter() - started_at) * 1000
+    _store_in_cache(cache_key, prompt, outcome)
+
+    return _log_generation_run(
+        problem_number=problem_number,
+        problem_name=problem_name,
+        difficulty=difficulty,
+        link=link,
+        code=code,
+        language=language,
+        prompt=prompt,
+        prompt_request=prompt_request,
+        outcome=outcome,
+        streamed=streamed,
+        wall_clock_ms=wall_clock_ms,
+        include_repo_link=include_repo_link,
+    )
+
+
+def generate_solution_post_streaming(
+    problem_number: str,
+    problem_name: str,
+    difficulty: str,
+    link: str,
+    code: str,
+    language: str,
+    on_chunk: Callable[[str], None],
+    include_repo_link: bool = True,
+    artifacts: Optional[Sequence[str]] = None,
+    bypass_cache: bool = False,
+) -> Dict[str, Any]:
+    """Streaming variant of generate_solution_post_with_metadata."""
+    return generate_solution_post_with_metadata(
+        problem_number=problem_number,
+        problem_name=problem_name,
+        difficulty=difficulty,
+        link=link,
+        code=code,
+        language=language,
+        include_repo_link=include_repo_link,
+        on_chunk=on_chunk,
+        artifacts=artifacts,
+        bypass_cache=bypass_cache,
+    )
+
+
+_REFINEMENT_PROMPT = """Revise the post you just wrote: {instruction}
+Reply with the complete revised post in the same format as before, still without the solution code."""
+
+
+def _build_refinement_request(session: Dict[str, Any], instruction: str) -> Dict[str, Any]:
+    prompt = _REFINEMENT_PROMPT.format(instruction=instruction.strip())
+    # Without Ollama's context ids every earlier turn is evaluated again.
+    evaluated = prompt
+    if not session["context"]:
+        turns = [turn["content"] for turn in session["history"]]
+        evaluated = "\n\n".join([session["system"]] + turns + [prompt])
+    estimate = estimate_prompt_tokens(evaluated)
+    return {
+        "layout": session["layout"],
+        "system": session["system"],
+        "prompt": prompt,
+        "full_prompt": prompt,
+        "history": session["history"],
+        "context": session["context"],
+        "model": session["model"],
+        "tokens_saved": 0,
+        "code_truncated": 0,
+        "estimated_prompt_tokens": estimate["tokens"],
+        "token_estimate_method": estimate["method"],
+    }
+
+
+def refine_solution_post(
+    run_id: str,
+    instruction: str,
+    on_chunk: Optional[Callable[[str], None]] = None,
+) -> Dict[str, Any]:
+    """Apply a follow-up ``instruction`` (e.g. "shorten the title") to the post of ``run_id``.
+
+    The earlier conversation is reused from the run's refinement session, so
+    on Ollama only the instruction is evaluated. It runs on the model that
+    wrote the post, which for a cascade may be a fast model. The result is logged as a
+    child run (``parent_run_id`` = ``run_id``, ``run_kind`` = ``refinement``)
+    and can itself be refined. Refinements bypass the response cache.
+    """
+    session = get_session(run_id)
+    if session is None:
+        raise ValueError(f"Run {run_id!r} cannot be refined: it is unknown, failed or has no model response")
+
+    problem = session["problem"]
+    prompt_request = _build_refinement_request(session, instruction)
+    outcome = _new_outcome()
+    outcome["request_timeout_seconds"] = compute_request_timeout(
+        prompt_request["estimated_prompt_tokens"], prompt_request["model"]
+    )
+
+    started_at = time.perf_counter()
+    _request_generation(
+        outcome,
+        prompt_request,
+        problem["code"],
+        problem["language"],
+        session["include_repo_link"],
+        on_chunk,
+        started_at,
+    )
+    wall_clock_ms = (time.perf_counter() - started_at) * 1000
+
+    return _log_generation_run(
+        **problem,
+        prompt=prompt_request["full_prompt"],
+        prompt_request=prompt_request,
+        outcome=outcome,
+        streamed=int(on_chunk is not None),
+        wall_clock_ms=wall_clock_ms,
+        run_kind="refinement",
+        parent_run_id=run_id,
+        include_repo_link=session["include_repo_link"],
+    )
+
+
+def _classify_httpx_exception(exc: BaseException) -> str:
+    import httpx
+
+    if isinstance(exc, httpx.TimeoutException):
+        return "TIMEOUT"
+    if isinstance(exc, httpx.ConnectError):
+        return "CONNECTION_ERROR"
+    if isinstance(exc, httpx.HTTPError):
+        return "REQUEST_ERROR"
+    return "UNEXPECTED_ERROR"
+
+
+def _new_async_client(concurrency: int):
+    import httpx
+
+    connections = max(concurrency, OLLAMA_POOL_SIZE)
+    return httpx.AsyncClient(
+        timeout=httpx.Timeout(LLM_TIMEOUT_SECONDS, connect=OLLAMA_CONNECT_TIMEOUT_SECONDS),
+        limits=httpx.Limits(max_connections=connections, max_keepalive_connections=connections),
+    )
+
+
+async def _asend_generation_request(
+    client,
+    slot: Dict[str, Any],
+    outcome: Dict[str, Any],
+    prompt_request: Dict[str, Any],
+    code: str,
+    language: str,
+    include_repo_link: bool,
+) -> None:
+    import httpx
+
+    backend = get_backend()
+    if backend.IN_PROCESS:
+        # The model runs in this process; keep it off the event loop.
+        await asyncio.to_thread(
+            _send_generation_request,
+            slot,
+            outcome,
+            prompt_request,
+            code,
+            language,
+            include_repo_link,
+            None,
+            time.perf_counter(),
+        )
+        return
+
+    request_started_at = time.perf_counter()
+    try:
+        response = await client.post(
+            slot["generate_url"],
+            json=_build_generation_payload(prompt_request, stream=False),
+            headers=backend.request_headers(),
+            timeout=httpx.Timeout(outcome["request_timeout_seconds"], connect=OLLAMA_CONNECT_TIMEOUT_SECONDS),
+            extensions={"trace": trace_async_connection},
+        )
+        if response.status_code != 200:
+            _apply_http_status(outcome, response.status_code)
+        else:
+            outcome["http_status"] = response.status_code
+            response_data = backend.parse_response(response.json(), _local_timing(request_started_at, None, 0))
+            _apply_response_data(outcome, response_data, code, language, include_repo_link)
+            _extract_artifacts(outcome, prompt_request, code, language, include_repo_link)
+    except Exception as exc:
+        _apply_error(outcome, _classify_httpx_exception(exc), exc)
+
+
+async def _arequest_generation(
+    client,
+    outcome: Dict[str, Any],
+    prompt_request: Dict[str, Any],
+    code: str,
+    language: str,
+    include_repo_link: bool,
+) -> None:
+    """Async ``_request_generation`` (unstreamed); the retry decisions are the same."""
+    attempt = 0
+    while True:
+        with endpoint_slot() as slot:
+            if not _begin_attempt(slot, outcome, attempt):
+                return
+            await _asend_generation_request(
+                client, slot, outcome, prompt_request, code, language, include_repo_link
+            )
+            _report_to_slot(slot, outcome)
+
+        delay_seconds = _retry_delay(outcome, attempt)
+        if delay_seconds is None:
+            return
+        attempt += 1
+        await asyncio.sleep(delay_seconds)
+
+
+async def _arace(
+    client,
+    request_timeout_seconds: float,
+    prompt_request: Dict[str, Any],
+    code: str,
+    language: str,
+    include_repo_link: bool,
+    started_at: float,
+    accept: Callable[[Dict[str, Any]], bool],
+    attempts: int = 1,
+    hedge_delay_seconds: Optional[float] = None,
+) -> Tuple[Dict[int, Tuple[Dict[str, Any], float]], Optional[int]]:
+    """Race unstreamed attempts as tasks; the first one ``accept`` takes wins.
+
+    ``attempts`` start at once; with ``hedge_delay_seconds`` one more (the
+    hedge) starts if none has replied by then. Once a winner is accepted the
+    other tasks are cancelled, which closes their connections so the servers
+    stop generating. Returns every attempt's (outcome, wall_clock_ms) and the
+    winning index, None when no attempt was accepted.
+    """
+
+    async def _attempt() -> Tuple[Dict[str, Any], float]:
+        outcome = _new_outcome()
+        outcome["request_timeout_seconds"] = request_timeout_seconds
+        try:
+            await _arequest_generation(client, outcome, prompt_request, code, language, include_repo_link)
+        except asyncio.CancelledError:
+            _apply_cancelled(outcome, normalized_response(text="", done_reason=CANCELLED_REASON))
+        return outcome, (time.perf_counter() - started_at) * 1000
+
+    tasks = {asyncio.create_task(_attempt()): index for index in range(attempts)}
+    results: Dict[int, Tuple[Dict[str, Any], float]] = {}
+    winner: Optional[int] = None
+    try:
+        if hedge_delay_seconds is not None:
+            done, _ = await asyncio.wait(set(tasks), timeout=hedge_delay_seconds)
+            if not done:
+                tasks[asyncio.create_task(_attempt())] = len(tasks)
+
+        pending = set(tasks)
+        while pending:
+            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                index = tasks[task]
+                results[index] = task.result()
+                if winner is None and accept(results[index][0]):
+                    winner = index
+                    for other in pending:
+                        other.cancel()
+    finally:
+        # Reached with tasks still running only when the caller itself was cancelled.
+        for task in tasks:
+            task.cancel()
+    return results, winner
+
+
+async def _arun_generation_plan(
+    client,
+    plan: Dict[str, Any],
+    problem: Dict[str, str],
+    prompt_request: Dict[str, Any],
+    outcome: Dict[str, Any],
+    include_repo_link: bool,
+    started_at: float,
+) -> Dict[str, Any]:
+    """Async ``_run_generation_plan``: the same strategies, unstreamed, with tasks instead of threads."""
+    code, language = problem["code"], problem["language"]
+    if plan["strategy"] == "best_of_n":
+        results, winner = await _arace(
+            client,
+            outcome["request_timeout_seconds"],
+            prompt_request,
+            code,
+            language,
+            include_repo_link,
+            started_at,
+            _passes_quality_gate,
+            attempts=plan["attempts"],
+        )
+        winner = _best_of_n_winner(results, winner)
+        return _new_generation("best_of_n", _raced_attempts(prompt_request, results), winner, started_at)
+
+    if plan["strategy"] == "hedge":
+        results, winner = await _arace(
+            client,
+            outcome["request_timeout_seconds"],
+            prompt_request,
+            code,
+            language,
+            include_repo_link,
+            started_at,
+            _succeeded,
+            hedge_delay_seconds=plan["hedge_delay_seconds"],
+        )
+        kind = "hedge" if len(results) > 1 else ""
+        return _new_generation(
+            kind, _raced_attempts(prompt_request, results), winner if winner is not None else 0, started_at
+        )
+
+    if plan["strategy"] == "cascade":
+        models = plan["models"]
+        hops: List[Tuple[Dict[str, Any], Dict[str, Any], float]] = []
+        for model in models:
+            hop_request, hop_outcome = await asyncio.to_thread(_cascade_hop, prompt_request, model)
+            await _arequest_generation(client, hop_outcome, hop_request, code, language, include_repo_link)
+            hops.append((hop_request, hop_outcome, (time.perf_counter() - started_at) * 1000))
+            if _passes_cascade_gate(hop_outcome):
+                break
+        return _cascade_generation(hops, models, started_at, 0)
+
+    await _arequest_generation(client, outcome, prompt_request, code, language, include_repo_link)
+    wall_clock_ms = (time.perf_counter() - started_at) * 1000
+    return _new_generation("", [(prompt_request, outcome, wall_clock_ms)], 0, started_at)
+
+
+async def agenerate_solution_post_with_metadata(
+    problem_number: str,
+    problem_name: str,
+    difficulty: str,
+    link: str,
+    code: str,
+    language: str,
+    include_repo_link: bool = True,
+    client=None,
+    semaphore: Optional[asyncio.Semaphore] = None,
+    best_of: Optional[int] = None,
+    artifacts: Optional[Sequence[str]] = None,
+    bypass_cache: bool = False,
+) -> Dict[str, Any]:
+    """Async counterpart of generate_solution_post_with_metadata.
+
+    ``client`` is an ``httpx.AsyncClient`` shared across calls; ``semaphore``
+    bounds how many problems are generated at once (best-of-N and hedging
+    race their attempts inside one slot). Requests are not streamed, so
+    hedging waits on whole-request latency.
+    """
+
+    prompt_request = build_generation_request(
+        problem_number=problem_number,
+        problem_name=problem_name,
+        difficulty=difficulty,
+        link=link,
+        code=code,
+        language=language,
+        artifacts=artifacts,
+    )
+    prompt = prompt_request["full_prompt"]
+
+    outcome = _new_outcome()
+    outcome["request_timeout_seconds"] = await asyncio.to_thread(
+        compute_request_timeout, prompt_request["estimated_prompt_tokens"]
+    )
+    cache_key = _response_cache_key(prompt)
+
+    started_at = time.perf_counter()
+    cached = None if bypass_cache else await asyncio.to_thread(get_cached_response, cache_key)
+    flight, shared = None, None
+    if cached is None and not bypass_cache:
+        flight, is_leader = join_flight(cache_key)
+        if not is_leader:
+            shared = await await_flight(flight, outcome["request_timeout_seconds"])
+            flight = None
+
+    if cached is not None:
+        _apply_cached_response(outcome, cached, code, language, include_repo_link)
+    elif shared is not None:
+        _apply_coalesced_response(outcome, shared, code, language, include_repo_link)
+    else:
+        owns_client = client is None
+        if owns_client:
+            client = _new_async_client(LLM_MAX_CONCURRENCY)
+        semaphore = semaphore or asyncio.Semaphore(LLM_MAX_CONCURRENCY)
+        plan = await asyncio.to_thread(_generation_plan, best_of, False)
+        problem = {
+            "problem_number": problem_number,
+            "problem_name": problem_name,
+            "difficulty": difficulty,
+            "link": link,
+            "code": code,
+            "language": language,
+        }
+        landed = None
+        try:
+            async with semaphore:
+                started_at = time.perf_counter()
+                # Explanation reuse and repairs are small sync requests; they run in a worker
+                # thread inside the same slot.
+                generation = None
+                if not bypass_cache:
+                    generation = await asyncio.to_thread(
+                        _reuse_generation, problem, prompt_request, include_repo_link
+                    )
+                if generation is None:
+                    generation = await _arun_generation_plan(
+                        client, plan, problem, prompt_request, outcome, include_repo_link, started_at
+                    )
+                    await asyncio.to_thread(_repair_winner, problem, generation, include_repo_link)
+            landed = _winning_outcome(generation)
+        finally:
+            if flight is not None:
+                land_flight(cache_key, flight, landed)
+            if owns_client:
+                await client.aclose()
+        # SQLite logging and Excel export are blocking, so keep them off the event loop.
+        return await asyncio.to_thread(
+            _settle_generation, problem, prompt_request, cache_key, generation, include_repo_link, None
+        )
+
+    wall_clock_ms = (time.perf_counter() - started_at) * 1000
+    await asyncio.to_thread(_store_in_cache, cache_key, prompt, outcome)
+    return await asyncio.to_thread(
+        _log_generation_run,
+        problem_number=problem_number,
+        problem_name=problem_name,
+        difficulty=difficulty,
+        link=link,
+        code=code,
+        language=language,
+        prompt=prompt,
+        prompt_request=prompt_request,
+        outcome=outcome,
+        streamed=0,
+        wall_clock_ms=wall_clock_ms,
+        include_repo_link=include_repo_link,
+    )
+
+
+async def agenerate_many(
+    specs: List[Dict[str, Any]],
+    concurrency: Optional[int] = None,
+) -> AsyncIterator[Tuple[int, Dict[str, Any]]]:
+    """Generate posts for many problem specs, yielding ``(index, result)`` as each completes.
+
+    Each spec holds the keyword arguments of generate_solution_post_with_metadata
+    (problem_number, problem_name, difficulty, link, code, language and optionally
+    include_repo_link, best_of, artifacts and bypass_cache). At most ``concurrency``
+    problems are generated at once. Closing the iterator early cancels the requests that have not finished yet.
+    """
+    limit = max(1, concurrency or LLM_MAX_CONCURRENCY)
+    semaphore = asyncio.Semaphore(limit)
+
+    async with _new_async_client(limit) as client:
+
+        async def _run(index: int, spec: Dict[str, Any]) -> Tuple[int, Dict[str, Any]]:
+            result = await agenerate_solution_post_with_metadata(
+                **spec, client=client, semaphore=semaphore
+            )
+            return index, result
+
+        pending = {asyncio.create_task(_run(index, spec)) for index, spec in enumerate(specs)}
+        try:
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    yield task.result()
+        finally:
+            for task in pending:
+                task.cancel()
+            if pending:
+                await asyncio.gather(*pending, return_exceptions=True)
+
+
+def generate_many(
+    specs: List[Dict[str, Any]],
+    on_result: Callable[[int, Dict[str, Any]], Optional[bool]],
+    concurrency: Optional[int] = None,
+) -> None:
+    """Blocking driver for agenerate_many.
+
+    ``on_result`` is called with ``(index, result)`` in completion order; returning
+    True from it stops the batch and cancels the remaining requests.
+    """
+
+    async def _drive() -> None:
+        results = agenerate_many(specs, concurrency=concurrency)
+        try:
+            async for index, result in results:
+                if on_result(index, result):
+                    break
+        finally:
+            await results.aclose()
+
+    asyncio.run(_drive())
+
+
+def generate_solution_post(
+    problem_number: str,
+    problem_name: str,
+    difficulty: str,
+    link: str,
+    code: str,
+    language: str,
+    include_repo_link: bool = True,
+) -> str:
+    result = generate_solution_post_with_metadata(
+        problem_number=problem_number,
+        problem_name=problem_name,
+        difficulty=difficulty,
+        link=link,
+        code=code,
+        language=language,
+        include_repo_link=include_repo_link,
+    )
+    return result["text"]
@@ -0,0 +1,202 @@
+"""Section map of a generated post, built once and shared by every consumer.
+
+Composition (dropping code fences and a trailing ``## Code`` section), title
+enforcement and quality scoring each used to rescan the whole response with
+their own regular expressions. ``parse_post`` locates the few structural
+markers (line-start ``##`` headings, ``Title:`` lines and triple-backtick
+fences) with C-level substring scans and then visits each marker once, so
+the Python work grows with the number of markers rather than with the text.
+"""
+
+import re
+from bisect import bisect_left
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+FENCE = "```"
+
+_TITLE_LINE = re.compile(r"\ntitle:", re.IGNORECASE)
+
+
+def count_lines(text: str) -> int:
+    """Same as ``len(text.splitlines())`` for ``\\n`` and ``\\r\\n`` text, without building the list."""
+    if not text:
+        return 0
+    return text.count("\n") + (0 if text.endswith("\n") else 1)
+
+
+def _find_all(text: str, needle: str) -> List[int]:
+    offsets: List[int] = []
+    index = text.find(needle)
+    while index != -1:
+        offsets.append(index)
+        index = text.find(needle, index + len(needle))
+    return offsets
+
+
+def _heading_key(name: str) -> str:
+    # "Time  Complexity:" -> "time complexity:", matched as a prefix ending on a word boundary.
+    return " ".join(name.lower().split())
+
+
+def _key_matches(key: str, name: str) -> bool:
+    if not key.startswith(name):
+        return False
+    following = key[len(name):len(name) + 1]
+    return not (following.isalnum() or following == "_")
+
+
+def parse_post(text: str) -> Dict[str, Any]:
+    """Return the section map of ``text`` after stripping surrounding whitespace.
+
+    Offsets refer to the stripped ``text`` in the result. ``fences`` holds the
+    (start, end) spans of paired triple-backtick fences; an unpaired trailing
+    fence is not a span and the text after it counts as ordinary text, as it
+    did for the regexes this replaces. ``sections`` holds the normalized names
+    of ``## `` headings anywhere in the post, ``section_starts`` the
+    (offset, name) of those outside fences, ``titles`` the ``Title:`` lines
+    outside fences as (start, end, value), and ``code_offset`` the first
+    ``## Code`` heading outside a fence.
+    """
+    content = (text or "").strip()
+
+    fence_offsets = _find_all(content, FENCE)
+    fences = [
+        (fence_offsets[index], fence_offsets[index + 1] + len(FENCE))
+        for index in range(0, len(fence_offsets) - 1, 2)
+    ]
+
+    def _fenced(offset: int) -> bool:
+        # An odd number of fence markers before ``offset`` means an open fence,
+        # unless it is the unpaired last one.
+        index = bisect_left(fence_offsets, offset)
+        return index % 2 == 1 and index < len(fence_offsets)
+
+    heading_offsets = [offset + 1 for offset in _find_all(content, "\n##")]
+    if content.startswith("##"):
+        heading_offsets.insert(0, 0)
+
+    sections: List[str] = []
+    section_starts: List[Tuple[int, str]] = []
+    code_offset: Optional[int] = None
+    for offset in heading_offsets:
+        if content.startswith("###", offset):
+            continue
+        end = content.find("\n", offset)
+        rest = content[offset + 2:end] if end != -1 else content[offset + 2:]
+        name = rest.lstrip()
+        key = _heading_key(name)
+        if len(name) < len(rest):
+            sections.append(key)
+        if _fenced(offset):
+            continue
+        section_starts.append((offset, key))
+        if code_offset is None and _key_matches(key, "code"):
+            code_offset = offset
+
+    title_offsets = [match.start() + 1 for match in _TITLE_LINE.finditer(content)]
+    if content[:6].lower() == "title:":
+        title_offsets.insert(0, 0)
+
+    titles: List[Tuple[int, int, str]] = []
+    for offset in title_offsets:
+        end = content.find("\n", offset)
+        if end == -1:
+            end = len(content)
+        value = content[offset + 6:end].lstrip()
+        if value and not _fenced(offset):
+            titles.append((offset, end, value))
+
+    return {
+        "text": content,
+        "first_line": content.partition("\n")[0].strip(),
+        "has_fence": bool(fence_offsets),
+        "fences": fences,
+        "sections": sections,
+        "section_starts": section_starts,
+        "titles": titles,
+        "code_offset": code_offset,
+    }
+
+
+def has_section(post: Dict[str, Any], name: str) -> bool:
+    """True when a ``## <name>`` heading (whitespace after ``##``) appears anywhere in the post."""
+    return any(_key_matches(key, name) for key in post["sections"])
+
+
+def section_body(post: Dict[str, Any], name: str) -> Optional[str]:
+    """Stripped content of the first unfenced ``## <name>`` section, or None when there is none."""
+    text = post["text"]
+    name = _heading_key(name)
+    starts = post["section_starts"]
+    for index, (offset, key) in enumerate(starts):
+        if _key_matches(key, name):
+            end = starts[index + 1][0] if index + 1 < len(starts) else len(text)
+            line_end = text.find("\n", offset, end)
+            return text[line_end + 1:end].strip() if line_end != -1 else ""
+    return None
+
+
+def render_body(post: Dict[str, Any], title_limit: int) -> str:
+    """Post text without fenced blocks or a ``## Code`` section, titles cut to ``title_limit``."""
+    text = post["text"]
+    end = post["code_offset"] if post["code_offset"] is not None else len(text)
+
+    edits: List[Tuple[int, int, str]] = [(start, stop, "") for start, stop in post["fences"]]
+    for start, stop, value in post["titles"]:
+        if len(value) > title_limit:
+            value = value[:title_limit].rstrip()
+        edits.append((start, stop, f"Title: {value}"))
+    edits.sort()
+
+    pieces: List[str] = []
+    cursor = 0
+    for start, stop, replacement in edits:
+        if start >= end:
+            break
+        pieces.append(text[cursor:start])
+        pieces.append(replacement)
+        cursor = min(stop, end)
+    pieces.append(text[cursor:end])
+    return "".join(pieces).strip()
+
+
+def insert_section(post: Dict[str, Any], heading: str, body: str, before: Sequence[str]) -> str:
+    """Post text with ``## <heading>`` added ahead of the first unfenced section named in ``before``.
+
+    Without such a section it goes ahead of ``## Code``, else at the end.
+    """
+    text = post["text"]
+    names = list(before) + ["code"]
+    offset = next(
+        (start for start, key in post["section_starts"] if any(_key_matches(key, name) for name in names)),
+        None,
+    )
+    block = f"## {heading}\n{body.strip()}"
+    if offset is None:
+        return f"{text}\n\n{block}".strip()
+    return f"{text[:offset]}{block}\n\n{text[offset:]}"
+
+
+def replace_section(post: Dict[str, Any], heading: str, body: str) -> str:
+    """Post text with the content of the first unfenced ``## <heading>`` section replaced by ``body``.
+
+    A post without that section gets it added ahead of ``## Code``, else at the end.
+    """
+    text = post["text"]
+    name = _heading_key(heading)
+    starts = post["section_starts"]
+    for index, (offset, key) in enumerate(starts):
+        if _key_matches(key, name):
+            end = starts[index + 1][0] if index + 1 < len(starts) else len(text)
+            rest = f"\n\n{text[end:]}" if end < len(text) else ""
+            return f"{text[:offset]}## {heading}\n{body.strip()}{rest}"
+    return insert_section(post, heading, body, before=[])
+
+
+def set_title(post: Dict[str, Any], title: str) -> str:
+    """Post text with the first ``Title:`` line replaced by ``title``, or a title line added on top."""
+    text = post["text"]
+    if not post["titles"]:
+        return f"Title: {title}\n\n{text}".strip()
+    start, stop, _ = post["titles"][0]
+    return f"{text[:start]}Title: {title}{text[stop:]}"
@@ -1,716 +1,1402 @@
-import hashlib
-import os
-import re
-import sqlite3
-import uuid
-from difflib import SequenceMatcher
-from datetime import datetime
-from typing import Any, Dict, List, Optional
-
-from openpyxl import Workbook
-
-
-RUN_COLUMNS = [
-    "run_id",
-    "timestamp",
-    "problem_number",
-    "problem_name",
-    "problem_link",
-    "difficulty",
-    "language",
-    "model",
-    "prompt_version",
-    "prompt_strategy",
-    "prompt_hash",
-    "prompt_preview",
-    "prompt_text",
-    "prompt_chars",
-    "prompt_lines",
-    "code_chars",
-    "code_lines",
-    "code_sha256",
-    "code_text",
-    "prompt_tokens",
-    "response_tokens",
-    "total_tokens",
-    "output_input_ratio",
-    "total_duration_ms",
-    "load_duration_ms",
-    "prompt_eval_ms",
-    "generation_ms",
-    "tokens_per_sec",
-    "http_status",
-    "error_type",
-    "retry_count",
-    "timeout_flag",
-    "llm_returned_code_block",
-    "code_appended_externally",
-    "llm_response_chars",
-    "llm_response_lines",
-    "llm_response_text",
-    "response_chars",
-    "response_lines",
-    "has_title",
-    "has_intuition",
-    "has_approach",
-    "has_time_complexity",
-    "has_space_complexity",
-    "has_code_block",
-    "format_score",
-    "completeness_score",
-    "manual_edit_distance",
-    "accepted_for_posting",
-    "error_message",
-]
-
-
-MIGRATION_COLUMNS = {
-    "problem_link": "TEXT",
-    "prompt_strategy": "TEXT",
-    "prompt_hash": "TEXT",
-    "prompt_preview": "TEXT",
-    "prompt_text": "TEXT",
-    "code_sha256": "TEXT",
-    "code_text": "TEXT",
-    "llm_returned_code_block": "INTEGER",
-    "code_appended_externally": "INTEGER",
-    "llm_response_chars": "INTEGER",
-    "llm_response_lines": "INTEGER",
-    "llm_response_text": "TEXT",
-}
-
-
-def _base_dir() -> str:
-    return os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-
-
-def get_metrics_paths() -> Dict[str, str]:
-    stats_dir = os.path.join(_base_dir(), "llm_stats")
-    return {
-        "stats_dir": stats_dir,
-        "db_path": os.path.join(stats_dir, "runs.db"),
-        "excel_path": os.path.join(stats_dir, "token_usage.xlsx"),
-    }
-
-
-def _connect() -> sqlite3.Connection:
-    paths = get_metrics_paths()
-    os.makedirs(paths["stats_dir"], exist_ok=True)
-    conn = sqlite3.connect(paths["db_path"])
-    conn.row_factory = sqlite3.Row
-    return conn
-
-
-def ensure_metrics_storage() -> None:
-    conn = _connect()
-    try:
-        conn.execute(
-            """
-            CREATE TABLE IF NOT EXISTS llm_runs (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                run_id TEXT UNIQUE NOT NULL,
-                timestamp TEXT NOT NULL,
-                problem_number TEXT,
-                problem_name TEXT,
-                problem_link TEXT,
-                difficulty TEXT,
-                language TEXT,
-                model TEXT,
-                prompt_version TEXT,
-                prompt_strategy TEXT,
-                prompt_hash TEXT,
-                prompt_preview TEXT,
-                prompt_text TEXT,
-                prompt_chars INTEGER,
-                prompt_lines INTEGER,
-                code_chars INTEGER,
-                code_lines INTEGER,
-                code_sha256 TEXT,
-                code_text TEXT,
-                prompt_tokens INTEGER,
-                response_tokens INTEGER,
-                total_tokens INTEGER,
-                output_input_ratio REAL,
-                total_duration_ms REAL,
-                load_duration_ms REAL,
-                prompt_eval_ms REAL,
-                generation_ms REAL,
-                tokens_per_sec REAL,
-                http_status INTEGER,
-                error_type TEXT,
-                retry_count INTEGER,
-                timeout_flag INTEGER,
-                llm_returned_code_block INTEGER,
-                code_appended_externally INTEGER,
-                llm_response_chars INTEGER,
-                llm_response_lines INTEGER,
-                llm_response_text TEXT,
-                response_chars INTEGER,
-                response_lines INTEGER,
-                has_title INTEGER,
-                has_intuition INTEGER,
-                has_approach INTEGER,
-                has_time_complexity INTEGER,
-                has_space_complexity INTEGER,
-                has_code_block INTEGER,
-                format_score REAL,
-                completeness_score REAL,
-                manual_edit_distance INTEGER,
-                accepted_for_posting INTEGER,
-                error_message TEXT
-            )
-            """
-        )
-        conn.execute(
-            "CREATE INDEX IF NOT EXISTS idx_llm_runs_timestamp ON llm_runs(timestamp)"
-        )
-        conn.execute(
-            "CREATE INDEX IF NOT EXISTS idx_llm_runs_problem ON llm_runs(problem_number)"
-        )
-        _migrate_metrics_schema(conn)
-        conn.commit()
-    finally:
-        conn.close()
-
-
-def _migrate_metrics_schema(conn: sqlite3.Connection) -> None:
-    existing = {row[1] for row in conn.execute("PRAGMA table_info(llm_runs)").fetchall()}
-    for column_name, column_type in MIGRATION_COLUMNS.items():
-        if column_name not in existing:
-            conn.execute(f"ALTER TABLE llm_runs ADD COLUMN {column_name} {column_type}")
-
-
-def _safe_int(value: Any, default: int = 0) -> int:
-    try:
-        if value is None:
-            return default
-        return int(value)
-    except (TypeError, ValueError):
-        return default
-
-
-def _safe_float(value: Any, default: float = 0.0) -> float:
-    try:
-        if value is None:
-            return default
-        return float(value)
-    except (TypeError, ValueError):
-        return default
-
-
-def _ns_to_ms(nanos: Any) -> float:
-    return _safe_float(nanos) / 1_000_000
-
-
-def _sha256_hex(value: str) -> str:
-    return hashlib.sha256((value or "").encode("utf-8")).hexdigest()
-
-
-def _build_prompt_preview(prompt: str, max_len: int = 280) -> str:
-    compact = " ".join((prompt or "").split())
-    if len(compact) <= max_len:
-        return compact
-    return compact[: max_len - 3] + "..."
-
-
-# Max column width cap — long text fields (prompt_text, code_text, etc.) can be
-# thousands of chars; we cap at 80 so the sheet stays usable.
-_EXCEL_MAX_COL_WIDTH = 80
-_EXCEL_MIN_COL_WIDTH = 10
-
-
-def _autofit_columns(ws) -> None:
-    """Set each column width to fit its header + a small margin, capped at 80."""
-    for col_cells in ws.iter_cols():
-        header = str(col_cells[0].value or "")
-        # Sample up to 20 data rows to find a representative value width.
-        sample_max = max(
-            (len(str(cell.value or "")) for cell in col_cells[1:21]),
-            default=0,
-        )
-        width = max(len(header) + 4, min(sample_max + 2, _EXCEL_MAX_COL_WIDTH), _EXCEL_MIN_COL_WIDTH)
-        ws.column_dimensions[col_cells[0].column_letter].width = width
-
-
-def _prepare_export_row(row: Dict[str, Any]) -> Dict[str, Any]:
-    """Normalize missing legacy fields so Excel output is analysis-friendly."""
-    normalized = dict(row)
-
-    _LEGACY_MARKER = "legacy"
-    _DASH = "—"
-
-    if not normalized.get("prompt_strategy"):
-        normalized["prompt_strategy"] = _LEGACY_MARKER
-
-    if not normalized.get("problem_link"):
-        normalized["problem_link"] = _DASH
-
-    if not normalized.get("prompt_text"):
-        normalized["prompt_text"] = _DASH
-
-    if not normalized.get("code_text"):
-        normalized["code_text"] = _DASH
-
-    if not normalized.get("llm_response_text"):
-        normalized["llm_response_text"] = _DASH
-
-    if not normalized.get("prompt_preview"):
-        raw = normalized.get("prompt_text", "")
-        normalized["prompt_preview"] = _build_prompt_preview(raw) if raw != _DASH else _DASH
-
-    if not normalized.get("prompt_hash"):
-        raw = normalized.get("prompt_text", "")
-        normalized["prompt_hash"] = _sha256_hex(raw) if raw != _DASH else _DASH
-
-    if not normalized.get("code_sha256"):
-        raw = normalized.get("code_text", "")
-        normalized["code_sha256"] = _sha256_hex(raw) if raw != _DASH else _DASH
-
-    if not normalized.get("llm_response_chars"):
-        raw = normalized.get("llm_response_text", "")
-        normalized["llm_response_chars"] = len(raw) if raw != _DASH else 0
-
-    if not normalized.get("llm_response_lines"):
-        raw = normalized.get("llm_response_text", "")
-        normalized["llm_response_lines"] = len(raw.splitlines()) if raw != _DASH else 0
-
-    return normalized
-
-
-def analyze_response_quality(text: str) -> Dict[str, Any]:
-    content = (text or "").strip()
-    first_non_empty = ""
-    for line in content.splitlines():
-        if line.strip():
-            first_non_empty = line.strip()
-            break
-
-    has_title = bool(first_non_empty and not first_non_empty.startswith("#"))
-    has_intuition = bool(re.search(r"^##\s+Intuition\b", content, flags=re.IGNORECASE | re.MULTILINE))
-    has_approach = bool(re.search(r"^##\s+Approach\b", content, flags=re.IGNORECASE | re.MULTILINE))
-    has_time_complexity = bool(
-        re.search(r"^##\s+Time\s+Complexity\b", content, flags=re.IGNORECASE | re.MULTILINE)
-    )
-    has_space_complexity = bool(
-        re.search(r"^##\s+Space\s+Complexity\b", content, flags=re.IGNORECASE | re.MULTILINE)
-    )
-    has_code_block = "```" in content
-
-    checks = [
-        has_title,
-        has_intuition,
-        has_approach,
-        has_time_complexity,
-        has_space_complexity,
-        has_code_block,
-    ]
-    completeness_score = round((sum(int(x) for x in checks) / len(checks)) * 100, 2)
-
-    # Weighted score favors correctly formatted markdown structure.
-    format_score = round(
-        (20 * int(has_title))
-        + (15 * int(has_intuition))
-        + (15 * int(has_approach))
-        + (15 * int(has_time_complexity))
-        + (15 * int(has_space_complexity))
-        + (20 * int(has_code_block)),
-        2,
-    )
-
-    return {
-        "has_title": int(has_title),
-        "has_intuition": int(has_intuition),
-        "has_approach": int(has_approach),
-        "has_time_complexity": int(has_time_complexity),
-        "has_space_complexity": int(has_space_complexity),
-        "has_code_block": int(has_code_block),
-        "format_score": format_score,
-        "completeness_score": completeness_score,
-    }
-
-
-def build_run_record(
-    *,
-    problem_number: str,
-    problem_name: str,
-    difficulty: str,
-    language: str,
-    model: str,
-    prompt_version: str,
-    prompt: str,
-    code: str,
-    response_text: str,
-    problem_link: str = "",
-    prompt_strategy: str = "",
-    llm_response_text: Optional[str] = None,
-    response_data: Optional[Dict[str, Any]] = None,
-    http_status: Optional[int] = None,
-    error_type: str = "",
-    error_message: str = "",
-    llm_returned_code_block: Optional[int] = None,
-    code_appended_externally: int = 0,
-    retry_count: int = 0,
-    timeout_flag: int = 0,
-    manual_edit_distance: Optional[int] = None,
-    accepted_for_posting: Optional[int] = None,
-) -> Dict[str, Any]:
-    response_data = response_data or {}
-    llm_text = llm_response_text if llm_response_text is not None else response_text
-    final_output = response_text or ""
-
-    prompt_tokens = _safe_int(response_data.get("prompt_eval_count"))
-    response_tokens = _safe_int(response_data.get("eval_count"))
-    total_tokens = prompt_tokens + response_tokens
-
-    total_duration_ns = response_data.get("total_duration", 0)
-    load_duration_ns = response_data.get("load_duration", 0)
-    prompt_eval_ns = response_data.get("prompt_eval_duration", 0)
-    generation_ns = response_data.get("eval_duration", 0)
-
-    output_input_ratio = 0.0
-    if prompt_tokens > 0:
-        output_input_ratio = round(response_tokens / prompt_tokens, 4)
-
-    tokens_per_sec = 0.0
-    generation_seconds = _safe_float(generation_ns) / 1_000_000_000
-    if generation_seconds > 0:
-        tokens_per_sec = round(response_tokens / generation_seconds, 4)
-
-    quality = analyze_response_quality(final_output)
-    prompt_hash = _sha256_hex(prompt or "")
-    code_sha256 = _sha256_hex(code or "")
-
-    if llm_returned_code_block is None:
-        llm_returned_code_block = int("```" in (llm_text or "") or "## Code" in (llm_text or ""))
-
-    now = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-
-    return {
-        "run_id": str(uuid.uuid4()),
-        "timestamp": now,
-        "problem_number": str(problem_number or ""),
-        "problem_name": str(problem_name or ""),
-        "problem_link": str(problem_link or ""),
-        "difficulty": str(difficulty or ""),
-        "language": str(language or ""),
-        "model": str(model or ""),
-        "prompt_version": str(prompt_version or ""),
-        "prompt_strategy": str(prompt_strategy or ""),
-        "prompt_hash": prompt_hash,
-        "prompt_preview": _build_prompt_preview(prompt),
-        "prompt_text": str(prompt or ""),
-        "prompt_chars": len(prompt or ""),
-        "prompt_lines": len((prompt or "").splitlines()),
-        "code_chars": len(code or ""),
-        "code_lines": len((code or "").splitlines()),
-        "code_sha256": code_sha256,
-        "code_text": str(code or ""),
-        "prompt_tokens": prompt_tokens,
-        "response_tokens": response_tokens,
-        "total_tokens": total_tokens,
-        "output_input_ratio": output_input_ratio,
-        "total_duration_ms": round(_ns_to_ms(total_duration_ns), 2),
-        "load_duration_ms": round(_ns_to_ms(load_duration_ns), 2),
-        "prompt_eval_ms": round(_ns_to_ms(prompt_eval_ns), 2),
-        "generation_ms": round(_ns_to_ms(generation_ns), 2),
-        "tokens_per_sec": tokens_per_sec,
-        "http_status": _safe_int(http_status, default=0),
-        "error_type": str(error_type or ""),
-        "retry_count": _safe_int(retry_count, default=0),
-        "timeout_flag": _safe_int(timeout_flag, default=0),
-        "llm_returned_code_block": _safe_int(llm_returned_code_block, default=0),
-        "code_appended_externally": _safe_int(code_appended_externally, default=0),
-        "llm_response_chars": len(llm_text or ""),
-        "llm_response_lines": len((llm_text or "").splitlines()),
-        "llm_response_text": str(llm_text or ""),
-        "response_chars": len(final_output),
-        "response_lines": len(final_output.splitlines()),
-        "has_title": quality["has_title"],
-        "has_intuition": quality["has_intuition"],
-        "has_approach": quality["has_approach"],
-        "has_time_complexity": quality["has_time_complexity"],
-        "has_space_complexity": quality["has_space_complexity"],
-        "has_code_block": quality["has_code_block"],
-        "format_score": quality["format_score"],
-        "completeness_score": quality["completeness_score"],
-        "manual_edit_distance": manual_edit_distance,
-        "accepted_for_posting": accepted_for_posting,
-        "error_message": str(error_message or ""),
-    }
-
-
-def log_run_record(record: Dict[str, Any], export_excel: bool = True) -> None:
-    ensure_metrics_storage()
-    conn = _connect()
-    try:
-        placeholders = ", ".join("?" for _ in RUN_COLUMNS)
-        columns = ", ".join(RUN_COLUMNS)
-        values = [record.get(col) for col in RUN_COLUMNS]
-        conn.execute(
-            f"INSERT INTO llm_runs ({columns}) VALUES ({placeholders})",
-            values,
-        )
-        conn.commit()
-    finally:
-        conn.close()
-
-    if export_excel:
-        export_runs_to_excel()
-
-
-def estimate_edit_distance(original_text: str, edited_text: str) -> int:
-    """Approximate edit distance using sequence ratio and max length."""
-    original = original_text or ""
-    edited = edited_text or ""
-    if not original and not edited:
-        return 0
-    ratio = SequenceMatcher(a=original, b=edited).ratio()
-    return int(round((1 - ratio) * max(len(original), len(edited))))
-
-
-def update_run_feedback(
-    run_id: str,
-    accepted_for_posting: Optional[int] = None,
-    manual_edit_distance: Optional[int] = None,
-    export_excel: bool = True,
-) -> None:
-    ensure_metrics_storage()
-    conn = _connect()
-    try:
-        conn.execute(
-            """
-            UPDATE llm_runs
-            SET accepted_for_posting = COALESCE(?, accepted_for_posting),
-                manual_edit_distance = COALESCE(?, manual_edit_distance)
-            WHERE run_id = ?
-            """,
-            (accepted_for_posting, manual_edit_distance, run_id),
-        )
-        conn.commit()
-    finally:
-        conn.close()
-
-    if export_excel:
-        export_runs_to_excel()
-
-
-def fetch_recent_runs(limit: int = 200) -> List[Dict[str, Any]]:
-    ensure_metrics_storage()
-    conn = _connect()
-    try:
-        cursor = conn.execute(
-            f"SELECT {', '.join(RUN_COLUMNS)} FROM llm_runs ORDER BY id DESC LIMIT ?",
-            (limit,),
-        )
-        rows = cursor.fetchall()
-        return [dict(row) for row in rows]
-    finally:
-        conn.close()
-
-
-def fetch_metrics_summary() -> Dict[str, Any]:
-    ensure_metrics_storage()
-    conn = _connect()
-    try:
-        total_runs = conn.execute("SELECT COUNT(*) FROM llm_runs").fetchone()[0]
-        success_runs = conn.execute(
-            "SELECT COUNT(*) FROM llm_runs WHERE COALESCE(error_type, '') = ''"
-        ).fetchone()[0]
-        failed_runs = total_runs - success_runs
-        timeout_runs = conn.execute(
-            "SELECT COUNT(*) FROM llm_runs WHERE timeout_flag = 1"
-        ).fetchone()[0]
-
-        avg_tokens_per_sec = conn.execute(
-            "SELECT AVG(tokens_per_sec) FROM llm_runs WHERE tokens_per_sec > 0"
-        ).fetchone()[0]
-        avg_total_duration_ms = conn.execute(
-            "SELECT AVG(total_duration_ms) FROM llm_runs WHERE total_duration_ms > 0"
-        ).fetchone()[0]
-        avg_completeness = conn.execute(
-            "SELECT AVG(completeness_score) FROM llm_runs WHERE completeness_score IS NOT NULL"
-        ).fetchone()[0]
-        avg_format = conn.execute(
-            "SELECT AVG(format_score) FROM llm_runs WHERE format_score IS NOT NULL"
-        ).fetchone()[0]
-
-        return {
-            "total_runs": total_runs,
-            "success_runs": success_runs,
-            "failed_runs": failed_runs,
-            "timeout_runs": timeout_runs,
-            "avg_tokens_per_sec": round(avg_tokens_per_sec or 0.0, 2),
-            "avg_total_duration_ms": round(avg_total_duration_ms or 0.0, 2),
-            "avg_completeness_score": round(avg_completeness or 0.0, 2),
-            "avg_format_score": round(avg_format or 0.0, 2),
-        }
-    finally:
-        conn.close()
-
-
-def export_runs_to_excel() -> Dict[str, str]:
-    ensure_metrics_storage()
-    paths = get_metrics_paths()
-
-    conn = _connect()
-    try:
-        cursor = conn.execute(
-            f"SELECT {', '.join(RUN_COLUMNS)} FROM llm_runs ORDER BY id ASC"
-        )
-        rows = [_prepare_export_row(dict(row)) for row in cursor.fetchall()]
-    finally:
-        conn.close()
-
-    wb = Workbook()
-    usage_ws = wb.active
-    usage_ws.title = "Usage"
-    usage_ws.append(RUN_COLUMNS)
-
-    for row in rows:
-        usage_ws.append([row.get(col) for col in RUN_COLUMNS])
-
-    _autofit_columns(usage_ws)
-
-    summary = fetch_metrics_summary()
-    summary_ws = wb.create_sheet(title="Summary")
-    summary_ws.append(["Metric", "Value"])
-    for key, value in summary.items():
-        summary_ws.append([key, value])
-
-    prompt_ws = wb.create_sheet(title="PromptVersionSummary")
-    prompt_ws.append(
-        [
-            "prompt_version",
-            "prompt_strategy",
-            "model",
-            "prompt_hash",
-            "runs",
-            "avg_completeness",
-            "avg_format",
-            "avg_tokens_per_sec",
-            "avg_output_input_ratio",
-        ]
-    )
-
-    conn = _connect()
-    try:
-        grouped = conn.execute(
-            """
-            SELECT
-                COALESCE(prompt_version, '') AS prompt_version,
-                COALESCE(prompt_strategy, '') AS prompt_strategy,
-                COALESCE(model, '') AS model,
-                COALESCE(prompt_hash, '') AS prompt_hash,
-                COUNT(*) AS runs,
-                AVG(completeness_score) AS avg_completeness,
-                AVG(format_score) AS avg_format,
-                AVG(tokens_per_sec) AS avg_tokens_per_sec,
-                AVG(output_input_ratio) AS avg_output_input_ratio
-            FROM llm_runs
-            GROUP BY
-                COALESCE(prompt_version, ''),
-                COALESCE(prompt_strategy, ''),
-                COALESCE(model, ''),
-                COALESCE(prompt_hash, '')
-            ORDER BY runs DESC
-            """
-        ).fetchall()
-    finally:
-        conn.close()
-
-    for row in grouped:
-        prompt_ws.append(
-            [
-                row["prompt_version"],
-                row["prompt_strategy"],
-                row["model"],
-                row["prompt_hash"],
-                row["runs"],
-                round(row["avg_completeness"] or 0.0, 2),
-                round(row["avg_format"] or 0.0, 2),
-                round(row["avg_tokens_per_sec"] or 0.0, 2),
-                round(row["avg_output_input_ratio"] or 0.0, 4),
-            ]
-        )
-
-    model_ws = wb.create_sheet(title="ModelSummary")
-    model_ws.append(["model", "runs", "avg_tokens_per_sec", "avg_duration_ms", "avg_completeness"])
-
-    conn = _connect()
-    try:
-        model_rows = conn.execute(
-            """
-            SELECT
-                COALESCE(model, '') AS model,
-                COUNT(*) AS runs,
-                AVG(tokens_per_sec) AS avg_tokens_per_sec,
-                AVG(total_duration_ms) AS avg_duration_ms,
-                AVG(completeness_score) AS avg_completeness
-            FROM llm_runs
-            GROUP BY COALESCE(model, '')
-            ORDER BY runs DESC
-            """
-        ).fetchall()
-    finally:
-        conn.close()
-
-    for row in model_rows:
-        model_ws.append(
-            [
-                row["model"],
-                row["runs"],
-                round(row["avg_tokens_per_sec"] or 0.0, 2),
-                round(row["avg_duration_ms"] or 0.0, 2),
-                round(row["avg_completeness"] or 0.0, 2),
-            ]
-        )
-
-    # Legend sheet — explains field meanings and legacy placeholder values
-    legend_ws = wb.create_sheet(title="Legend")
-    legend_ws.append(["Field / Value", "Meaning"])
-    legend_data = [
-        ["prompt_strategy = 'legacy'", "Run logged before prompt strategy tracking was added (pre-v2)"],
-        ["problem_link = '\u2014'", "Problem link was not captured (pre-v2 run)"],
-        ["prompt_text = '\u2014'", "Prompt text was not captured (pre-v2 run)"],
-        ["code_text = '\u2014'", "Solution code was not captured (pre-v2 run)"],
-        ["llm_response_text = '\u2014'", "Raw LLM response was not captured (pre-v2 run)"],
-        ["code_appended_externally = 1", "Code was appended locally (not generated by LLM)"],
-        ["llm_returned_code_block = 1", "LLM included a code block despite instructions not to"],
-        ["format_score", "Weighted score 0\u2013100 based on presence of required markdown sections"],
-        ["completeness_score", "Percentage of required sections present in the output"],
-        ["output_input_ratio", "response_tokens / prompt_tokens \u2014 higher = more verbose output"],
-        ["tokens_per_sec", "LLM generation speed"],
-        ["", ""],
-        ["NOTE", "All rows with '\u2014' are legacy runs. Generate a new post to see fully-populated data."],
-    ]
-    for entry in legend_data:
-        legend_ws.append(entry)
-    _autofit_columns(legend_ws)
-
-    primary_path = paths["excel_path"]
-    try:
-        wb.save(primary_path)
-        return {"path": primary_path, "status": "ok", "message": ""}
-    except PermissionError:
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        fallback_path = os.path.join(paths["stats_dir"], f"token_usage_{timestamp}.xlsx")
-        try:
-            wb.save(fallback_path)
-            return {
-                "path": fallback_path,
-                "status": "permission_error",
-                "message": (
-                    f"token_usage.xlsx is open in another program. "
-                    f"Saved to {os.path.basename(fallback_path)} instead. "
-                    "Close the file in Excel and re-export to overwrite the main file."
-                ),
-            }
-        except Exception as exc:
-            return {
-                "path": "",
-                "status": "error",
-                "message": f"Export failed: {exc}",
-            }
-    except Exception as exc:
-        return {"path": "", "status": "error", "message": f"Export failed: {exc}"}
-
+import hashlib
+import os
+import sqlite3
+import uuid
+from difflib import SequenceMatcher
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+
+from openpyxl import Workbook
+
+from services.markdown_sections import count_lines, has_section, parse_post
+
+
+RUN_COLUMNS = [
+    "run_id",
+    "run_group_id",
+    "run_kind",
+    "selected",
+    "is_hedge",
+    "parent_run_id",
+    "repaired_sections",
+    "reused_from_run_id",
+    "reuse_tokens_saved",
+    "artifacts",
+    "timestamp",
+    "problem_number",
+    "problem_name",
+    "problem_link",
+    "difficulty",
+    "language",
+    "model",
+    "prompt_version",
+    "prompt_strategy",
+    "prompt_layout",
+    "prompt_hash",
+    "prompt_preview",
+    "prompt_text",
+    "prompt_chars",
+    "prompt_lines",
+    "prompt_tokens_saved",
+    "code_truncated",
+    "code_chars",
+    "code_lines",
+    "code_sha256",
+    "code_text",
+    "estimated_prompt_tokens",
+    "token_estimate_method",
+    "num_ctx",
+    "num_thread",
+    "prompt_tokens",
+    "response_tokens",
+    "response_tokens_saved",
+    "stop_reason",
+    "total_tokens",
+    "output_input_ratio",
+    "total_duration_ms",
+    "load_duration_ms",
+    "prompt_eval_ms",
+    "generation_ms",
+    "tokens_per_sec",
+    "streamed",
+    "time_to_first_token_ms",
+    "wall_clock_ms",
+    "cache_hit",
+    "coalesced",
+    "endpoint",
+    "http_status",
+    "error_type",
+    "retry_count",
+    "timeout_flag",
+    "request_timeout_seconds",
+    "llm_returned_code_block",
+    "code_appended_externally",
+    "llm_response_chars",
+    "llm_response_lines",
+    "llm_response_text",
+    "response_chars",
+    "response_lines",
+    "has_title",
+    "has_intuition",
+    "has_approach",
+    "has_time_complexity",
+    "has_space_complexity",
+    "has_code_block",
+    "format_score",
+    "completeness_score",
+    "manual_edit_distance",
+    "accepted_for_posting",
+    "error_message",
+]
+
+
+MIGRATION_COLUMNS = {
+    "problem_link": "TEXT",
+    "prompt_strategy": "TEXT",
+    "prompt_hash": "TEXT",
+    "prompt_preview": "TEXT",
+    "prompt_text": "TEXT",
+    "code_sha256": "TEXT",
+    "code_text": "TEXT",
+    "llm_returned_code_block": "INTEGER",
+    "code_appended_externally": "INTEGER",
+    "llm_response_chars": "INTEGER",
+    "llm_response_lines": "INTEGER",
+    "llm_response_text": "TEXT",
+    "streamed": "INTEGER",
+    "time_to_first_token_ms": "REAL",
+    "wall_clock_ms": "REAL",
+    "cache_hit": "INTEGER",
+    "endpoint": "TEXT",
+    "request_timeout_seconds": "REAL",
+    "prompt_layout": "TEXT",
+    "prompt_tokens_saved": "INTEGER",
+    "code_truncated": "INTEGER",
+    "response_tokens_saved": "INTEGER",
+    "stop_reason": "TEXT",
+    "run_group_id": "TEXT",
+    "run_kind": "TEXT",
+    "selected": "INTEGER",
+    "coalesced": "INTEGER",
+    "estimated_prompt_tokens": "INTEGER",
+    "token_estimate_method": "TEXT",
+    "num_ctx": "INTEGER",
+    "num_thread": "INTEGER",
+    "parent_run_id": "TEXT",
+    "is_hedge": "INTEGER",
+    "repaired_sections": "TEXT",
+    "reused_from_run_id": "TEXT",
+    "reuse_tokens_saved": "INTEGER",
+    "artifacts": "TEXT",
+}
+
+
+def _base_dir() -> str:
+    return os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def get_metrics_paths() -> Dict[str, str]:
+    stats_dir = os.path.join(_base_dir(), "llm_stats")
+    return {
+        "stats_dir": stats_dir,
+        "db_path": os.path.join(stats_dir, "runs.db"),
+        "excel_path": os.path.join(stats_dir, "token_usage.xlsx"),
+    }
+
+
+def _connect() -> sqlite3.Connection:
+    paths = get_metrics_paths()
+    os.makedirs(paths["stats_dir"], exist_ok=True)
+    conn = sqlite3.connect(paths["db_path"])
+    conn.row_factory = sqlite3.Row
+    return conn
+
+
+def ensure_metrics_storage() -> None:
+    conn = _connect()
+    try:
+        conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS llm_runs (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                run_id TEXT UNIQUE NOT NULL,
+                run_group_id TEXT,
+                run_kind TEXT,
+                selected INTEGER,
+                is_hedge INTEGER,
+                parent_run_id TEXT,
+                repaired_sections TEXT,
+                reused_from_run_id TEXT,
+                reuse_tokens_saved INTEGER,
+                artifacts TEXT,
+                timestamp TEXT NOT NULL,
+                problem_number TEXT,
+                problem_name TEXT,
+                problem_link TEXT,
+                difficulty TEXT,
+                language TEXT,
+                model TEXT,
+                prompt_version TEXT,
+                prompt_strategy TEXT,
+                prompt_layout TEXT,
+                prompt_hash TEXT,
+                prompt_preview TEXT,
+                prompt_text TEXT,
+                prompt_chars INTEGER,
+                prompt_lines INTEGER,
+                prompt_tokens_saved INTEGER,
+                code_truncated INTEGER,
+                code_chars INTEGER,
+                code_lines INTEGER,
+                code_sha256 TEXT,
+                code_text TEXT,
+                estimated_prompt_tokens INTEGER,
+                token_estimate_method TEXT,
+                num_ctx INTEGER,
+                num_thread INTEGER,
+                prompt_tokens INTEGER,
+                response_tokens INTEGER,
+                response_tokens_saved INTEGER,
+                stop_reason TEXT,
+                total_tokens INTEGER,
+                output_input_ratio REAL,
+                total_duration_ms REAL,
+                load_duration_ms REAL,
+                prompt_eval_ms REAL,
+                generation_ms REAL,
+                tokens_per_sec REAL,
+                streamed INTEGER,
+                time_to_first_token_ms REAL,
+                wall_clock_ms REAL,
+                cache_hit INTEGER,
+                coalesced INTEGER,
+                endpoint TEXT,
+                http_status INTEGER,
+                error_type TEXT,
+                retry_count INTEGER,
+                timeout_flag INTEGER,
+                request_timeout_seconds REAL,
+                llm_returned_code_block INTEGER,
+                code_appended_externally INTEGER,
+                llm_response_chars INTEGER,
+                llm_response_lines INTEGER,
+                llm_response_text TEXT,
+                response_chars INTEGER,
+                response_lines INTEGER,
+                has_title INTEGER,
+                has_intuition INTEGER,
+                has_approach INTEGER,
+                has_time_complexity INTEGER,
+                has_space_complexity INTEGER,
+                has_code_block INTEGER,
+                format_score REAL,
+                completeness_score REAL,
+                manual_edit_distance INTEGER,
+                accepted_for_posting INTEGER,
+                error_message TEXT
+            )
+            """
+        )
+        conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_llm_runs_timestamp ON llm_runs(timestamp)"
+        )
+        conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_llm_runs_problem ON llm_runs(problem_number)"
+        )
+        _migrate_metrics_schema(conn)
+        conn.commit()
+    finally:
+        conn.close()
+
+
+def _migrate_metrics_schema(conn: sqlite3.Connection) -> None:
+    existing = {row[1] for row in conn.execute("PRAGMA table_info(llm_runs)").fetchall()}
+    for column_name, column_type in MIGRATION_COLUMNS.items():
+        if column_name not in existing:
+            conn.execute(f"ALTER TABLE llm_runs ADD COLUMN {column_name} {column_type}")
+
+
+def _safe_int(value: Any, default: int = 0) -> int:
+    try:
+        if value is None:
+            return default
+        return int(value)
+    except (TypeError, ValueError):
+        return default
+
+
+def _safe_float(value: Any, default: float = 0.0) -> float:
+    try:
+        if value is None:
+            return default
+        return float(value)
+    except (TypeError, ValueError):
+        return default
+
+
+def _sha256_hex(value: str) -> str:
+    return hashlib.sha256((value or "").encode("utf-8")).hexdigest()
+
+
+def _build_prompt_preview(prompt: str, max_len: int = 280) -> str:
+    compact = " ".join((prompt or "").split())
+    if len(compact) <= max_len:
+        return compact
+    return compact[: max_len - 3] + "..."
+
+
+# Max column width cap — long text fields (prompt_text, code_text, etc.) can be
+# thousands of chars; we cap at 80 so the sheet stays usable.
+_EXCEL_MAX_COL_WIDTH = 80
+_EXCEL_MIN_COL_WIDTH = 10
+
+
+def _autofit_columns(ws) -> None:
+    """Set each column width to fit its header + a small margin, capped at 80."""
+    for col_cells in ws.iter_cols():
+        header = str(col_cells[0].value or "")
+        # Sample up to 20 data rows to find a representative value width.
+        sample_max = max(
+            (len(str(cell.value or "")) for cell in col_cells[1:21]),
+            default=0,
+        )
+        width = max(len(header) + 4, min(sample_max + 2, _EXCEL_MAX_COL_WIDTH), _EXCEL_MIN_COL_WIDTH)
+        ws.column_dimensions[col_cells[0].column_letter].width = width
+
+
+def _prepare_export_row(row: Dict[str, Any]) -> Dict[str, Any]:
+    """Normalize missing legacy fields so Excel output is analysis-friendly."""
+    normalized = dict(row)
+
+    _LEGACY_MARKER = "legacy"
+    _DASH = "—"
+
+    if not normalized.get("prompt_strategy"):
+        normalized["prompt_strategy"] = _LEGACY_MARKER
+
+    if not normalized.get("problem_link"):
+        normalized["problem_link"] = _DASH
+
+    if not normalized.get("prompt_text"):
+        normalized["prompt_text"] = _DASH
+
+    if not normalized.get("code_text"):
+        normalized["code_text"] = _DASH
+
+    if not normalized.get("llm_response_text"):
+        normalized["llm_response_text"] = _DASH
+
+    if not normalized.get("prompt_preview"):
+        raw = normalized.get("prompt_text", "")
+        normalized["prompt_preview"] = _build_prompt_preview(raw) if raw != _DASH else _DASH
+
+    if not normalized.get("prompt_hash"):
+        raw = normalized.get("prompt_text", "")
+        normalized["prompt_hash"] = _sha256_hex(raw) if raw != _DASH else _DASH
+
+    if not normalized.get("code_sha256"):
+        raw = normalized.get("code_text", "")
+        normalized["code_sha256"] = _sha256_hex(raw) if raw != _DASH else _DASH
+
+    if not normalized.get("llm_response_chars"):
+        raw = normalized.get("llm_response_text", "")
+        normalized["llm_response_chars"] = len(raw) if raw != _DASH else 0
+
+    if not normalized.get("llm_response_lines"):
+        raw = normalized.get("llm_response_text", "")
+        normalized["llm_response_lines"] = count_lines(raw) if raw != _DASH else 0
+
+    return normalized
+
+
+def analyze_response_quality(text: str, post: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    """Score the post's structure; pass ``post`` when ``parse_post(text)`` is already at hand."""
+    post = post if post is not None else parse_post(text)
+    first_non_empty = post["first_line"]
+
+    has_title = bool(first_non_empty and not first_non_empty.startswith("#"))
+    has_intuition = has_section(post, "intuition")
+    has_approach = has_section(post, "approach")
+    has_time_complexity = has_section(post, "time complexity")
+    has_space_complexity = has_section(post, "space complexity")
+    has_code_block = post["has_fence"]
+
+    checks = [
+        has_title,
+        has_intuition,
+        has_approach,
+        has_time_complexity,
+        has_space_complexity,
+        has_code_block,
+    ]
+    completeness_score = round((sum(int(x) for x in checks) / len(checks)) * 100, 2)
+
+    # Weighted score favors correctly formatted markdown structure.
+    format_score = round(
+        (20 * int(has_title))
+        + (15 * int(has_intuition))
+        + (15 * int(has_approach))
+        + (15 * int(has_time_complexity))
+        + (15 * int(has_space_complexity))
+        + (20 * int(has_code_block)),
+        2,
+    )
+
+    return {
+        "has_title": int(has_title),
+        "has_intuition": int(has_intuition),
+        "has_approach": int(has_approach),
+        "has_time_complexity": int(has_time_complexity),
+        "has_space_complexity": int(has_space_complexity),
+        "has_code_block": int(has_code_block),
+        "format_score": format_score,
+        "completeness_score": completeness_score,
+    }
+
+
+def build_run_record(
+    *,
+    problem_number: str,
+    problem_name: str,
+    difficulty: str,
+    language: str,
+    model: str,
+    prompt_version: str,
+    prompt: str,
+    code: str,
+    response_text: str,
+    problem_link: str = "",
+    prompt_strategy: str = "",
+    prompt_layout: str = "",
+    prompt_tokens_saved: int = 0,
+    code_truncated: int = 0,
+    estimated_prompt_tokens: Optional[int] = None,
+    token_estimate_method: str = "",
+    num_ctx: int = 0,
+    num_thread: int = 0,
+    llm_response_text: Optional[str] = None,
+    response_data: Optional[Dict[str, Any]] = None,
+    http_status: Optional[int] = None,
+    error_type: str = "",
+    error_message: str = "",
+    llm_returned_code_block: Optional[int] = None,
+    code_appended_externally: int = 0,
+    retry_count: int = 0,
+    timeout_flag: int = 0,
+    streamed: int = 0,
+    time_to_first_token_ms: Optional[float] = None,
+    wall_clock_ms: Optional[float] = None,
+    cache_hit: int = 0,
+    coalesced: int = 0,
+    endpoint: str = "",
+    request_timeout_seconds: Optional[float] = None,
+    response_tokens_saved: int = 0,
+    run_group_id: str = "",
+    run_kind: str = "",
+    selected: int = 1,
+    parent_run_id: str = "",
+    is_hedge: int = 0,
+    repaired_sections: str = "",
+    reused_from_run_id: str = "",
+    reuse_tokens_saved: int = 0,
+    artifacts: str = "",
+    manual_edit_distance: Optional[int] = None,
+    accepted_for_posting: Optional[int] = None,
+) -> Dict[str, Any]:
+    response_data = response_data or {}
+    llm_text = llm_response_text if llm_response_text is not None else response_text
+    final_output = response_text or ""
+
+    # response_data uses the backend-normalized fields (services.backends.normalized_response).
+    prompt_tokens = _safe_int(response_data.get("prompt_tokens"))
+    response_tokens = _safe_int(response_data.get("response_tokens"))
+    total_tokens = prompt_tokens + response_tokens
+
+    total_duration_ms = _safe_float(response_data.get("total_duration_ms"))
+    load_duration_ms = _safe_float(response_data.get("load_duration_ms"))
+    prompt_eval_ms = _safe_float(response_data.get("prompt_eval_ms"))
+    generation_ms = _safe_float(response_data.get("generation_ms"))
+
+    output_input_ratio = 0.0
+    if prompt_tokens > 0:
+        output_input_ratio = round(response_tokens / prompt_tokens, 4)
+
+    tokens_per_sec = 0.0
+    generation_seconds = generation_ms / 1000
+    if generation_seconds > 0:
+        tokens_per_sec = round(response_tokens / generation_seconds, 4)
+
+    quality = analyze_response_quality(final_output)
+    prompt_hash = _sha256_hex(prompt or "")
+    code_sha256 = _sha256_hex(code or "")
+
+    if llm_returned_code_block is None:
+        llm_returned_code_block = int("```" in (llm_text or "") or "## Code" in (llm_text or ""))
+
+    now = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+
+    return {
+        "run_id": str(uuid.uuid4()),
+        "run_group_id": str(run_group_id or ""),
+        "run_kind": str(run_kind or ""),
+        "selected": _safe_int(selected, default=1),
+        "is_hedge": _safe_int(is_hedge, default=0),
+        "parent_run_id": str(parent_run_id or ""),
+        "repaired_sections": str(repaired_sections or ""),
+        "reused_from_run_id": str(reused_from_run_id or ""),
+        "reuse_tokens_saved": _safe_int(reuse_tokens_saved),
+        "artifacts": str(artifacts or ""),
+        "timestamp": now,
+        "problem_number": str(problem_number or ""),
+        "problem_name": str(problem_name or ""),
+        "problem_link": str(problem_link or ""),
+        "difficulty": str(difficulty or ""),
+        "language": str(language or ""),
+        "model": str(model or ""),
+        "prompt_version": str(prompt_version or ""),
+        "prompt_strategy": str(prompt_strategy or ""),
+        "prompt_layout": str(prompt_layout or ""),
+        "prompt_hash": prompt_hash,
+        "prompt_preview": _build_prompt_preview(prompt),
+        "prompt_text": str(prompt or ""),
+        "prompt_chars": len(prompt or ""),
+        "prompt_lines": count_lines(prompt or ""),
+        "prompt_tokens_saved": _safe_int(prompt_tokens_saved),
+        "code_truncated": int(bool(code_truncated)),
+        "code_chars": len(code or ""),
+        "code_lines": count_lines(code or ""),
+        "code_sha256": code_sha256,
+        "code_text": str(code or ""),
+        "estimated_prompt_tokens": (
+            _safe_int(estimated_prompt_tokens) if estimated_prompt_tokens is not None else None
+        ),
+        "token_estimate_method": str(token_estimate_method or ""),
+        "num_ctx": _safe_int(num_ctx),
+        "num_thread": _safe_int(num_thread),
+        "prompt_tokens": prompt_tokens,
+        "response_tokens": response_tokens,
+        "response_tokens_saved": _safe_int(response_tokens_saved),
+        "stop_reason": str(response_data.get("done_reason") or ""),
+        "total_tokens": total_tokens,
+        "output_input_ratio": output_input_ratio,
+        "total_duration_ms": round(total_duration_ms, 2),
+        "load_duration_ms": round(load_duration_ms, 2),
+        "prompt_eval_ms": round(prompt_eval_ms, 2),
+        "generation_ms": round(generation_ms, 2),
+        "tokens_per_sec": tokens_per_sec,
+        "streamed": _safe_int(streamed, default=0),
+        "time_to_first_token_ms": (
+            round(_safe_float(time_to_first_token_ms), 2) if time_to_first_token_ms is not None else None
+        ),
+        "wall_clock_ms": round(_safe_float(wall_clock_ms), 2) if wall_clock_ms is not None else None,
+        "cache_hit": _safe_int(cache_hit, default=0),
+        "coalesced": _safe_int(coalesced, default=0),
+        "endpoint": str(endpoint or ""),
+        "http_status": _safe_int(http_status, default=0),
+        "error_type": str(error_type or ""),
+        "retry_count": _safe_int(retry_count, default=0),
+        "timeout_flag": _safe_int(timeout_flag, default=0),
+        "request_timeout_seconds": (
+            round(_safe_float(request_timeout_seconds), 2) if request_timeout_seconds is not None else None
+        ),
+        "llm_returned_code_block": _safe_int(llm_returned_code_block, default=0),
+        "code_appended_externally": _safe_int(code_appended_externally, default=0),
+        "llm_response_chars": len(llm_text or ""),
+        "llm_response_lines": count_lines(llm_text or ""),
+        "llm_response_text": str(llm_text or ""),
+        "response_chars": len(final_output),
+        "response_lines": count_lines(final_output),
+        "has_title": quality["has_title"],
+        "has_intuition": quality["has_intuition"],
+        "has_approach": quality["has_approach"],
+        "has_time_complexity": quality["has_time_complexity"],
+        "has_space_complexity": quality["has_space_complexity"],
+        "has_code_block": quality["has_code_block"],
+        "format_score": quality["format_score"],
+        "completeness_score": quality["completeness_score"],
+        "manual_edit_distance": manual_edit_distance,
+        "accepted_for_posting": accepted_for_posting,
+        "error_message": str(error_message or ""),
+    }
+
+
+def log_run_record(record: Dict[str, Any], export_excel: bool = True) -> None:
+    ensure_metrics_storage()
+    conn = _connect()
+    try:
+        placeholders = ", ".join("?" for _ in RUN_COLUMNS)
+        columns = ", ".join(RUN_COLUMNS)
+        values = [record.get(col) for col in RUN_COLUMNS]
+        conn.execute(
+            f"INSERT INTO llm_runs ({columns}) VALUES ({placeholders})",
+            values,
+        )
+        conn.commit()
+    finally:
+        conn.close()
+
+    if export_excel:
+        export_runs_to_excel()
+
+
+def estimate_edit_distance(original_text: str, edited_text: str) -> int:
+    """Approximate edit distance using sequence ratio and max length."""
+    original = original_text or ""
+    edited = edited_text or ""
+    if not original and not edited:
+        return 0
+    ratio = SequenceMatcher(a=original, b=edited).ratio()
+    return int(round((1 - ratio) * max(len(original), len(edited))))
+
+
+def update_run_feedback(
+    run_id: str,
+    accepted_for_posting: Optional[int] = None,
+    manual_edit_distance: Optional[int] = None,
+    export_excel: bool = True,
+) -> None:
+    ensure_metrics_storage()
+    conn = _connect()
+    try:
+        conn.execute(
+            """
+            UPDATE llm_runs
+            SET accepted_for_posting = COALESCE(?, accepted_for_posting),
+                manual_edit_distance = COALESCE(?, manual_edit_distance)
+            WHERE run_id = ?
+            """,
+            (accepted_for_posting, manual_edit_distance, run_id),
+        )
+        conn.commit()
+    finally:
+        conn.close()
+
+    if export_excel:
+        export_runs_to_excel()
+
+
+def fetch_recent_runs(limit: int = 200) -> List[Dict[str, Any]]:
+    ensure_metrics_storage()
+    conn = _connect()
+    try:
+        cursor = conn.execute(
+            f"SELECT {', '.join(RUN_COLUMNS)} FROM llm_runs ORDER BY id DESC LIMIT ?",
+            (limit,),
+        )
+        rows = cursor.fetchall()
+        return [dict(row) for row in rows]
+    finally:
+        conn.close()
+
+
+def fetch_run(run_id: str) -> Optional[Dict[str, Any]]:
+    ensure_metrics_storage()
+    conn = _connect()
+    try:
+        row = conn.execute(
+            f"SELECT {', '.join(RUN_COLUMNS)} FROM llm_runs WHERE run_id = ?",
+            (run_id,),
+        ).fetchone()
+    finally:
+        conn.close()
+    return dict(row) if row is not None else None
+
+
+def fetch_metrics_summary() -> Dict[str, Any]:
+    ensure_metrics_storage()
+    conn = _connect()
+    try:
+        total_runs = conn.execute("SELECT COUNT(*) FROM llm_runs").fetchone()[0]
+        success_runs = conn.execute(
+            "SELECT COUNT(*) FROM llm_runs WHERE COALESCE(error_type, '') = ''"
+        ).fetchone()[0]
+        failed_runs = total_runs - success_runs
+        timeout_runs = conn.execute(
+            "SELECT COUNT(*) FROM llm_runs WHERE timeout_flag = 1"
+        ).fetchone()[0]
+        cache_hit_runs = conn.execute(
+            "SELECT COUNT(*) FROM llm_runs WHERE cache_hit = 1"
+        ).fetchone()[0]
+        coalesced_runs = conn.execute(
+            "SELECT COUNT(*) FROM llm_runs WHERE coalesced = 1"
+        ).fetchone()[0]
+        refinement_runs = conn.execute(
+            "SELECT COUNT(*) FROM llm_runs WHERE run_kind = 'refinement'"
+        ).fetchone()[0]
+        repaired_posts = conn.execute(
+            "SELECT COUNT(*) FROM llm_runs WHERE COALESCE(repaired_sections, '') != ''"
+        ).fetchone()[0]
+        repair_runs, repair_total_tokens = conn.execute(
+            "SELECT COUNT(*), SUM(total_tokens) FROM llm_runs WHERE run_kind = 'repair'"
+        ).fetchone()
+        reused_posts, reuse_tokens_saved = conn.execute(
+            """
+            SELECT COUNT(*), SUM(reuse_tokens_saved)
+            FROM llm_runs
+            WHERE COALESCE(reused_from_run_id, '') != '' AND COALESCE(error_type, '') = ''
+            """
+        ).fetchone()
+
+        avg_tokens_per_sec = conn.execute(
+            "SELECT AVG(tokens_per_sec) FROM llm_runs WHERE tokens_per_sec > 0"
+        ).fetchone()[0]
+        avg_total_duration_ms = conn.execute(
+            "SELECT AVG(total_duration_ms) FROM llm_runs WHERE total_duration_ms > 0"
+        ).fetchone()[0]
+        avg_time_to_first_token_ms = conn.execute(
+            "SELECT AVG(time_to_first_token_ms) FROM llm_runs WHERE time_to_first_token_ms > 0"
+        ).fetchone()[0]
+        avg_wall_clock_ms = conn.execute(
+            "SELECT AVG(wall_clock_ms) FROM llm_runs WHERE wall_clock_ms > 0"
+        ).fetchone()[0]
+        prompt_tokens_saved = conn.execute(
+            "SELECT SUM(prompt_tokens_saved) FROM llm_runs WHERE prompt_tokens_saved > 0"
+        ).fetchone()[0]
+        avg_completeness = conn.execute(
+            "SELECT AVG(completeness_score) FROM llm_runs WHERE completeness_score IS NOT NULL"
+        ).fetchone()[0]
+        avg_format = conn.execute(
+            "SELECT AVG(format_score) FROM llm_runs WHERE format_score IS NOT NULL"
+        ).fetchone()[0]
+        token_estimate_mape = conn.execute(
+            """
+            SELECT AVG(ABS(estimated_prompt_tokens - prompt_tokens) * 100.0 / prompt_tokens)
+            FROM llm_runs
+            WHERE estimated_prompt_tokens IS NOT NULL AND prompt_tokens > 0
+            """
+        ).fetchone()[0]
+
+        return {
+            "total_runs": total_runs,
+            "success_runs": success_runs,
+            "failed_runs": failed_runs,
+            "timeout_runs": timeout_runs,
+            "cache_hit_runs": cache_hit_runs,
+            "coalesced_runs": coalesced_runs,
+            "refinement_runs": refinement_runs,
+            "repaired_posts": repaired_posts,
+            "repair_runs": repair_runs,
+            "repair_total_tokens": int(repair_total_tokens or 0),
+            "reused_posts": reused_posts,
+            "reuse_tokens_saved": int(reuse_tokens_saved or 0),
+            "avg_tokens_per_sec": round(avg_tokens_per_sec or 0.0, 2),
+            "avg_total_duration_ms": round(avg_total_duration_ms or 0.0, 2),
+            "avg_time_to_first_token_ms": round(avg_time_to_first_token_ms or 0.0, 2),
+            "avg_wall_clock_ms": round(avg_wall_clock_ms or 0.0, 2),
+            "prompt_tokens_saved": int(prompt_tokens_saved or 0),
+            "avg_completeness_score": round(avg_completeness or 0.0, 2),
+            "avg_format_score": round(avg_format or 0.0, 2),
+            "token_estimate_mape": round(token_estimate_mape or 0.0, 2),
+        }
+    finally:
+        conn.close()
+
+
+def fetch_latency_history(model: str, limit: int = 500) -> List[Dict[str, Any]]:
+    """Timing fields of the most recent successful model calls for ``model``."""
+    ensure_metrics_storage()
+    conn = _connect()
+    try:
+        rows = conn.execute(
+            """
+            SELECT prompt_chars, prompt_tokens, prompt_eval_ms, generation_ms,
+                   load_duration_ms, total_duration_ms, tokens_per_sec,
+                   time_to_first_token_ms, wall_clock_ms
+            FROM llm_runs
+            WHERE model = ?
+              AND COALESCE(error_type, '') = ''
+              AND COALESCE(cache_hit, 0) = 0
+              AND COALESCE(parent_run_id, '') = ''
+              AND COALESCE(run_kind, '') != 'reuse'
+              AND total_duration_ms > 0
+            ORDER BY id DESC
+            LIMIT ?
+            """,
+            (model, limit),
+        ).fetchall()
+    finally:
+        conn.close()
+    return [dict(row) for row in rows]
+
+
+def fetch_token_estimate_error(days: int = 30) -> List[Dict[str, Any]]:
+    """Daily error of the local prompt token estimate against the server's count, per method.
+
+    ``mean_error_tokens`` is signed (positive = over-estimate); ``mape`` is the
+    mean absolute error as a percentage of the real count.
+    """
+    ensure_metrics_storage()
+    conn = _connect()
+    try:
+        rows = conn.execute(
+            """
+            SELECT
+                substr(timestamp, 1, 10) AS day,
+                token_estimate_method AS method,
+                COUNT(*) AS runs,
+                AVG(estimated_prompt_tokens - prompt_tokens) AS mean_error_tokens,
+                AVG(ABS(estimated_prompt_tokens - prompt_tokens) * 100.0 / prompt_tokens) AS mape
+            FROM llm_runs
+            WHERE estimated_prompt_tokens IS NOT NULL
+              AND prompt_tokens > 0
+              AND COALESCE(token_estimate_method, '') != ''
+              AND timestamp >= date('now', 'localtime', ?)
+            GROUP BY day, method
+            ORDER BY day, method
+            """,
+            (f"-{int(days)} days",),
+        ).fetchall()
+    finally:
+        conn.close()
+
+    return [
+        {
+            "day": row["day"],
+            "method": row["method"],
+            "runs": row["runs"],
+            "mean_error_tokens": round(row["mean_error_tokens"] or 0.0, 1),
+            "mape": round(row["mape"] or 0.0, 2),
+        }
+        for row in rows
+    ]
+
+
+def fetch_baseline_response_tokens(model: str, prompt_version: str, limit: int = 200) -> float:
+    """Average response length of recent full posts that were not cut short by the section detector.
+
+    Refinements and section repairs (runs with a ``parent_run_id``) and
+    explanation reuse deltas answer much shorter requests, and runs with
+    artifacts answer longer ones; all are left out.
+    """
+    ensure_metrics_storage()
+    conn = _connect()
+    try:
+        row = conn.execute(
+            """
+            SELECT AVG(response_tokens) FROM (
+                SELECT response_tokens
+                FROM llm_runs
+                WHERE model = ?
+                  AND prompt_version = ?
+                  AND COALESCE(error_type, '') = ''
+                  AND COALESCE(cache_hit, 0) = 0
+                  AND COALESCE(stop_reason, '') != 'sections_complete'
+                  AND COALESCE(parent_run_id, '') = ''
+                  AND COALESCE(run_kind, '') != 'reuse'
+                  AND COALESCE(artifacts, '') = ''
+                  AND response_tokens > 0
+                ORDER BY id DESC
+                LIMIT ?
+            )
+            """,
+            (model, prompt_version, limit),
+        ).fetchone()
+    finally:
+        conn.close()
+    return float(row[0] or 0.0)
+
+
+def fetch_common_num_ctx(model: str, limit: int = 50) -> int:
+    """Most frequent num_ctx among the recent requests sent to ``model`` (0 when none recorded one)."""
+    ensure_metrics_storage()
+    conn = _connect()
+    try:
+        row = conn.execute(
+            """
+            SELECT num_ctx, COUNT(*) AS runs FROM (
+                SELECT num_ctx
+                FROM llm_runs
+                WHERE model = ?
+                  AND COALESCE(cache_hit, 0) = 0
+                  AND COALESCE(coalesced, 0) = 0
+                  AND COALESCE(num_ctx, 0) > 0
+                ORDER BY id DESC
+                LIMIT ?
+            )
+            GROUP BY num_ctx
+            ORDER BY runs DESC, num_ctx DESC
+            LIMIT 1
+            """,
+            (model, limit),
+        ).fetchone()
+    finally:
+        conn.close()
+    return int(row[0]) if row else 0
+
+
+def fetch_endpoint_throughput(recent_runs: int = 20) -> Dict[str, float]:
+    """Average tokens_per_sec of the most recent successful runs on each endpoint."""
+    ensure_metrics_storage()
+    conn = _connect()
+    try:
+        rows = conn.execute(
+            """
+            SELECT endpoint, AVG(tokens_per_sec) AS avg_tokens_per_sec
+            FROM (
+                SELECT
+                    endpoint,
+                    tokens_per_sec,
+                    ROW_NUMBER() OVER (PARTITION BY endpoint ORDER BY id DESC) AS recency
+                FROM llm_runs
+                WHERE tokens_per_sec > 0 AND COALESCE(endpoint, '') != ''
+            )
+            WHERE recency <= ?
+            GROUP BY endpoint
+            """,
+            (recent_runs,),
+        ).fetchall()
+    finally:
+        conn.close()
+    return {row["endpoint"]: round(row["avg_tokens_per_sec"] or 0.0, 4) for row in rows}
+
+
+# Ollama reports a few ms of load_duration even for a resident model; anything
+# above this is a real (cold) model load.
+COLD_LOAD_THRESHOLD_MS = 1000.0
+
+
+def fetch_load_summary(cold_threshold_ms: float = COLD_LOAD_THRESHOLD_MS) -> Dict[str, Any]:
+    """Split successful model calls into cold loads and warm (resident model) runs."""
+    ensure_metrics_storage()
+    conn = _connect()
+    try:
+        row = conn.execute(
+            """
+            SELECT
+                SUM(CASE WHEN load_duration_ms >= ? THEN 1 ELSE 0 END) AS cold_runs,
+                SUM(CASE WHEN load_duration_ms < ? THEN 1 ELSE 0 END) AS warm_runs,
+                AVG(CASE WHEN load_duration_ms >= ? THEN load_duration_ms END) AS avg_cold_load_ms,
+                AVG(CASE WHEN load_duration_ms < ? THEN load_duration_ms END) AS avg_warm_load_ms
+            FROM llm_runs
+            WHERE COALESCE(error_type, '') = ''
+              AND COALESCE(cache_hit, 0) = 0
+              AND total_duration_ms > 0
+            """,
+            (cold_threshold_ms, cold_threshold_ms, cold_threshold_ms, cold_threshold_ms),
+        ).fetchone()
+    finally:
+        conn.close()
+
+    cold_runs = int(row["cold_runs"] or 0)
+    warm_runs = int(row["warm_runs"] or 0)
+    total = cold_runs + warm_runs
+    avg_cold_load_ms = round(row["avg_cold_load_ms"] or 0.0, 2)
+    avg_warm_load_ms = round(row["avg_warm_load_ms"] or 0.0, 2)
+
+    return {
+        "cold_runs": cold_runs,
+        "warm_runs": warm_runs,
+        "cold_ratio": round(cold_runs / total, 4) if total else 0.0,
+        "avg_cold_load_ms": avg_cold_load_ms,
+        "avg_warm_load_ms": avg_warm_load_ms,
+        # Load time each warm run avoided, assuming it would otherwise have been cold.
+        "estimated_load_ms_saved": round(max(avg_cold_load_ms - avg_warm_load_ms, 0.0) * warm_runs, 2),
+    }
+
+
+def fetch_hedge_summary() -> Dict[str, Any]:
+    """How often requests were hedged and how often the duplicate won.
+
+    ``hedge_rate`` is hedged requests over all requests that reached the
+    server (cache hits, coalesced followers and refinements excluded);
+    ``hedge_win_rate`` is the share of hedged requests answered by the duplicate.
+    """
+    ensure_metrics_storage()
+    conn = _connect()
+    try:
+        row = conn.execute(
+            """
+            SELECT
+                COUNT(DISTINCT CASE WHEN run_kind = 'hedge' THEN run_group_id END) AS hedged_requests,
+                SUM(CASE WHEN run_kind = 'hedge' AND is_hedge = 1 AND selected = 1 THEN 1 ELSE 0 END) AS hedge_wins,
+                SUM(CASE WHEN COALESCE(run_kind, '') = '' THEN 1 ELSE 0 END) AS unhedged_requests
+            FROM llm_runs
+            WHERE COALESCE(cache_hit, 0) = 0
+              AND COALESCE(coalesced, 0) = 0
+              AND COALESCE(parent_run_id, '') = ''
+            """
+        ).fetchone()
+    finally:
+        conn.close()
+
+    hedged = int(row["hedged_requests"] or 0)
+    wins = int(row["hedge_wins"] or 0)
+    total = hedged + int(row["unhedged_requests"] or 0)
+    return {
+        "hedged_requests": hedged,
+        "hedge_rate": round(hedged / total, 4) if total else 0.0,
+        "hedge_wins": wins,
+        "hedge_win_rate": round(wins / hedged, 4) if hedged else 0.0,
+    }
+
+
+def fetch_run_group_summary() -> List[Dict[str, Any]]:
+    """Cost and latency of linked run groups (best-of-N and similar) per ``run_kind``.
+
+    Each row also carries the averages of ordinary single runs so the token
+    cost can be read against the latency win.
+    """
+    ensure_metrics_storage()
+    conn = _connect()
+    try:
+        baseline = conn.execute(
+            """
+            SELECT AVG(wall_clock_ms) AS wall_clock_ms, AVG(total_tokens) AS total_tokens
+            FROM llm_runs
+            WHERE COALESCE(run_group_id, '') = ''
+              AND COALESCE(parent_run_id, '') = ''
+              AND COALESCE(error_type, '') = ''
+              AND COALESCE(cache_hit, 0) = 0
+              AND COALESCE(coalesced, 0) = 0
+            """
+        ).fetchone()
+        rows = conn.execute(
+            """
+            SELECT
+                run_kind,
+                COUNT(*) AS groups,
+                AVG(attempts) AS avg_attempts,
+                AVG(group_total_tokens) AS avg_group_total_tokens,
+                AVG(selected_wall_clock_ms) AS avg_selected_wall_clock_ms,
+                AVG(selected_format_score) AS avg_selected_format_score
+            FROM (
+                SELECT
+                    COALESCE(run_kind, '') AS run_kind,
+                    run_group_id,
+                    COUNT(*) AS attempts,
+                    SUM(COALESCE(total_tokens, 0)) AS group_total_tokens,
+                    MAX(CASE WHEN selected = 1 THEN wall_clock_ms END) AS selected_wall_clock_ms,
+                    MAX(CASE WHEN selected = 1 THEN format_score END) AS selected_format_score
+                FROM llm_runs
+                WHERE COALESCE(run_group_id, '') != ''
+                GROUP BY COALESCE(run_kind, ''), run_group_id
+            )
+            GROUP BY run_kind
+            ORDER BY groups DESC
+            """
+        ).fetchall()
+    finally:
+        conn.close()
+
+    return [
+        {
+            "run_kind": row["run_kind"],
+            "groups": row["groups"],
+            "avg_attempts": round(row["avg_attempts"] or 0.0, 2),
+            "avg_group_total_tokens": round(row["avg_group_total_tokens"] or 0.0, 1),
+            "avg_selected_wall_clock_ms": round(row["avg_selected_wall_clock_ms"] or 0.0, 2),
+            "avg_selected_format_score": round(row["avg_selected_format_score"] or 0.0, 2),
+            "single_run_avg_total_tokens": round(baseline["total_tokens"] or 0.0, 1),
+            "single_run_avg_wall_clock_ms": round(baseline["wall_clock_ms"] or 0.0, 2),
+        }
+        for row in rows
+    ]
+
+
+def fetch_model_post_cost() -> Dict[str, Dict[str, Any]]:
+    """Blended cost per accepted post, keyed by the model whose post was returned.
+
+    A post is a returned run without error (``selected`` = 1, refinements,
+    cache hits and coalesced runs excluded). Its tokens include every run of
+    its ``run_group_id``, so a post the cascade escalated to the large model
+    also pays for the fast model's rejected attempt, plus its section repairs;
+    its latency is the
+    returned run's ``wall_clock_ms``, which linked runs measure from the
+    start of the group.
+    """
+    ensure_metrics_storage()
+    conn = _connect()
+    try:
+        rows = conn.execute(
+            """
+            SELECT
+                model,
+                COUNT(*) AS accepted_posts,
+                AVG(wall_clock_ms) AS blended_wall_clock_ms,
+                AVG(post_total_tokens) AS blended_total_tokens
+            FROM (
+                SELECT
+                    COALESCE(posts.model, '') AS model,
+                    posts.wall_clock_ms,
+                    CASE
+                        WHEN COALESCE(posts.run_group_id, '') = '' THEN COALESCE(posts.total_tokens, 0)
+                        ELSE (
+                            SELECT SUM(COALESCE(members.total_tokens, 0))
+                            FROM llm_runs AS members
+                            WHERE members.run_group_id = posts.run_group_id
+                        )
+                    END + COALESCE((
+                        SELECT SUM(COALESCE(repairs.total_tokens, 0))
+                        FROM llm_runs AS repairs
+                        WHERE repairs.parent_run_id = posts.run_id
+                          AND repairs.run_kind = 'repair'
+                    ), 0) AS post_total_tokens
+                FROM llm_runs AS posts
+                WHERE COALESCE(posts.selected, 1) = 1
+                  AND COALESCE(posts.error_type, '') = ''
+                  AND COALESCE(posts.parent_run_id, '') = ''
+                  AND COALESCE(posts.cache_hit, 0) = 0
+                  AND COALESCE(posts.coalesced, 0) = 0
+            )
+            GROUP BY model
+            """
+        ).fetchall()
+    finally:
+        conn.close()
+
+    return {
+        row["model"]: {
+            "accepted_posts": row["accepted_posts"],
+            "blended_wall_clock_ms": round(row["blended_wall_clock_ms"] or 0.0, 2),
+            "blended_total_tokens": round(row["blended_total_tokens"] or 0.0, 1),
+        }
+        for row in rows
+    }
+
+
+def export_runs_to_excel() -> Dict[str, str]:
+    ensure_metrics_storage()
+    paths = get_metrics_paths()
+
+    conn = _connect()
+    try:
+        cursor = conn.execute(
+            f"SELECT {', '.join(RUN_COLUMNS)} FROM llm_runs ORDER BY id ASC"
+        )
+        rows = [_prepare_export_row(dict(row)) for row in cursor.fetchall()]
+    finally:
+        conn.close()
+
+    wb = Workbook()
+    usage_ws = wb.active
+    usage_ws.title = "Usage"
+    usage_ws.append(RUN_COLUMNS)
+
+    for row in rows:
+        usage_ws.append([row.get(col) for col in RUN_COLUMNS])
+
+    _autofit_columns(usage_ws)
+
+    summary = fetch_metrics_summary()
+    summary_ws = wb.create_sheet(title="Summary")
+    summary_ws.append(["Metric", "Value"])
+    for key, value in summary.items():
+        summary_ws.append([key, value])
+    for key, value in fetch_load_summary().items():
+        summary_ws.append([key, value])
+    for key, value in fetch_hedge_summary().items():
+        summary_ws.append([key, value])
+
+    prompt_ws = wb.create_sheet(title="PromptVersionSummary")
+    prompt_ws.append(
+        [
+            "prompt_version",
+            "prompt_strategy",
+            "prompt_layout",
+            "model",
+            "prompt_hash",
+            "runs",
+            "avg_completeness",
+            "avg_format",
+            "avg_tokens_per_sec",
+            "avg_output_input_ratio",
+            "avg_prompt_eval_ms",
+            "avg_total_tokens",
+            "first_pass_success_rate",
+            "avg_response_tokens",
+            "early_stop_rate",
+            "response_tokens_saved",
+        ]
+    )
+
+    conn = _connect()
+    try:
+        grouped = conn.execute(
+            """
+            SELECT
+                COALESCE(prompt_version, '') AS prompt_version,
+                COALESCE(prompt_strategy, '') AS prompt_strategy,
+                COALESCE(prompt_layout, '') AS prompt_layout,
+                COALESCE(model, '') AS model,
+                COALESCE(prompt_hash, '') AS prompt_hash,
+                COUNT(*) AS runs,
+                AVG(completeness_score) AS avg_completeness,
+                AVG(format_score) AS avg_format,
+                AVG(tokens_per_sec) AS avg_tokens_per_sec,
+                AVG(output_input_ratio) AS avg_output_input_ratio,
+                AVG(CASE WHEN COALESCE(cache_hit, 0) = 0 AND COALESCE(coalesced, 0) = 0 THEN prompt_eval_ms END) AS avg_prompt_eval_ms,
+                AVG(CASE WHEN COALESCE(cache_hit, 0) = 0 AND COALESCE(coalesced, 0) = 0 THEN total_tokens END) AS avg_total_tokens,
+                AVG(
+                    CASE
+                        WHEN COALESCE(parent_run_id, '') != ''
+                          OR COALESCE(run_kind, '') = 'reuse'
+                          OR COALESCE(cache_hit, 0) != 0
+                          OR COALESCE(coalesced, 0) != 0
+                          OR COALESCE(selected, 1) = 0 THEN NULL
+                        WHEN COALESCE(error_type, '') = ''
+                          AND completeness_score >= 100
+                          AND COALESCE(repaired_sections, '') = '' THEN 1.0
+                        ELSE 0.0
+                    END
+                ) AS first_pass_success_rate,
+                AVG(CASE WHEN COALESCE(cache_hit, 0) = 0 AND COALESCE(coalesced, 0) = 0 THEN response_tokens END) AS avg_response_tokens,
+                AVG(CASE WHEN stop_reason = 'sections_complete' THEN 1.0 ELSE 0.0 END) AS early_stop_rate,
+                SUM(COALESCE(response_tokens_saved, 0)) AS response_tokens_saved
+            FROM llm_runs
+            GROUP BY
+                COALESCE(prompt_version, ''),
+                COALESCE(prompt_strategy, ''),
+                COALESCE(prompt_layout, ''),
+                COALESCE(model, ''),
+                COALESCE(prompt_hash, '')
+            ORDER BY runs DESC
+            """
+        ).fetchall()
+    finally:
+        conn.close()
+
+    for row in grouped:
+        prompt_ws.append(
+            [
+                row["prompt_version"],
+                row["prompt_strategy"],
+                row["prompt_layout"],
+                row["model"],
+                row["prompt_hash"],
+                row["runs"],
+                round(row["avg_completeness"] or 0.0, 2),
+                round(row["avg_format"] or 0.0, 2),
+                round(row["avg_tokens_per_sec"] or 0.0, 2),
+                round(row["avg_output_input_ratio"] or 0.0, 4),
+                round(row["avg_prompt_eval_ms"] or 0.0, 2),
+                round(row["avg_total_tokens"] or 0.0, 1),
+                # Empty for groups with no fresh top-level generation (e.g. only repairs or cache hits).
+                round(row["first_pass_success_rate"], 4) if row["first_pass_success_rate"] is not None else None,
+                round(row["avg_response_tokens"] or 0.0, 1),
+                round(row["early_stop_rate"] or 0.0, 4),
+                int(row["response_tokens_saved"] or 0),
+            ]
+        )
+
+    model_ws = wb.create_sheet(title="ModelSummary")
+    model_ws.append(
+        [
+            "model",
+            "runs",
+            "avg_tokens_per_sec",
+            "avg_duration_ms",
+            "avg_completeness",
+            "accepted_posts",
+            "blended_wall_clock_ms",
+            "blended_total_tokens",
+        ]
+    )
+
+    conn = _connect()
+    try:
+        model_rows = conn.execute(
+            """
+            SELECT
+                COALESCE(model, '') AS model,
+                COUNT(*) AS runs,
+                AVG(tokens_per_sec) AS avg_tokens_per_sec,
+                AVG(total_duration_ms) AS avg_duration_ms,
+                AVG(completeness_score) AS avg_completeness
+            FROM llm_runs
+            GROUP BY COALESCE(model, '')
+            ORDER BY runs DESC
+            """
+        ).fetchall()
+    finally:
+        conn.close()
+
+    post_cost = fetch_model_post_cost()
+    for row in model_rows:
+        cost = post_cost.get(row["model"], {})
+        model_ws.append(
+            [
+                row["model"],
+                row["runs"],
+                round(row["avg_tokens_per_sec"] or 0.0, 2),
+                round(row["avg_duration_ms"] or 0.0, 2),
+                round(row["avg_completeness"] or 0.0, 2),
+                cost.get("accepted_posts", 0),
+                cost.get("blended_wall_clock_ms", 0.0),
+                cost.get("blended_total_tokens", 0.0),
+            ]
+        )
+
+    endpoint_ws = wb.create_sheet(title="EndpointSummary")
+    endpoint_ws.append(["endpoint", "runs", "avg_tokens_per_sec", "avg_duration_ms", "error_runs"])
+
+    conn = _connect()
+    try:
+        endpoint_rows = conn.execute(
+            """
+            SELECT
+                endpoint,
+                COUNT(*) AS runs,
+                AVG(CASE WHEN tokens_per_sec > 0 THEN tokens_per_sec END) AS avg_tokens_per_sec,
+                AVG(CASE WHEN total_duration_ms > 0 THEN total_duration_ms END) AS avg_duration_ms,
+                SUM(CASE WHEN COALESCE(error_type, '') != '' THEN 1 ELSE 0 END) AS error_runs
+            FROM llm_runs
+            WHERE COALESCE(endpoint, '') != ''
+            GROUP BY endpoint
+            ORDER BY runs DESC
+            """
+        ).fetchall()
+    finally:
+        conn.close()
+
+    for row in endpoint_rows:
+        endpoint_ws.append(
+            [
+                row["endpoint"],
+                row["runs"],
+                round(row["avg_tokens_per_sec"] or 0.0, 2),
+                round(row["avg_duration_ms"] or 0.0, 2),
+                row["error_runs"],
+            ]
+        )
+
+    group_ws = wb.create_sheet(title="RunGroupSummary")
+    group_rows = fetch_run_group_summary()
+    group_columns = [
+        "run_kind",
+        "groups",
+        "avg_attempts",
+        "avg_group_total_tokens",
+        "avg_selected_wall_clock_ms",
+        "avg_selected_format_score",
+        "single_run_avg_total_tokens",
+        "single_run_avg_wall_clock_ms",
+    ]
+    group_ws.append(group_columns)
+    for row in group_rows:
+        group_ws.append([row[column] for column in group_columns])
+
+    estimate_ws = wb.create_sheet(title="TokenEstimation")
+    estimate_columns = ["day", "method", "runs", "mean_error_tokens", "mape"]
+    estimate_ws.append(estimate_columns)
+    for row in fetch_token_estimate_error(days=3650):
+        estimate_ws.append([row[column] for column in estimate_columns])
+
+    # Legend sheet — explains field meanings and legacy placeholder values
+    legend_ws = wb.create_sheet(title="Legend")
+    legend_ws.append(["Field / Value", "Meaning"])
+    legend_data = [
+        ["prompt_strategy = 'legacy'", "Run logged before prompt strategy tracking was added (pre-v2)"],
+        ["problem_link = '\u2014'", "Problem link was not captured (pre-v2 run)"],
+        ["prompt_text = '\u2014'", "Prompt text was not captured (pre-v2 run)"],
+        ["code_text = '\u2014'", "Solution code was not captured (pre-v2 run)"],
+        ["llm_response_text = '\u2014'", "Raw LLM response was not captured (pre-v2 run)"],
+        ["code_appended_externally = 1", "Code was appended locally (not generated by LLM)"],
+        ["llm_returned_code_block = 1", "LLM included a code block despite instructions not to"],
+        ["format_score", "Weighted score 0\u2013100 based on presence of required markdown sections"],
+        ["completeness_score", "Percentage of required sections present in the output"],
+        ["output_input_ratio", "response_tokens / prompt_tokens \u2014 higher = more verbose output"],
+        ["tokens_per_sec", "LLM generation speed"],
+        ["time_to_first_token_ms", "Locally measured wait until the first streamed token (streamed runs only)"],
+        ["wall_clock_ms", "Locally measured request duration, including network and queueing"],
+        ["endpoint", "Base URL of the Ollama server that served the run (empty for cache hits)"],
+        ["request_timeout_seconds", "Read deadline chosen for the request from latency history (capped by LLM_TIMEOUT_SECONDS)"],
+        ["prompt_strategy = 'json_schema_v1'", "Model output constrained to a JSON schema via Ollama's format parameter and rendered to markdown locally"],
+        ["first_pass_success_rate", "Share of generated posts with no error and all required sections present without section repair (PromptVersionSummary); only returned, fresh top-level generations count, not refinements, repairs, explanation reuse, cache hits, coalesced runs or unselected best-of-N / cascade attempts"],
+        ["prompt_layout", "'inline' = single prompt; 'system_prefix' = constant instructions sent as the system prompt so Ollama can reuse its KV cache"],
+        ["prompt_tokens_saved", "Estimated prompt tokens removed by code compaction and the PROMPT_TOKEN_BUDGET cut (the post still contains the original code)"],
+        ["code_truncated = 1", "The compacted code was still over PROMPT_TOKEN_BUDGET and was cut at a line boundary in the prompt"],
+        ["stop_reason", "Server's done_reason / finish_reason ('stop' = end of text or an LLM_STOP_SEQUENCES hit, 'length' = num_predict reached), or 'sections_complete' when the stream was cut after the last required section"],
+        ["response_tokens_saved", "For 'sections_complete' runs: recent average response_tokens of uncut full posts without artifacts for the same model and prompt version minus this run's response_tokens"],
+        ["run_group_id / run_kind", "Runs that were alternatives for one post share a run_group_id; run_kind says why (e.g. 'best_of_n')"],
+        ["parent_run_id / run_kind = 'refinement'", "Follow-up edit of the run named by parent_run_id; prompt_text holds only the follow-up turn sent on top of the parent's conversation"],
+        ["run_kind = 'hedge' / is_hedge = 1", "Request that stalled past the LLM_HEDGE_PERCENTILE latency and got a duplicate; is_hedge marks the duplicate, selected the attempt that finished first"],
+        ["run_kind = 'cascade'", "One hop of the model cascade: LLM_CASCADE_MODELS are tried before OLLAMA_MODEL and a post escalates when its format_score is below LLM_CASCADE_MIN_FORMAT_SCORE or its title is missing or too long; wall_clock_ms counts from the first hop"],
+        ["accepted_posts / blended_* (ModelSummary)", "Returned error-free posts whose text came from this model, with the average wall clock and total tokens of the whole run group behind each post (rejected cascade hops and section repairs included)"],
+        ["parent_run_id / run_kind = 'repair'", "Small targeted request that regenerated one missing section or the title of the run named by parent_run_id; only used when LLM_REPAIR_ENABLED"],
+        ["run_kind = 'reuse' / reused_from_run_id", "Post adapted from the explanation written for another language (run reused_from_run_id) with the same problem and algorithm fingerprint: one delta request for the sections that change instead of a full generation; a failed delta is logged with its error and followed by a full run"],
+        ["reuse_tokens_saved", "Total tokens of the reused run minus this run's delta request"],
+        ["artifacts", "Comma-separated extra artifacts (e.g. 'readme_blurb,changelog_line') returned by the same request as the post and saved to their own files; their tokens are part of this run's response_tokens"],
+        ["repaired_sections", "Comma-separated pieces of this post that were spliced in from repair runs (e.g. 'title,space_complexity'); empty = generated in one pass"],
+        ["hedge_rate / hedge_win_rate (Summary)", "Share of server requests that were hedged / share of hedged requests answered by the duplicate"],
+        ["selected = 0", "Linked attempt that was not returned (lost the race, was cancelled, or scored lower)"],
+        ["error_type = 'CANCELLED'", "Best-of-N or hedged attempt stopped after another attempt was accepted; its tokens are counted per streamed chunk (0 if it never streamed) and its prompt tokens are unknown"],
+        ["coalesced = 1", "Follower run that joined an identical in-flight request instead of calling Ollama; token and timing fields are 0 (the leader run has them)"],
+        ["estimated_prompt_tokens", "Prompt tokens counted locally before dispatch; compare with prompt_tokens reported by the server"],
+        ["num_ctx / num_thread", "Context window and CPU threads sent with the request: num_ctx is estimated_prompt_tokens (plus any refinement context) and num_predict rounded up to an LLM_NUM_CTX_BUCKETS size, num_thread is LLM_NUM_THREAD; 0 = left to the server (not sent, or a backend other than Ollama)"],
+        ["token_estimate_method", "'tokenizer' = LLM_TOKENIZER count, 'calibrated' = chars-per-token ratio fitted on this model's history, 'default' = 4 chars per token"],
+        ["mape (TokenEstimation)", "Mean absolute estimate error as % of prompt_tokens, per day and method; mean_error_tokens > 0 means over-estimates"],
+        ["cache_hit = 1", "Served from the local response cache; token and timing fields are 0 because Ollama was not called"],
+        ["", ""],
+        ["NOTE", "All rows with '\u2014' are legacy runs. Generate a new post to see fully-populated data."],
+    ]
+    for entry in legend_data:
+        legend_ws.append(entry)
+    _autofit_columns(legend_ws)
+
+    primary_path = paths["excel_path"]
+    try:
+        wb.save(primary_path)
+        return {"path": primary_path, "status": "ok", "message": ""}
+    except PermissionError:
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        fallback_path = os.path.join(paths["stats_dir"], f"token_usage_{timestamp}.xlsx")
+        try:
+            wb.save(fallback_path)
+            return {
+                "path": fallback_path,
+                "status": "permission_error",
+                "message": (
+                    f"token_usage.xlsx is open in another program. "
+                    f"Saved to {os.path.basename(fallback_path)} instead. "
+                    "Close the file in Excel and re-export to overwrite the main file."
+                ),
+            }
+        except Exception as exc:
+            return {
+                "path": "",
+                "status": "error",
+                "message": f"Export failed: {exc}",
+            }
+    except Exception as exc:
+        return {"path": "", "status": "error", "message": f"Export failed: {exc}"}
+
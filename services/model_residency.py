@@ -0,0 +1,143 @@
+"""Keep the configured Ollama models resident instead of reloading them per run.
+
+Every generation request carries a ``keep_alive`` chosen here: pinned (never
+unload) while a bulk run holds the model, and an idle timeout otherwise so
+Ollama only unloads it after real inactivity. The warm-up and release pings
+carry the context size the model runs with (``services.context_window``), since
+a ping at another size would reload it. With a cascade every
+LLM_CASCADE_MODELS model gets the same pings as OLLAMA_MODEL, since most posts
+are answered by the first of them. Backends without keep_alive
+(OpenAI-compatible servers keep their model loaded) skip all of this.
+"""
+
+import threading
+from contextlib import contextmanager
+from typing import Iterator, List, Union
+
+import requests
+
+from config import (
+    LLM_CASCADE_MODELS,
+    LLM_KEEP_ALIVE_IDLE,
+    LLM_KEEP_ALIVE_PINNED,
+    LLM_TIMEOUT_SECONDS,
+    OLLAMA_MODEL,
+)
+from services.backends import get_backend
+from services.context_window import resident_options
+from services.endpoint_pool import get_generate_urls
+from services.ollama_client import post_json
+
+
+_pin_count = 0
+_pin_lock = threading.Lock()
+_warm_started = False
+_warm_lock = threading.Lock()
+
+
+def _parse_keep_alive(value: str) -> Union[int, str]:
+    # Ollama takes either seconds as a number or a duration string such as "30m".
+    text = (value or "").strip()
+    try:
+        return int(text)
+    except ValueError:
+        return text
+
+
+def get_keep_alive() -> Union[int, str]:
+    with _pin_lock:
+        pinned = _pin_count > 0
+    return _parse_keep_alive(LLM_KEEP_ALIVE_PINNED if pinned else LLM_KEEP_ALIVE_IDLE)
+
+
+def _resident_models() -> List[str]:
+    """Models kept loaded: the cascade's fast models first (they take the first request), then OLLAMA_MODEL."""
+    fast_models = [model for model in LLM_CASCADE_MODELS if model != OLLAMA_MODEL]
+    return fast_models + [OLLAMA_MODEL]
+
+
+def _send_keep_alive(keep_alive: Union[int, str]) -> bool:
+    """An empty prompt loads (or re-times) each model on every endpoint without generating anything."""
+    backend = get_backend()
+    if backend.IN_PROCESS:
+        # Loaded once and kept for the life of the process.
+        return backend.load_model()
+    if not backend.SUPPORTS_KEEP_ALIVE:
+        return True
+    any_ok = False
+    for model in _resident_models():
+        any_ok = _send_model_keep_alive(model, keep_alive) or any_ok
+    return any_ok
+
+
+def _send_model_keep_alive(model: str, keep_alive: Union[int, str]) -> bool:
+    payload = {"model": model, "prompt": "", "stream": False, "keep_alive": keep_alive}
+    options = {name: value for name, value in resident_options(model).items() if value}
+    if options:
+        payload["options"] = options
+    any_ok = False
+    for generate_url in get_generate_urls():
+        try:
+            response = post_json(
+                generate_url,
+                payload,
+                timeout_seconds=LLM_TIMEOUT_SECONDS,
+            )
+            response.close()
+            any_ok = any_ok or response.status_code == 200
+        except requests.exceptions.RequestException:
+            continue
+    return any_ok
+
+
+def warm_up_model() -> bool:
+    """Load the resident models now so the first real request does not pay the load time."""
+    return _send_keep_alive(get_keep_alive())
+
+
+def warm_up_model_in_background() -> None:
+    """Warm the model once per process without blocking the caller.
+
+    Streamlit reruns the script on every interaction, so later calls are no-ops
+    unless the previous attempt failed (for example Ollama was not started yet).
+    """
+    global _warm_started
+    with _warm_lock:
+        if _warm_started:
+            return
+        _warm_started = True
+
+    def _run() -> None:
+        global _warm_started
+        if not warm_up_model():
+            with _warm_lock:
+                _warm_started = False
+
+    threading.Thread(target=_run, daemon=True).start()
+
+
+@contextmanager
+def pinned_model() -> Iterator[None]:
+    """Keep the models loaded indefinitely for the duration of a bulk run."""
+    global _pin_count
+    with _pin_lock:
+        _pin_count += 1
+    try:
+        yield
+    finally:
+        with _pin_lock:
+            _pin_count -= 1
+        release_model()
+
+
+def release_model() -> None:
+    """Hand the model back to Ollama's idle timer instead of unloading it right away.
+
+    A pinned keep_alive would otherwise stick until the daemon restarts, and an
+    immediate ``ollama stop`` would throw away a model another client may be
+    about to use.
+    """
+    with _pin_lock:
+        if _pin_count > 0:
+            return
+    _send_keep_alive(_parse_keep_alive(LLM_KEEP_ALIVE_IDLE))
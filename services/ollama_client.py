@@ -0,0 +1,101 @@
+"""Shared keep-alive HTTP client for all LLM server traffic.
+
+One pooled ``requests.Session`` is created lazily and reused by generation,
+health and status calls so repeated requests skip the TCP handshake.
+"""
+
+import threading
+from typing import Any, Dict, Optional, Tuple
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from config import OLLAMA_CONNECT_TIMEOUT_SECONDS, OLLAMA_POOL_SIZE
+
+
+_session: Optional[requests.Session] = None
+_adapter: Optional[HTTPAdapter] = None
+_session_lock = threading.Lock()
+
+# Async (httpx) traffic does not go through the requests pool, so its
+# connection reuse is counted separately from httpcore trace events.
+_async_stats = {"requests_sent": 0, "connections_opened": 0}
+_async_stats_lock = threading.Lock()
+
+
+def get_session() -> requests.Session:
+    """Return the process-wide pooled session, creating it on first use."""
+    global _session, _adapter
+    if _session is None:
+        with _session_lock:
+            if _session is None:
+                adapter = HTTPAdapter(
+                    pool_connections=OLLAMA_POOL_SIZE,
+                    pool_maxsize=OLLAMA_POOL_SIZE,
+                )
+                session = requests.Session()
+                session.mount("http://", adapter)
+                session.mount("https://", adapter)
+                session.headers.update({"Connection": "keep-alive"})
+                _adapter = adapter
+                _session = session
+    return _session
+
+
+def _timeout(read_timeout_seconds: float) -> Tuple[float, float]:
+    return (OLLAMA_CONNECT_TIMEOUT_SECONDS, float(read_timeout_seconds))
+
+
+def post_json(
+    url: str,
+    payload: Dict[str, Any],
+    timeout_seconds: float,
+    stream: bool = False,
+    headers: Optional[Dict[str, str]] = None,
+) -> requests.Response:
+    return get_session().post(
+        url, json=payload, timeout=_timeout(timeout_seconds), stream=stream, headers=headers
+    )
+
+
+def get(url: str, timeout_seconds: float, headers: Optional[Dict[str, str]] = None) -> requests.Response:
+    return get_session().get(url, timeout=_timeout(timeout_seconds), headers=headers)
+
+
+async def trace_async_connection(event_name: str, info: Dict[str, Any]) -> None:
+    """httpx ``trace`` extension hook that counts requests and fresh TCP connections."""
+    if event_name.endswith("send_request_headers.started"):
+        key = "requests_sent"
+    elif event_name == "connection.connect_tcp.started":
+        key = "connections_opened"
+    else:
+        return
+    with _async_stats_lock:
+        _async_stats[key] += 1
+
+
+def get_pool_stats() -> Dict[str, Any]:
+    """Report how many requests were served over reused keep-alive connections."""
+    with _async_stats_lock:
+        requests_sent = _async_stats["requests_sent"]
+        connections_opened = _async_stats["connections_opened"]
+
+    if _adapter is not None:
+        pools = _adapter.poolmanager.pools
+        for key in list(pools.keys()):
+            pool = pools.get(key)
+            if pool is None:
+                continue
+            requests_sent += int(getattr(pool, "num_requests", 0))
+            connections_opened += int(getattr(pool, "num_connections", 0))
+
+    connections_reused = max(requests_sent - connections_opened, 0)
+    reuse_ratio = round(connections_reused / requests_sent, 4) if requests_sent else 0.0
+
+    return {
+        "pool_size": OLLAMA_POOL_SIZE,
+        "requests_sent": requests_sent,
+        "connections_opened": connections_opened,
+        "connections_reused": connections_reused,
+        "reuse_ratio": reuse_ratio,
+    }
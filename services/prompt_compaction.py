@@ -0,0 +1,286 @@
+"""Shrink solution code before it is embedded in the generation prompt.
+
+Comments, docstrings and redundant whitespace are removed with a small
+language-aware scanner (Python via ``tokenize``; SQL, C++ and Java via a
+literal-aware comment stripper), so string contents are never touched. If
+PROMPT_TOKEN_BUDGET is set and the prompt is still over it, the code is cut at
+a line boundary with a marker, unless that would leave it fewer than
+PROMPT_MIN_CODE_TOKENS. Only the prompt sees the compacted code; the post
+itself keeps the original.
+"""
+
+import io
+import re
+import tokenize
+from typing import Any, Dict, List, Optional, Tuple
+
+from config import PROMPT_COMPACTION_ENABLED, PROMPT_MIN_CODE_TOKENS, PROMPT_TOKEN_BUDGET
+from services.token_estimator import estimate_tokens
+
+_RAW_STRING_OPEN = re.compile(r'R"([^()\\\s]{0,16})\(')
+
+_LINE_COMMENT_MARKERS = {
+    "python": "#",
+    "sql": "--",
+    "c++": "//",
+    "java": "//",
+}
+
+
+def _drop_blank_lines(lines: List[str]) -> str:
+    return "\n".join(line.rstrip() for line in lines if line.strip())
+
+
+def _compact_python(code: str) -> Optional[str]:
+    try:
+        tokens = list(tokenize.generate_tokens(io.StringIO(code).readline))
+    except (tokenize.TokenError, IndentationError, SyntaxError):
+        return None
+
+    lines = code.split("\n")
+    comment_cols: Dict[int, int] = {}
+    drop_rows = set()
+    replace_rows: Dict[int, str] = {}
+    # Rows inside multi-line string literals must be kept byte for byte; the row the
+    # literal closes on is not protected, so code and comments after it are handled.
+    protected_rows = set()
+
+    structural = {tokenize.NL, tokenize.COMMENT, tokenize.INDENT, tokenize.DEDENT, tokenize.NEWLINE}
+    logical: List[tokenize.TokenInfo] = []
+    for index, token in enumerate(tokens):
+        if token.type == tokenize.COMMENT:
+            comment_cols[token.start[0]] = token.start[1]
+        if token.type == tokenize.STRING and token.end[0] > token.start[0]:
+            protected_rows.update(range(token.start[0] + 1, token.end[0]))
+
+        logical.append(token)
+        if token.type != tokenize.NEWLINE:
+            continue
+
+        significant = [t for t in logical if t.type not in structural]
+        if significant and all(t.type == tokenize.STRING for t in significant):
+            # A bare string statement (docstring) is a no-op.
+            first_row, last_row = significant[0].start[0], significant[-1].end[0]
+            rows = set(range(first_row, last_row + 1))
+            drop_rows.update(rows)
+            protected_rows.difference_update(rows)
+
+            following = next(
+                (t for t in tokens[index + 1:] if t.type not in (tokenize.NL, tokenize.COMMENT)),
+                None,
+            )
+            opens_block = any(t.type == tokenize.INDENT for t in logical)
+            closes_block = following is None or following.type in (tokenize.DEDENT, tokenize.ENDMARKER)
+            if opens_block and closes_block:
+                # The docstring was the whole body; keep the block valid.
+                drop_rows.discard(first_row)
+                replace_rows[first_row] = " " * significant[0].start[1] + "pass"
+        logical = []
+
+    output: List[str] = []
+    for row, line in enumerate(lines, start=1):
+        if row in replace_rows:
+            output.append(replace_rows[row])
+            continue
+        if row in drop_rows:
+            continue
+        if row in protected_rows:
+            output.append(line)
+            continue
+        if row in comment_cols:
+            line = line[: comment_cols[row]]
+        line = line.rstrip()
+        if line.strip():
+            output.append(line)
+    return "\n".join(output)
+
+
+def _identifier_before(code: str, index: int) -> str:
+    start = index
+    while start > 0 and (code[start - 1].isalnum() or code[start - 1] == "_"):
+        start -= 1
+    return code[start:index]
+
+
+def _raw_string_delimiter(code: str, index: int) -> Optional[str]:
+    """Return the closing sequence if a C++ raw string literal starts at ``index``."""
+    match = _RAW_STRING_OPEN.match(code, index)
+    if not match:
+        return None
+    if _identifier_before(code, index) not in ("", "u8", "u", "U", "L"):
+        return None
+    return f'){match.group(1)}"'
+
+
+def _strip_c_style(code: str, language: str) -> str:
+    """Remove comments, blank lines and extra whitespace outside of string and char literals."""
+    is_sql = language == "sql"
+    line_marker = "--" if is_sql else "//"
+    quotes = ("'", '"', "`") if is_sql else ("'", '"')
+
+    out: List[str] = []
+    line_begin = 0
+    i = 0
+    length = len(code)
+
+    def _end_line() -> None:
+        nonlocal line_begin
+        while len(out) > line_begin and not out[-1].strip():
+            out.pop()
+        if len(out) > line_begin:
+            out.append("\n")
+            line_begin = len(out)
+
+    def _space() -> None:
+        # Keep indentation; collapse runs between tokens to one space.
+        if len(out) > line_begin and out[-1].strip():
+            out.append(" ")
+
+    while i < length:
+        char = code[i]
+
+        if char == "\n":
+            _end_line()
+            i += 1
+            continue
+
+        if char in " \t":
+            end = i
+            while end < length and code[end] in " \t":
+                end += 1
+            if len(out) == line_begin:
+                out.append(code[i:end])
+            else:
+                _space()
+            i = end
+            continue
+
+        if code.startswith(line_marker, i):
+            while i < length and code[i] != "\n":
+                i += 1
+            continue
+
+        if code.startswith("/*", i):
+            end = code.find("*/", i + 2)
+            i = length if end == -1 else end + 2
+            # A comment separates tokens, it never joins them.
+            _space()
+            continue
+
+        literal_end = None
+        if language == "c++" and char == "R":
+            closing = _raw_string_delimiter(code, i)
+            if closing:
+                end = code.find(closing, i)
+                literal_end = length if end == -1 else end + len(closing)
+        elif language == "java" and code.startswith('"""', i):
+            end = code.find('"""', i + 3)
+            literal_end = length if end == -1 else end + 3
+        elif char in quotes and not _is_digit_separator(code, i, language):
+            end = i + 1
+            while end < length:
+                if code[end] == "\\":
+                    end += 2
+                    continue
+                if code[end] == char:
+                    # SQL escapes a quote by doubling it.
+                    if is_sql and end + 1 < length and code[end + 1] == char:
+                        end += 2
+                        continue
+                    break
+                if code[end] == "\n" and not is_sql:
+                    break
+                end += 1
+            literal_end = min(end + 1, length)
+
+        if literal_end is not None:
+            out.append(code[i:literal_end])
+            i = literal_end
+            continue
+
+        out.append(char)
+        i += 1
+
+    _end_line()
+    return "".join(out).rstrip("\n")
+
+
+def _is_digit_separator(code: str, index: int, language: str) -> bool:
+    """C++14 digit separators (1'000'000) are not char literals."""
+    if code[index] != "'" or language != "c++" or index == 0 or not code[index - 1].isalnum():
+        return False
+    return _identifier_before(code, index) not in ("u8", "u", "U", "L")
+
+
+def compact_code(code: str, language: str) -> str:
+    """Return ``code`` without comments, docstrings and redundant whitespace.
+
+    Unknown languages and Python that fails to tokenize only lose blank lines
+    and trailing whitespace.
+    """
+    normalized = (code or "").replace("\r\n", "\n").replace("\r", "\n")
+    lang = (language or "").strip().lower()
+
+    if lang == "python":
+        compacted = _compact_python(normalized)
+        if compacted is not None:
+            return compacted
+    elif lang in ("sql", "c++", "java"):
+        return _strip_c_style(normalized, lang)
+
+    return _drop_blank_lines(normalized.split("\n"))
+
+
+def _truncate_to_tokens(code: str, language: str, max_tokens: int) -> Tuple[str, int]:
+    lines = code.split("\n")
+    marker = _LINE_COMMENT_MARKERS.get((language or "").strip().lower(), "//")
+    # Cut by characters at this code's own chars-per-token ratio.
+    chars_per_token = len(code) / max(estimate_tokens(code), 1)
+    budget_chars = int(max_tokens * chars_per_token)
+
+    kept: List[str] = []
+    used = 0
+    for line in lines:
+        # Reserve room for the omission marker.
+        if used + len(line) + 1 > budget_chars - 80:
+            break
+        kept.append(line)
+        used += len(line) + 1
+
+    omitted = len(lines) - len(kept)
+    if omitted <= 0:
+        return code, 0
+    kept.append(f"{marker} ... {omitted} more lines omitted to fit the prompt token budget")
+    return "\n".join(kept), 1
+
+
+def prepare_prompt_code(code: str, language: str, overhead_tokens: int) -> Dict[str, Any]:
+    """Compact ``code`` and fit it into PROMPT_TOKEN_BUDGET minus the rest of the prompt.
+
+    Token counts come from ``services.token_estimator``; ``tokens_saved`` compares the original code
+    with what is actually sent. When the budget leaves less than PROMPT_MIN_CODE_TOKENS for the code
+    it is sent whole and ``over_budget`` is set: a post explaining a few lines of the solution is worse
+    than a prompt over the budget.
+    """
+    original_tokens = estimate_tokens(code)
+    prompt_code = compact_code(code, language) if PROMPT_COMPACTION_ENABLED else code
+
+    truncated = 0
+    over_budget = 0
+    if PROMPT_TOKEN_BUDGET > 0:
+        available = max(PROMPT_TOKEN_BUDGET - overhead_tokens, 0)
+        if estimate_tokens(prompt_code) > available:
+            if available < PROMPT_MIN_CODE_TOKENS:
+                over_budget = 1
+            else:
+                prompt_code, truncated = _truncate_to_tokens(prompt_code, language, available)
+
+    prompt_code_tokens = estimate_tokens(prompt_code)
+    return {
+        "code": prompt_code,
+        "original_tokens": original_tokens,
+        "prompt_code_tokens": prompt_code_tokens,
+        "tokens_saved": max(original_tokens - prompt_code_tokens, 0),
+        "truncated": truncated,
+        "over_budget": over_budget,
+    }
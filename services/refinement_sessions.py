@@ -0,0 +1,78 @@
+"""Conversation state of recent runs, kept so follow-up edits can reuse it.
+
+A session holds what the model has already seen for a run: the system block,
+the user/assistant turns and, on Ollama, the ``context`` token ids returned
+with the final chunk. Refining a post sends only the new instruction on top
+of that state (see ``generation_service.refine_solution_post``). Sessions live
+in a process-local LRU bounded by REFINEMENT_SESSION_MAX_ENTRIES; an evicted
+session is rebuilt from ``llm_runs`` without the token ids, so the refinement
+still works but the whole conversation is evaluated again.
+"""
+
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Optional
+
+from config import REFINEMENT_SESSION_MAX_ENTRIES
+from services.metrics_service import fetch_run
+
+
+_sessions: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+_sessions_lock = threading.Lock()
+
+
+def remember_session(run_id: str, session: Dict[str, Any]) -> None:
+    if REFINEMENT_SESSION_MAX_ENTRIES <= 0 or not run_id:
+        return
+    with _sessions_lock:
+        _sessions[run_id] = session
+        _sessions.move_to_end(run_id)
+        while len(_sessions) > REFINEMENT_SESSION_MAX_ENTRIES:
+            _sessions.popitem(last=False)
+
+
+def _session_from_history(run_id: str) -> Optional[Dict[str, Any]]:
+    row = fetch_run(run_id)
+    if row is None or row.get("error_type") or not row.get("llm_response_text"):
+        return None
+
+    # A refinement row logs only its own turn; the conversation before it comes from the parent.
+    if row.get("parent_run_id"):
+        parent = _session_from_history(row["parent_run_id"])
+        if parent is None:
+            return None
+        session = dict(parent)
+        prior_turns = parent["history"]
+    else:
+        # prompt_text is the full prompt, system block included.
+        session = {
+            "problem": {
+                "problem_number": row.get("problem_number") or "",
+                "problem_name": row.get("problem_name") or "",
+                "difficulty": row.get("difficulty") or "",
+                "link": row.get("problem_link") or "",
+                "code": row.get("code_text") or "",
+                "language": row.get("language") or "",
+            },
+            "include_repo_link": True,
+            "layout": row.get("prompt_layout") or "inline",
+            "system": "",
+        }
+        prior_turns = []
+
+    session["history"] = prior_turns + [
+        {"role": "user", "content": row.get("prompt_text") or ""},
+        {"role": "assistant", "content": row["llm_response_text"]},
+    ]
+    session["context"] = []
+    return session
+
+
+def get_session(run_id: str) -> Optional[Dict[str, Any]]:
+    """Return the session of ``run_id`` from memory, else rebuilt from ``llm_runs``; None if unusable."""
+    with _sessions_lock:
+        session = _sessions.get(run_id)
+        if session is not None:
+            _sessions.move_to_end(run_id)
+            return session
+    return _session_from_history(run_id)
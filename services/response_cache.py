@@ -0,0 +1,177 @@
+"""Two-tier cache of raw Ollama responses keyed by model, prompt and sampling options.
+
+Tier one is an in-process LRU; tier two is the ``llm_response_cache`` table in
+``llm_stats/runs.db`` so cached answers survive crashes and re-runs.
+"""
+
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Optional
+
+from config import (
+    LLM_CACHE_ENABLED,
+    LLM_CACHE_MAX_ENTRIES,
+    LLM_CACHE_MEMORY_ENTRIES,
+    LLM_CACHE_TTL_SECONDS,
+)
+from services.metrics_service import get_metrics_paths
+
+
+_memory: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+_memory_lock = threading.Lock()
+
+
+def build_cache_key(model: str, prompt_hash: str, temperature: float, num_predict: int) -> str:
+    raw = f"{model}|{prompt_hash}|{float(temperature)}|{int(num_predict)}"
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+
+def _connect() -> sqlite3.Connection:
+    paths = get_metrics_paths()
+    os.makedirs(paths["stats_dir"], exist_ok=True)
+    conn = sqlite3.connect(paths["db_path"])
+    conn.execute(
+        """
+        CREATE TABLE IF NOT EXISTS llm_response_cache (
+            cache_key TEXT PRIMARY KEY,
+            model TEXT,
+            prompt_hash TEXT,
+            temperature REAL,
+            num_predict INTEGER,
+            response_json TEXT NOT NULL,
+            created_at REAL NOT NULL,
+            last_access_at REAL NOT NULL,
+            hit_count INTEGER DEFAULT 0
+        )
+        """
+    )
+    return conn
+
+
+def _is_expired(created_at: float, now: float) -> bool:
+    return LLM_CACHE_TTL_SECONDS > 0 and now - created_at > LLM_CACHE_TTL_SECONDS
+
+
+def _remember(cache_key: str, entry: Dict[str, Any]) -> None:
+    with _memory_lock:
+        _memory[cache_key] = entry
+        _memory.move_to_end(cache_key)
+        while len(_memory) > LLM_CACHE_MEMORY_ENTRIES:
+            _memory.popitem(last=False)
+
+
+def get_cached_response(cache_key: str) -> Optional[Dict[str, Any]]:
+    """Return the cached Ollama response payload, or None on miss or expiry."""
+    if not LLM_CACHE_ENABLED:
+        return None
+
+    now = time.time()
+    with _memory_lock:
+        entry = _memory.get(cache_key)
+        if entry is not None:
+            if _is_expired(entry["created_at"], now):
+                del _memory[cache_key]
+            else:
+                _memory.move_to_end(cache_key)
+                return dict(entry["response_data"])
+
+    try:
+        conn = _connect()
+        try:
+            row = conn.execute(
+                "SELECT response_json, created_at FROM llm_response_cache WHERE cache_key = ?",
+                (cache_key,),
+            ).fetchone()
+            if row is None:
+                return None
+            if _is_expired(row[1], now):
+                conn.execute("DELETE FROM llm_response_cache WHERE cache_key = ?", (cache_key,))
+                conn.commit()
+                return None
+            conn.execute(
+                """
+                UPDATE llm_response_cache
+                SET last_access_at = ?, hit_count = hit_count + 1
+                WHERE cache_key = ?
+                """,
+                (now, cache_key),
+            )
+            conn.commit()
+        finally:
+            conn.close()
+        response_data = json.loads(row[0])
+    except (sqlite3.Error, ValueError):
+        return None
+
+    _remember(cache_key, {"response_data": response_data, "created_at": row[1]})
+    return dict(response_data)
+
+
+def store_cached_response(
+    cache_key: str,
+    model: str,
+    prompt_hash: str,
+    temperature: float,
+    num_predict: int,
+    response_data: Dict[str, Any],
+) -> None:
+    if not LLM_CACHE_ENABLED:
+        return
+
+    now = time.time()
+    # The Ollama KV ``context`` array is large and useless for replaying text.
+    payload = {key: value for key, value in response_data.items() if key != "context"}
+    _remember(cache_key, {"response_data": payload, "created_at": now})
+
+    try:
+        conn = _connect()
+        try:
+            conn.execute(
+                """
+                INSERT OR REPLACE INTO llm_response_cache
+                    (cache_key, model, prompt_hash, temperature, num_predict,
+                     response_json, created_at, last_access_at, hit_count)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, 0)
+                """,
+                (cache_key, model, prompt_hash, temperature, num_predict, json.dumps(payload), now, now),
+            )
+            if LLM_CACHE_TTL_SECONDS > 0:
+                conn.execute(
+                    "DELETE FROM llm_response_cache WHERE created_at < ?",
+                    (now - LLM_CACHE_TTL_SECONDS,),
+                )
+            conn.execute(
+                """
+                DELETE FROM llm_response_cache
+                WHERE cache_key NOT IN (
+                    SELECT cache_key FROM llm_response_cache
+                    ORDER BY last_access_at DESC
+                    LIMIT ?
+                )
+                """,
+                (LLM_CACHE_MAX_ENTRIES,),
+            )
+            conn.commit()
+        finally:
+            conn.close()
+    except sqlite3.Error:
+        pass
+
+
+def clear_response_cache() -> None:
+    with _memory_lock:
+        _memory.clear()
+    try:
+        conn = _connect()
+        try:
+            conn.execute("DELETE FROM llm_response_cache")
+            conn.commit()
+        finally:
+            conn.close()
+    except sqlite3.Error:
+        pass
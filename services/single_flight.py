@@ -0,0 +1,46 @@
+"""Share one in-flight Ollama request between identical concurrent callers.
+
+The first caller for a key becomes the leader and does the work; callers that
+arrive while it is running wait for the leader's result instead of taking
+another Ollama slot. Works across threads and event loops of one process.
+"""
+
+import asyncio
+import threading
+from typing import Any, Dict, Optional, Tuple
+
+
+_lock = threading.Lock()
+_flights: Dict[str, Dict[str, Any]] = {}
+
+
+def join_flight(key: str) -> Tuple[Dict[str, Any], bool]:
+    """Return the flight for ``key`` and whether the caller is its leader."""
+    with _lock:
+        flight = _flights.get(key)
+        if flight is not None:
+            flight["followers"] += 1
+            return flight, False
+        flight = {"done": threading.Event(), "result": None, "followers": 0}
+        _flights[key] = flight
+        return flight, True
+
+
+def land_flight(key: str, flight: Dict[str, Any], result: Optional[Dict[str, Any]]) -> None:
+    """Publish the leader's result (None if it failed unexpectedly) and wake the followers."""
+    with _lock:
+        if _flights.get(key) is flight:
+            del _flights[key]
+    flight["result"] = dict(result) if result is not None else None
+    flight["done"].set()
+
+
+def wait_for_flight(flight: Dict[str, Any], timeout_seconds: float) -> Optional[Dict[str, Any]]:
+    """Block until the leader lands; None on timeout or when the leader had no result."""
+    if not flight["done"].wait(timeout_seconds):
+        return None
+    return flight["result"]
+
+
+async def await_flight(flight: Dict[str, Any], timeout_seconds: float) -> Optional[Dict[str, Any]]:
+    return await asyncio.to_thread(wait_for_flight, flight, timeout_seconds)
@@ -0,0 +1,69 @@
+"""JSON-schema output mode selected with PROMPT_STRATEGY=json_schema_v1.
+
+Ollama's ``format`` parameter constrains decoding to OUTPUT_SCHEMA, so the model
+returns the post as fields instead of free-form markdown, and the markdown is
+rendered here with the exact section layout the rest of the pipeline expects.
+"""
+
+import json
+from typing import Any, Dict, Optional
+
+from config import PROMPT_STRATEGY, TITLE_LETTER_COUNT
+
+
+JSON_SCHEMA_STRATEGY = "json_schema_v1"
+
+_SECTIONS = [
+    ("intuition", "Intuition"),
+    ("approach", "Approach"),
+    ("time_complexity", "Time Complexity"),
+    ("space_complexity", "Space Complexity"),
+]
+
+OUTPUT_SCHEMA: Dict[str, Any] = {
+    "type": "object",
+    "properties": {
+        "title": {"type": "string", "maxLength": TITLE_LETTER_COUNT},
+        **{field: {"type": "string"} for field, _ in _SECTIONS},
+    },
+    "required": ["title"] + [field for field, _ in _SECTIONS],
+}
+
+
+def is_json_strategy(strategy: Optional[str] = None) -> bool:
+    return (strategy or PROMPT_STRATEGY).strip().lower() == JSON_SCHEMA_STRATEGY
+
+
+def build_json_instructions() -> str:
+    return f"""Instructions:
+
+1. Respond with one JSON object with exactly these string fields:
+- "title": a strong, descriptive, professional title that mentions the core technique used and the time complexity (Big-O notation). It must be {TITLE_LETTER_COUNT} characters or fewer and a complete phrase; shorten it by simplifying words, never by truncating.
+- "intuition": the key insight behind the solution.
+- "approach": the algorithm step by step; markdown lists are allowed.
+- "time_complexity": the Big-O time complexity with a one-line justification.
+- "space_complexity": the Big-O space complexity with a one-line justification.
+
+2. The explanation must match the provided language.
+3. Do NOT include any code or code blocks in any field.
+4. Keep every field concise, technical, and ready for markdown publishing.
+"""
+
+
+def render_post_from_json(text: str) -> Optional[str]:
+    """Render the schema fields as the markdown post body; None if the JSON is unusable."""
+    try:
+        data = json.loads(text or "")
+    except ValueError:
+        return None
+    if not isinstance(data, dict):
+        return None
+
+    title = " ".join(str(data.get("title") or "").split())
+    sections = [(heading, str(data.get(field) or "").strip()) for field, heading in _SECTIONS]
+    if not title or not all(body for _, body in sections):
+        return None
+
+    parts = [f"Title: {title}"]
+    parts.extend(f"## {heading}\n{body}" for heading, body in sections)
+    return "\n\n".join(parts)
@@ -0,0 +1,108 @@
+"""Per-request deadlines derived from this model's own latency history.
+
+Instead of waiting the flat LLM_TIMEOUT_SECONDS for every call, the deadline is
+the p99 prompt-eval cost for the estimated prompt size plus p99 generation and
+load time, times a safety margin. LLM_TIMEOUT_SECONDS stays the ceiling and is
+used as-is until enough successful runs exist. The same history sets how long
+a request may go without a first token before it is hedged.
+"""
+
+import math
+import threading
+import time
+from typing import Any, Dict, List, Optional
+
+from config import (
+    LLM_HEDGE_PERCENTILE,
+    LLM_TIMEOUT_MARGIN,
+    LLM_TIMEOUT_MIN_SAMPLES,
+    LLM_TIMEOUT_MIN_SECONDS,
+    LLM_TIMEOUT_SECONDS,
+    OLLAMA_MODEL,
+)
+from services.metrics_service import fetch_latency_history
+
+
+# History changes slowly; re-read it at most this often.
+_STATS_TTL_SECONDS = 300.0
+
+_lock = threading.Lock()
+_stats_cache: Dict[str, Dict[str, Any]] = {}
+
+
+def _percentile(values: List[float], pct: float) -> float:
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = max(0, min(len(ordered) - 1, math.ceil(pct / 100 * len(ordered)) - 1))
+    return ordered[rank]
+
+
+def _build_stats(rows: List[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+    samples = [row for row in rows if (row.get("prompt_tokens") or 0) > 0]
+    if len(samples) < LLM_TIMEOUT_MIN_SAMPLES:
+        return None
+
+    return {
+        "samples": float(len(samples)),
+        "p99_prompt_ms_per_token": _percentile(
+            [(row.get("prompt_eval_ms") or 0.0) / row["prompt_tokens"] for row in samples], 99
+        ),
+        "p99_generation_ms": _percentile([row.get("generation_ms") or 0.0 for row in samples], 99),
+        "p99_load_ms": _percentile([row.get("load_duration_ms") or 0.0 for row in samples], 99),
+        "first_token_ms": [
+            row["time_to_first_token_ms"] for row in rows if (row.get("time_to_first_token_ms") or 0) > 0
+        ],
+        "request_ms": [
+            row.get("wall_clock_ms") or row.get("total_duration_ms") or 0.0
+            for row in rows
+            if (row.get("wall_clock_ms") or row.get("total_duration_ms") or 0) > 0
+        ],
+    }
+
+
+def _latency_stats(model: str) -> Optional[Dict[str, Any]]:
+    now = time.monotonic()
+    with _lock:
+        cached = _stats_cache.get(model)
+        if cached is not None and now - cached["loaded_at"] < _STATS_TTL_SECONDS:
+            return cached["stats"]
+
+    try:
+        stats = _build_stats(fetch_latency_history(model))
+    except Exception:
+        stats = None
+
+    with _lock:
+        _stats_cache[model] = {"stats": stats, "loaded_at": now}
+    return stats
+
+
+def compute_request_timeout(estimated_prompt_tokens: int, model: str = OLLAMA_MODEL) -> float:
+    """Return the read deadline in seconds for a prompt of ``estimated_prompt_tokens`` tokens."""
+    stats = _latency_stats(model)
+    if stats is None:
+        return float(LLM_TIMEOUT_SECONDS)
+
+    expected_ms = (
+        estimated_prompt_tokens * stats["p99_prompt_ms_per_token"]
+        + stats["p99_generation_ms"]
+        + stats["p99_load_ms"]
+    )
+    deadline = expected_ms / 1000 * LLM_TIMEOUT_MARGIN
+    return round(min(max(deadline, LLM_TIMEOUT_MIN_SECONDS), LLM_TIMEOUT_SECONDS), 2)
+
+
+def compute_hedge_delay(streamed: bool, model: str = OLLAMA_MODEL) -> Optional[float]:
+    """Seconds to wait for a first token (``streamed``) or a whole reply before hedging.
+
+    Returns LLM_HEDGE_PERCENTILE of that latency over recent runs, or None
+    while there are too few samples to tell a stall from a normal request.
+    """
+    stats = _latency_stats(model)
+    if stats is None:
+        return None
+    samples = stats["first_token_ms"] if streamed else stats["request_ms"]
+    if len(samples) < LLM_TIMEOUT_MIN_SAMPLES:
+        return None
+    return round(_percentile(samples, LLM_HEDGE_PERCENTILE) / 1000, 3)
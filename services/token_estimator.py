@@ -0,0 +1,104 @@
+"""Prompt token counts known before a request is dispatched.
+
+The server only reports ``prompt_tokens`` after it has processed the prompt,
+which is too late for scheduling, budget and deadline decisions. With
+LLM_TOKENIZER set, text is counted with that Hugging Face tokenizer (optional
+``tokenizers`` package); otherwise characters are divided by the
+chars-per-token ratio fitted on this model's own ``prompt_chars`` /
+``prompt_tokens`` history, or by 4 until TOKEN_ESTIMATE_MIN_SAMPLES runs exist.
+Every run logs its estimate and method next to the real count, so the error
+stays visible over time (``fetch_token_estimate_error``).
+"""
+
+import math
+import os
+import threading
+import time
+from typing import Any, Dict, List, Optional
+
+from config import LLM_TOKENIZER, OLLAMA_MODEL, TOKEN_ESTIMATE_MIN_SAMPLES
+from services.metrics_service import fetch_latency_history
+
+
+# History changes slowly; re-fit the ratio at most this often.
+_STATS_TTL_SECONDS = 300.0
+DEFAULT_CHARS_PER_TOKEN = 4.0
+
+_lock = threading.Lock()
+_ratio_cache: Dict[str, Dict[str, Any]] = {}
+_tokenizer_state: Dict[str, Any] = {}
+
+
+def _load_tokenizer():
+    """Return the LLM_TOKENIZER tokenizer, or None; a failed load is not retried."""
+    with _lock:
+        if "tokenizer" in _tokenizer_state:
+            return _tokenizer_state["tokenizer"]
+
+    tokenizer = None
+    if LLM_TOKENIZER:
+        try:
+            from tokenizers import Tokenizer
+
+            if os.path.isfile(LLM_TOKENIZER):
+                tokenizer = Tokenizer.from_file(LLM_TOKENIZER)
+            else:
+                tokenizer = Tokenizer.from_pretrained(LLM_TOKENIZER)
+        except Exception:
+            tokenizer = None
+
+    with _lock:
+        _tokenizer_state["tokenizer"] = tokenizer
+    return tokenizer
+
+
+def _fit_chars_per_token(rows: List[Dict[str, Any]]) -> Optional[float]:
+    samples = [
+        row for row in rows if (row.get("prompt_tokens") or 0) > 0 and (row.get("prompt_chars") or 0) > 0
+    ]
+    if len(samples) < TOKEN_ESTIMATE_MIN_SAMPLES:
+        return None
+    total_chars = sum(row["prompt_chars"] for row in samples)
+    total_tokens = sum(row["prompt_tokens"] for row in samples)
+    return total_chars / total_tokens
+
+
+def fitted_chars_per_token(model: str = OLLAMA_MODEL) -> Optional[float]:
+    """Chars-per-token ratio of ``model``'s logged prompts, or None without enough history."""
+    now = time.monotonic()
+    with _lock:
+        cached = _ratio_cache.get(model)
+        if cached is not None and now - cached["loaded_at"] < _STATS_TTL_SECONDS:
+            return cached["ratio"]
+
+    try:
+        ratio = _fit_chars_per_token(fetch_latency_history(model))
+    except Exception:
+        ratio = None
+
+    with _lock:
+        _ratio_cache[model] = {"ratio": ratio, "loaded_at": now}
+    return ratio
+
+
+def estimate_prompt_tokens(text: str, model: str = OLLAMA_MODEL) -> Dict[str, Any]:
+    """Return ``{"tokens", "method"}`` for ``text``.
+
+    ``method`` is ``tokenizer``, ``calibrated`` (history ratio) or ``default``
+    (4 chars per token).
+    """
+    text = text or ""
+    tokenizer = _load_tokenizer()
+    if tokenizer is not None:
+        return {"tokens": len(tokenizer.encode(text).ids), "method": "tokenizer"}
+
+    ratio = fitted_chars_per_token(model)
+    method = "calibrated" if ratio else "default"
+    return {
+        "tokens": int(math.ceil(len(text) / (ratio or DEFAULT_CHARS_PER_TOKEN))),
+        "method": method,
+    }
+
+
+def estimate_tokens(text: str, model: str = OLLAMA_MODEL) -> int:
+    return estimate_prompt_tokens(text, model)["tokens"]
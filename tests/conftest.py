@@ -0,0 +1,135 @@
+import asyncio
+import json
+import os
+import sys
+import tempfile
+import threading
+import types
+
+import pytest
+import requests
+
+# config refuses to load without a repository path; the unit tests never touch it.
+os.environ.setdefault("LEETCODE_REPO_PATH", tempfile.gettempdir())
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+class FakeResponse:
+    """Scripted Ollama response: streams ``text`` a line per chunk, or returns it whole from ``json()``.
+
+    After ``hold_after`` chunks the stream stalls until ``release()`` or
+    ``close()``; a closed stream fails its next read, as a closed socket does.
+    ``delay`` is how long an async client waits for this response.
+    """
+
+    def __init__(self, text="", status_code=200, hold_after=None, delay=0.0):
+        self.text = text
+        self.status_code = status_code
+        self.hold_after = hold_after
+        self.delay = delay
+        self.sent = 0
+        self.closed = threading.Event()
+        self.held = threading.Event()
+        self._resume = threading.Event()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def release(self):
+        self._resume.set()
+
+    def close(self):
+        self.closed.set()
+        self._resume.set()
+
+    def _read(self):
+        if self.sent == self.hold_after:
+            self.held.set()
+            self._resume.wait(5)
+        if self.closed.is_set():
+            raise requests.exceptions.ConnectionError("connection closed")
+
+    def iter_lines(self):
+        for piece in self.text.splitlines(keepends=True):
+            self._read()
+            self.sent += 1
+            yield json.dumps({"response": piece, "done": False}).encode()
+        self._read()
+        yield json.dumps({"response": "", **self._final()}).encode()
+
+    def json(self):
+        self._read()
+        return {"response": self.text, **self._final()}
+
+    def _final(self):
+        return {"done": True, "done_reason": "stop", "prompt_eval_count": 40, "eval_count": len(self.text.split())}
+
+
+class FakeServer:
+    """Stands in for ``generation_service._post_generation`` and the async client.
+
+    Queued responses are handed out in call order.
+    """
+
+    def __init__(self):
+        self.queued = []
+        self.payloads = []
+        self.responses = []
+        self._lock = threading.Lock()
+
+    def queue(self, *responses):
+        self.queued.extend(responses)
+
+    def _next(self, payload):
+        with self._lock:
+            if not self.queued:
+                raise AssertionError("unexpected request for model " + payload.get("model", ""))
+            response = self.queued.pop(0)
+            self.payloads.append(payload)
+            self.responses.append(response)
+        return response
+
+    def post(self, backend, generate_url, payload, timeout_seconds, stream):
+        return self._next(payload)
+
+    async def apost(self, url, json=None, headers=None, timeout=None, extensions=None):
+        response = self._next(json)
+        try:
+            await asyncio.sleep(response.delay)
+        except asyncio.CancelledError:
+            response.close()
+            raise
+        return response
+
+    @property
+    def async_client(self):
+        return types.SimpleNamespace(post=self.apost)
+
+
+@pytest.fixture
+def fake_server(monkeypatch, tmp_path):
+    """Generation requests answered by a ``FakeServer``, with run history and shared state kept per test."""
+    from services import (
+        circuit_breaker,
+        context_window,
+        endpoint_pool,
+        generation_service,
+        metrics_service,
+        response_cache,
+        timeout_policy,
+    )
+
+    server = FakeServer()
+    monkeypatch.setattr(generation_service, "_post_generation", server.post)
+    monkeypatch.setattr(generation_service, "LLM_MAX_RETRIES", 0)
+    monkeypatch.setattr(metrics_service, "_base_dir", lambda: str(tmp_path))
+    monkeypatch.setattr(circuit_breaker, "_breakers", {})
+    monkeypatch.setattr(endpoint_pool, "_endpoints", {})
+    monkeypatch.setattr(endpoint_pool, "_throughput_loaded", True)
+    monkeypatch.setattr(timeout_policy, "_stats_cache", {})
+    monkeypatch.setattr(context_window, "_last_num_ctx", {})
+    monkeypatch.setattr(response_cache, "_memory", type(response_cache._memory)())
+    return server
@@ -0,0 +1,30 @@
+import importlib
+
+import pytest
+
+from current import config
+from services.artifacts import resolve_artifacts
+
+
+def test_resolve_artifacts_normalizes_and_deduplicates():
+    assert resolve_artifacts([" README_blurb", "changelog_line", "readme_blurb"]) == ["readme_blurb", "changelog_line"]
+    assert resolve_artifacts(None) == []
+
+
+def test_unknown_artifact_in_the_environment_fails_at_config_load(monkeypatch):
+    monkeypatch.setenv("LLM_ARTIFACTS", "readme_blurb, tweet")
+    try:
+        with pytest.raises(ValueError, match="LLM_ARTIFACTS: Unknown artifact 'tweet'"):
+            importlib.reload(config)
+    finally:
+        monkeypatch.undo()
+        importlib.reload(config)
+
+
+def test_artifacts_from_the_environment_are_resolved_at_config_load(monkeypatch):
+    monkeypatch.setenv("LLM_ARTIFACTS", "Changelog_Line,,readme_blurb")
+    try:
+        assert importlib.reload(config).LLM_ARTIFACTS == ["changelog_line", "readme_blurb"]
+    finally:
+        monkeypatch.undo()
+        importlib.reload(config)
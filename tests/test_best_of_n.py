@@ -0,0 +1,74 @@
+import asyncio
+import time
+
+from conftest import FakeResponse
+from services.generation_service import (
+    _arace,
+    _best_of_n_winner,
+    _generate_best_of_n,
+    _passes_quality_gate,
+    build_generation_request,
+)
+from test_hedging import POST, PROBLEM
+
+
+WITHOUT_INTUITION = POST.replace("## Intuition\nRemember what was seen.\n", "")
+WITHOUT_APPROACH_OR_INTUITION = WITHOUT_INTUITION.replace("## Approach\n1. Walk once.\n", "")
+
+
+def _best_of(attempts=2):
+    started_at = time.perf_counter()
+    generation = _generate_best_of_n(PROBLEM, build_generation_request(**PROBLEM), attempts, False)
+    return generation, time.perf_counter() - started_at
+
+
+def _returned_text(generation):
+    return generation["attempts"][generation["winner"]][1]["llm_response_text"]
+
+
+def test_a_losing_stream_is_closed_without_waiting_for_its_next_chunk(fake_server):
+    # Whichever attempt gets the stalled stream has read one chunk when the other passes the gate.
+    stalled = FakeResponse(POST, hold_after=1)
+    fake_server.queue(stalled, FakeResponse(POST))
+    generation, elapsed = _best_of()
+    assert generation["kind"] == "best_of_n"
+    assert stalled.closed.is_set()
+    assert stalled.sent == 1
+    assert elapsed < 2
+    assert _returned_text(generation) == POST.strip()
+    outcomes = [outcome for _, outcome, _ in generation["attempts"]]
+    assert sorted(outcome["error_type"] for outcome in outcomes) == ["", "CANCELLED"]
+
+
+def test_without_a_passing_attempt_the_best_scoring_one_is_returned(fake_server):
+    fake_server.queue(FakeResponse(WITHOUT_APPROACH_OR_INTUITION), FakeResponse(WITHOUT_INTUITION))
+    generation, _ = _best_of()
+    assert len(generation["attempts"]) == 2
+    assert _returned_text(generation) == WITHOUT_INTUITION.strip()
+
+
+def test_async_best_of_n_cancels_the_slow_attempt_and_keeps_the_passing_one(fake_server):
+    slow = FakeResponse(POST, delay=5)
+    fake_server.queue(FakeResponse(WITHOUT_INTUITION), slow, FakeResponse(POST))
+    request = build_generation_request(**PROBLEM)
+
+    async def _race():
+        return await _arace(
+            fake_server.async_client,
+            30,
+            request,
+            PROBLEM["code"],
+            PROBLEM["language"],
+            False,
+            time.perf_counter(),
+            _passes_quality_gate,
+            attempts=3,
+        )
+
+    started_at = time.perf_counter()
+    results, winner = asyncio.run(_race())
+    assert time.perf_counter() - started_at < 2
+    assert slow.closed.is_set()
+    assert results[winner][0]["llm_response_text"] == POST.strip()
+    assert _best_of_n_winner(results, winner) == winner
+    assert sorted(outcome["error_type"] for outcome, _ in results.values()) == ["", "", "CANCELLED"]
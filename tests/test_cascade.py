@@ -0,0 +1,115 @@
+import asyncio
+import time
+
+from conftest import FakeResponse
+from services import model_residency
+from services.generation_service import (
+    _arun_generation_plan,
+    _generate_cascade,
+    _new_outcome,
+    build_generation_request,
+)
+from test_hedging import POST, PROBLEM
+
+
+MODELS = ["tiny", "small", "mistral"]
+WITHOUT_INTUITION = POST.replace("## Intuition\nRemember what was seen.\n", "")
+LONG_TITLE = POST.replace("Title: Hash Map Lookup", "Title: " + "Very Long Title " * 6)
+
+
+def _cascade(fake_server, *responses):
+    fake_server.queue(*responses)
+    chunks = []
+    generation = _generate_cascade(PROBLEM, build_generation_request(**PROBLEM), MODELS, False, chunks.append)
+    return generation, "".join(chunks)
+
+
+def _hop_models(fake_server):
+    return [payload["model"] for payload in fake_server.payloads]
+
+
+def _returned(generation):
+    return generation["attempts"][generation["winner"]][1]
+
+
+def test_the_first_passing_model_is_returned_without_escalating(fake_server):
+    generation, streamed = _cascade(fake_server, FakeResponse(POST))
+    assert _hop_models(fake_server) == ["tiny"]
+    assert generation["kind"] == "cascade"
+    assert generation["winner"] == 0
+    assert _returned(generation)["response_data"]["model"] == "tiny"
+    # Only the last model streams live; an accepted early post is passed on when it settles.
+    assert not generation["live"] and streamed == ""
+
+
+def test_a_failed_request_advances_to_the_next_model(fake_server):
+    generation, streamed = _cascade(fake_server, FakeResponse(status_code=400), FakeResponse(POST))
+    assert _hop_models(fake_server) == ["tiny", "small"]
+    assert generation["winner"] == 1
+    assert _returned(generation)["response_data"]["model"] == "small"
+
+
+def test_a_low_score_or_overlong_title_advances_to_the_next_model(fake_server):
+    generation, streamed = _cascade(
+        fake_server, FakeResponse(WITHOUT_INTUITION), FakeResponse(LONG_TITLE), FakeResponse(POST)
+    )
+    assert _hop_models(fake_server) == MODELS
+    assert generation["winner"] == 2
+    assert generation["live"]
+    assert streamed == POST
+
+
+def test_without_a_passing_model_the_last_post_is_returned(fake_server):
+    generation, _ = _cascade(
+        fake_server, FakeResponse(LONG_TITLE), FakeResponse(WITHOUT_INTUITION), FakeResponse(WITHOUT_INTUITION)
+    )
+    assert generation["winner"] == 2
+    assert _returned(generation)["response_data"]["model"] == "mistral"
+
+
+def test_when_the_last_model_fails_the_best_earlier_post_is_returned(fake_server):
+    generation, _ = _cascade(
+        fake_server, FakeResponse(WITHOUT_INTUITION), FakeResponse(LONG_TITLE), FakeResponse(status_code=400)
+    )
+    assert generation["winner"] == 1
+    assert _returned(generation)["response_data"]["model"] == "small"
+    assert not generation["live"]
+
+
+def test_async_cascade_advances_the_same_way(fake_server):
+    fake_server.queue(FakeResponse(WITHOUT_INTUITION), FakeResponse(POST))
+    request = build_generation_request(**PROBLEM)
+    plan = {"strategy": "cascade", "models": MODELS}
+    generation = asyncio.run(
+        _arun_generation_plan(
+            fake_server.async_client, plan, PROBLEM, request, _new_outcome(), False, time.perf_counter()
+        )
+    )
+    assert _hop_models(fake_server) == ["tiny", "small"]
+    assert generation["winner"] == 1
+    assert _returned(generation)["response_data"]["model"] == "small"
+
+
+def test_warm_up_loads_every_cascade_model(monkeypatch):
+    pinged = []
+
+    class _Reply:
+        status_code = 200
+
+        def close(self):
+            pass
+
+    def _post_json(generate_url, payload, timeout_seconds):
+        pinged.append((generate_url, payload["model"], payload["keep_alive"]))
+        return _Reply()
+
+    monkeypatch.setattr(model_residency, "LLM_CASCADE_MODELS", ["tiny", "small"])
+    monkeypatch.setattr(model_residency, "OLLAMA_MODEL", "mistral")
+    monkeypatch.setattr(model_residency, "get_generate_urls", lambda: ["http://a/api/generate"])
+    monkeypatch.setattr(model_residency, "resident_options", lambda model: {})
+    monkeypatch.setattr(model_residency, "post_json", _post_json)
+    monkeypatch.setattr(model_residency, "get_keep_alive", lambda: "30m")
+
+    assert model_residency.warm_up_model()
+    assert [model for _, model, _ in pinged] == ["tiny", "small", "mistral"]
+    assert all(keep_alive == "30m" for _, _, keep_alive in pinged)
@@ -0,0 +1,103 @@
+import pytest
+
+from services import circuit_breaker
+from services.circuit_breaker import (
+    CLOSED,
+    HALF_OPEN,
+    OPEN,
+    allow_request,
+    get_breaker_states,
+    is_open,
+    record_failure,
+    record_success,
+)
+
+
+URL = "http://ollama-a:11434"
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def monotonic(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    fake = _Clock()
+    monkeypatch.setattr(circuit_breaker, "_breakers", {})
+    monkeypatch.setattr(circuit_breaker, "LLM_CIRCUIT_FAILURE_THRESHOLD", 3)
+    monkeypatch.setattr(circuit_breaker, "LLM_CIRCUIT_RESET_SECONDS", 30.0)
+    # The module only reads time.monotonic().
+    monkeypatch.setattr(circuit_breaker, "time", fake)
+    return fake
+
+
+def _state(key: str = URL) -> str:
+    return get_breaker_states()[key]["state"]
+
+
+def _open(key: str = URL) -> None:
+    for _ in range(3):
+        assert allow_request(key)
+        record_failure(key)
+
+
+def test_opens_after_threshold_consecutive_failures(clock):
+    record_failure(URL)
+    record_failure(URL)
+    assert _state() == CLOSED and allow_request(URL)
+    record_failure(URL)
+    assert _state() == OPEN
+    assert is_open(URL) and not allow_request(URL)
+
+
+def test_success_resets_the_failure_count(clock):
+    record_failure(URL)
+    record_failure(URL)
+    record_success(URL)
+    record_failure(URL)
+    record_failure(URL)
+    assert _state() == CLOSED
+
+
+def test_half_open_lets_one_probe_through_after_the_cooldown(clock):
+    _open()
+    clock.now += 29.9
+    assert not allow_request(URL)
+    assert get_breaker_states()[URL]["seconds_until_probe"] == pytest.approx(0.1)
+    clock.now += 0.1
+    assert not is_open(URL)
+    assert allow_request(URL)
+    assert _state() == HALF_OPEN
+    # Only one probe at a time.
+    assert is_open(URL) and not allow_request(URL)
+
+
+def test_successful_probe_closes(clock):
+    _open()
+    clock.now += 30
+    assert allow_request(URL)
+    record_success(URL)
+    assert _state() == CLOSED
+    assert allow_request(URL) and allow_request(URL)
+
+
+def test_failed_probe_reopens_for_another_cooldown(clock):
+    _open()
+    clock.now += 30
+    assert allow_request(URL)
+    record_failure(URL)
+    assert _state() == OPEN and not allow_request(URL)
+    clock.now += 29
+    assert not allow_request(URL)
+    clock.now += 1
+    assert allow_request(URL)
+
+
+def test_endpoints_are_independent(clock):
+    _open()
+    assert allow_request("http://ollama-b:11434")
+    assert _state("http://ollama-b:11434") == CLOSED
@@ -0,0 +1,60 @@
+import pytest
+
+from services import context_window
+from services.context_window import bucket_num_ctx, remember_num_ctx, request_options, resident_options
+
+
+@pytest.fixture(autouse=True)
+def buckets(monkeypatch):
+    monkeypatch.setattr(context_window, "LLM_NUM_CTX_BUCKETS", [2048, 4096, 8192])
+    monkeypatch.setattr(context_window, "LLM_NUM_PREDICT", 800)
+    monkeypatch.setattr(context_window, "LLM_NUM_THREAD", 0)
+    monkeypatch.setattr(context_window, "_last_num_ctx", {})
+    monkeypatch.setattr(context_window, "fetch_common_num_ctx", lambda model: 0)
+
+
+@pytest.mark.parametrize(
+    "needed, expected",
+    [
+        (0, 2048),
+        (2048, 2048),
+        (2049, 4096),
+        (4096, 4096),
+        (8192, 8192),
+        (8193, 16384),
+        (16385, 24576),
+    ],
+)
+def test_bucket_boundaries(needed, expected):
+    assert bucket_num_ctx(needed) == expected
+
+
+def test_no_buckets_leaves_num_ctx_to_the_server(monkeypatch):
+    monkeypatch.setattr(context_window, "LLM_NUM_CTX_BUCKETS", [])
+    assert bucket_num_ctx(100) == 0
+    assert resident_options("mistral")["num_ctx"] == 0
+
+
+def test_request_counts_prompt_context_and_num_predict():
+    assert request_options({"estimated_prompt_tokens": 1248})["num_ctx"] == 2048
+    assert request_options({"estimated_prompt_tokens": 1249})["num_ctx"] == 4096
+    assert request_options({"estimated_prompt_tokens": 100, "num_predict": 2000})["num_ctx"] == 4096
+    # A refinement's context ids are already in the window.
+    assert request_options({"estimated_prompt_tokens": 40, "context": list(range(1300))})["num_ctx"] == 4096
+
+
+def test_num_thread_is_passed_through_and_never_negative(monkeypatch):
+    monkeypatch.setattr(context_window, "LLM_NUM_THREAD", 6)
+    assert request_options({"estimated_prompt_tokens": 10})["num_thread"] == 6
+    monkeypatch.setattr(context_window, "LLM_NUM_THREAD", -1)
+    assert request_options({"estimated_prompt_tokens": 10})["num_thread"] == 0
+
+
+def test_resident_options_follow_the_last_request_then_history_then_smallest(monkeypatch):
+    assert resident_options("mistral")["num_ctx"] == 2048
+    monkeypatch.setattr(context_window, "fetch_common_num_ctx", lambda model: 8192)
+    assert resident_options("mistral")["num_ctx"] == 8192
+    remember_num_ctx("mistral", 4096)
+    remember_num_ctx("mistral", 0)
+    assert resident_options("mistral")["num_ctx"] == 4096
+    assert resident_options("llama3.2:3b")["num_ctx"] == 8192
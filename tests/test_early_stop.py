@@ -0,0 +1,83 @@
+import json
+import time
+
+from services.generation_service import EARLY_STOP_REASON, _completed_sections_end, _consume_stream
+
+
+HEAD = """Title: Hash Map Lookup
+## Intuition
+Remember what was seen.
+## Approach
+1. Walk once.
+## Time Complexity
+O(n)
+"""
+
+
+class _Response:
+    """Ollama NDJSON stream that records how far it was read."""
+
+    def __init__(self, pieces):
+        self.pieces = pieces
+        self.sent = 0
+        self.closed = False
+
+    def iter_lines(self):
+        for piece in self.pieces:
+            if self.closed:
+                return
+            self.sent += 1
+            yield json.dumps({"response": piece, "done": False}).encode()
+        yield json.dumps({"response": "", "done": True, "done_reason": "stop"}).encode()
+
+    def close(self):
+        self.closed = True
+
+
+def _stream(pieces):
+    forwarded = []
+    response = _Response(pieces)
+    started_at = time.perf_counter()
+    stats, _ = _consume_stream(response, forwarded.append, started_at, started_at + 60, stop_when_complete=True)
+    return stats, "".join(forwarded), response
+
+
+def test_still_inside_the_post_until_space_complexity_has_a_body():
+    assert _completed_sections_end(HEAD) is None
+    assert _completed_sections_end(HEAD + "## Space Complexity\n") is None
+    assert _completed_sections_end(HEAD + "## Space Complexity\n## Code\n") is None
+
+
+def test_space_complexity_ends_at_the_next_heading_rule_or_fence():
+    post = HEAD + "## Space Complexity\nO(n) for the map.\n"
+    for tail in ("## Code\n", "---", "```python\n", "# Notes\n"):
+        assert _completed_sections_end(post + tail) == len(post)
+
+
+def test_a_multi_paragraph_space_complexity_section_is_kept_whole():
+    post = (
+        HEAD
+        + "## Space Complexity\nO(n) for the hash map.\n\n"
+        + "Note that the recursion stack adds O(h) on top.\n\n### Worst case\nA chain gives O(n).\n"
+    )
+    assert _completed_sections_end(post) is None
+    assert _completed_sections_end(post + "## Code\n") == len(post)
+
+
+def test_stream_is_closed_at_the_cut_and_nothing_past_it_is_forwarded():
+    post = HEAD + "## Space Complexity\nO(n) for the hash map.\n\nThe stack adds O(h).\n"
+    pieces = [line + "\n" for line in post.split("\n")[:-1]] + ["## Co", "de\n", "```python\n", "pass\n"]
+    stats, forwarded, response = _stream(pieces)
+    assert response.closed
+    assert response.sent == len(pieces) - 2
+    assert stats["done_reason"] == EARLY_STOP_REASON
+    assert stats["response"] == post
+    assert forwarded == post
+
+
+def test_stream_without_a_cut_forwards_everything():
+    post = HEAD + "## Space Complexity\nO(n) for the hash map."
+    stats, forwarded, response = _stream([post[:40], post[40:]])
+    assert not response.closed
+    assert forwarded == post
+    assert stats["done_reason"] == "stop"
@@ -0,0 +1,27 @@
+from services import endpoint_pool
+
+
+class _Reply:
+    status_code = 200
+
+
+def test_health_is_probed_again_only_once_the_interval_has_passed(monkeypatch):
+    probes = []
+
+    def _get(url, timeout_seconds, headers=None):
+        probes.append(url)
+        return _Reply()
+
+    monkeypatch.setattr(endpoint_pool, "OLLAMA_ENDPOINTS", ["http://a:11434", "http://b:11434"])
+    monkeypatch.setattr(endpoint_pool, "OLLAMA_HEALTH_CHECK_INTERVAL_SECONDS", 30)
+    monkeypatch.setattr(endpoint_pool, "_endpoints", {})
+    monkeypatch.setattr(endpoint_pool, "_last_health_check", 0.0)
+    monkeypatch.setattr(endpoint_pool, "get", _get)
+
+    assert endpoint_pool.refresh_endpoint_health_if_stale() == {"http://a:11434": True, "http://b:11434": True}
+    assert endpoint_pool.refresh_endpoint_health_if_stale() is None
+    assert len(probes) == 2
+
+    monkeypatch.setattr(endpoint_pool, "_last_health_check", endpoint_pool._last_health_check - 31)
+    assert endpoint_pool.refresh_endpoint_health_if_stale() is not None
+    assert len(probes) == 4
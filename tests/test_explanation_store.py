@@ -0,0 +1,106 @@
+import pytest
+
+from services.explanation_store import algorithm_fingerprint
+
+
+TWO_SUM = {
+    "Python": """class Solution:
+    def twoSum(self, nums, target):
+        seen = {}  # value -> index
+        for i, num in enumerate(nums):
+            if target - num in seen:
+                return [seen[target - num], i]
+            seen[num] = i
+""",
+    "Java": """class Solution {
+    public int[] twoSum(int[] nums, int target) {
+        Map<Integer, Integer> seen = new HashMap<>();
+        for (int i = 0; i < nums.length; i++) {
+            if (seen.containsKey(target - nums[i])) return new int[] {seen.get(target - nums[i]), i};
+            seen.put(nums[i], i);
+        }
+        return new int[] {};
+    }
+}
+""",
+    "C++": """class Solution {
+public:
+    vector<int> twoSum(vector<int>& nums, int target) {
+        unordered_map<int, int> seen;
+        for (int i = 0; i < nums.size(); i++) {
+            if (seen.count(target - nums[i])) return {seen[target - nums[i]], i};
+            seen[nums[i]] = i;
+        }
+        return {};
+    }
+};
+""",
+}
+
+SEARCH_INSERT = {
+    "Python": """class Solution:
+    def searchInsert(self, nums, target):
+        lo, hi = 0, len(nums)
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if nums[mid] < target:
+                lo = mid + 1
+            else:
+                hi = mid
+        return lo
+""",
+    "Java": """class Solution {
+    public int searchInsert(int[] nums, int target) {
+        int left = 0, right = nums.length;
+        while (left < right) {
+            int mid = left + (right - left) / 2;
+            if (nums[mid] < target) left = mid + 1;
+            else right = mid;
+        }
+        return left;
+    }
+}
+""",
+    "C++": """class Solution {
+public:
+    int searchInsert(vector<int>& nums, int target) {
+        int low = 0, high = nums.size();
+        while (low < high) {
+            int mid = low + (high - low) / 2;
+            if (nums[mid] < target) low = mid + 1;
+            else high = mid;
+        }
+        return low;
+    }
+};
+""",
+}
+
+
+@pytest.mark.parametrize("solutions, expected", [(TWO_SUM, "hash"), (SEARCH_INSERT, "two_pointers")])
+def test_one_algorithm_has_one_fingerprint_across_languages(solutions, expected):
+    assert {language: algorithm_fingerprint(code, language) for language, code in solutions.items()} == {
+        language: expected for language in solutions
+    }
+
+
+def test_brace_initializers_outside_python_are_not_hash_maps():
+    code = "int[] counts = {};\nint total = 0;\nfor (int c : counts) total += c;\nreturn total;"
+    assert algorithm_fingerprint(code, "Java") == "plain"
+    assert algorithm_fingerprint("vector<int> row = { };\nreturn row;", "C++") == "plain"
+
+
+def test_single_letter_names_and_mid_are_not_techniques():
+    code = """int rangeSum(vector<int>& a, int l, int r) {
+    int mid = (l + r) / 2;
+    int s = 0;
+    for (int i = l; i <= r; i++) s += a[i];
+    return s + mid;
+}
+"""
+    assert algorithm_fingerprint(code, "C++") == "plain"
+
+
+def test_commented_out_techniques_are_ignored():
+    code = "class Solution:\n    def f(self, nums):\n        # seen = {} would need a dict\n        return sum(nums)\n"
+    assert algorithm_fingerprint(code, "Python") == "plain"
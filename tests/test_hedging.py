@@ -0,0 +1,141 @@
+import asyncio
+import threading
+import time
+
+from conftest import FakeResponse
+from services.generation_service import (
+    CANCELLED_REASON,
+    _arace,
+    _generate_hedged,
+    _succeeded,
+    build_generation_request,
+)
+
+
+PROBLEM = {
+    "problem_number": "1",
+    "problem_name": "Two Sum",
+    "difficulty": "Easy",
+    "link": "https://leetcode.com/problems/two-sum/",
+    "code": "class Solution:\n    pass\n",
+    "language": "Python",
+}
+
+POST = """Title: Hash Map Lookup
+## Intuition
+Remember what was seen.
+## Approach
+1. Walk once.
+## Time Complexity
+O(n)
+## Space Complexity
+O(n) for the map.
+"""
+
+
+def _request():
+    return build_generation_request(**PROBLEM)
+
+
+def _hedge(delay_seconds=0.05):
+    chunks = []
+    started_at = time.perf_counter()
+    generation = _generate_hedged(PROBLEM, _request(), delay_seconds, False, chunks.append)
+    return generation, "".join(chunks), time.perf_counter() - started_at
+
+
+def _outcome(generation, index):
+    return generation["attempts"][index][1]
+
+
+def test_a_primary_that_streams_in_time_is_not_hedged(fake_server):
+    fake_server.queue(FakeResponse(POST))
+    generation, streamed, _ = _hedge(delay_seconds=5)
+    assert generation["kind"] == ""
+    assert len(fake_server.responses) == 1
+    assert generation["live"]
+    assert streamed == POST
+    assert _outcome(generation, 0)["llm_response_text"] == POST.strip()
+
+
+def test_a_stalled_primary_loses_to_the_hedge_and_is_closed(fake_server):
+    primary, hedge = FakeResponse(POST, hold_after=0), FakeResponse(POST)
+    fake_server.queue(primary, hedge)
+    generation, streamed, elapsed = _hedge()
+    assert generation["kind"] == "hedge"
+    assert generation["winner"] == 1
+    assert primary.closed.is_set()
+    assert _outcome(generation, 0)["error_type"] == "CANCELLED"
+    assert not _outcome(generation, 1)["error_type"]
+    # A hedged winner is passed on once when the generation settles, not streamed.
+    assert not generation["live"] and streamed == ""
+    assert elapsed < 2
+
+
+def test_the_primary_can_still_win_and_the_hedge_is_cancelled(fake_server):
+    primary, hedge = FakeResponse(POST, hold_after=0), FakeResponse(POST, hold_after=0)
+    fake_server.queue(primary, hedge)
+
+    def _release_primary_once_hedged():
+        hedge.held.wait(5)
+        primary.release()
+
+    threading.Thread(target=_release_primary_once_hedged).start()
+    generation, _, elapsed = _hedge()
+    assert generation["kind"] == "hedge"
+    assert generation["winner"] == 0
+    assert hedge.closed.is_set() and hedge.sent == 0
+    assert _outcome(generation, 1)["error_type"] == "CANCELLED"
+    assert elapsed < 2
+
+
+def test_when_both_fail_the_primary_is_returned(fake_server):
+    primary = FakeResponse(POST, hold_after=0)
+    fake_server.queue(primary, FakeResponse(status_code=400))
+    # The hedge is refused at once; the primary's connection drops a little later.
+    threading.Timer(0.2, primary.close).start()
+    generation, streamed, _ = _hedge()
+    assert generation["kind"] == "hedge"
+    assert generation["winner"] == 0
+    assert _outcome(generation, 0)["error_type"] == "CONNECTION_ERROR"
+    assert _outcome(generation, 1)["error_type"] == "HTTP_CLIENT_ERROR"
+    assert streamed == ""
+
+
+def _arace_hedged(fake_server):
+    request = _request()
+
+    async def _race():
+        return await _arace(
+            fake_server.async_client,
+            30,
+            request,
+            PROBLEM["code"],
+            PROBLEM["language"],
+            False,
+            time.perf_counter(),
+            _succeeded,
+            hedge_delay_seconds=0.05,
+        )
+
+    return asyncio.run(_race())
+
+
+def test_async_hedge_wins_and_the_primary_task_is_cancelled(fake_server):
+    primary, hedge = FakeResponse(POST, delay=5), FakeResponse(POST)
+    fake_server.queue(primary, hedge)
+    started_at = time.perf_counter()
+    results, winner = _arace_hedged(fake_server)
+    assert winner == 1
+    assert primary.closed.is_set()
+    assert results[0][0]["response_data"]["done_reason"] == CANCELLED_REASON
+    assert results[1][0]["llm_response_text"] == POST.strip()
+    assert time.perf_counter() - started_at < 2
+
+
+def test_async_primary_in_time_sends_no_hedge(fake_server):
+    fake_server.queue(FakeResponse(POST))
+    results, winner = _arace_hedged(fake_server)
+    assert winner == 0
+    assert list(results) == [0]
+    assert len(fake_server.responses) == 1
@@ -0,0 +1,112 @@
+from services.markdown_sections import (
+    count_lines,
+    has_section,
+    insert_section,
+    parse_post,
+    render_body,
+    replace_section,
+    section_body,
+    set_title,
+)
+
+
+POST = """Title: Hash Map Lookup
+## Intuition
+Remember what was seen.
+## Approach
+1. Walk once.
+## Time Complexity
+O(n)
+## Space Complexity
+O(n)
+## Code
+```python
+pass
+```"""
+
+
+def test_sections_and_title_of_a_complete_post():
+    post = parse_post(POST)
+    assert post["sections"] == ["intuition", "approach", "time complexity", "space complexity", "code"]
+    assert post["titles"][0][2] == "Hash Map Lookup"
+    assert post["text"][post["code_offset"]:].startswith("## Code")
+    assert all(has_section(post, name) for name in ("intuition", "approach", "time complexity", "code"))
+
+
+def test_missing_heading_is_not_found():
+    post = parse_post(POST.replace("## Space Complexity\nO(n)\n", ""))
+    assert not has_section(post, "space complexity")
+    assert has_section(post, "time complexity")
+
+
+def test_heading_names_match_on_word_boundaries():
+    post = parse_post("## Approaches\nx\n##Intuition\ny\n### Approach\nz\n## Time   Complexity:\nO(1)")
+    assert not has_section(post, "approach")
+    # "##Intuition" has no space after the hashes and "###" is a subheading.
+    assert not has_section(post, "intuition")
+    assert has_section(post, "time complexity")
+
+
+def test_fenced_headings_and_titles_are_not_structure():
+    text = "Title: Real\n```\n## Code\nTitle: Fake\n```\n## Intuition\nx"
+    post = parse_post(text)
+    assert post["code_offset"] is None
+    assert [title[2] for title in post["titles"]] == ["Real"]
+    assert [key for _, key in post["section_starts"]] == ["intuition"]
+    # A fenced heading still counts as present, as the regex scorer did.
+    assert has_section(post, "code")
+
+
+def test_unpaired_trailing_fence_leaves_the_rest_as_text():
+    post = parse_post("## Intuition\nx\n```\n## Code\ny")
+    assert post["fences"] == []
+    assert post["code_offset"] is not None
+
+
+def test_render_body_drops_fences_and_code_and_cuts_the_title():
+    body = render_body(parse_post("Title: " + "x" * 20 + "\n## Intuition\nSee ```a = 1``` here\n## Code\nz"), 5)
+    assert body == "Title: xxxxx\n## Intuition\nSee  here"
+
+
+def test_insert_section_goes_before_the_next_named_section():
+    post = parse_post(POST.replace("## Time Complexity\nO(n)\n", ""))
+    text = insert_section(post, "Time Complexity", "O(n log n)", before=["space complexity"])
+    assert text.index("## Time Complexity\nO(n log n)") < text.index("## Space Complexity")
+    assert text.index("## Approach") < text.index("## Time Complexity")
+
+
+def test_insert_section_falls_back_to_before_code_then_to_the_end():
+    text = insert_section(parse_post("## Intuition\nx\n## Code\ny"), "Approach", "a", before=["missing"])
+    assert text == "## Intuition\nx\n## Approach\na\n\n## Code\ny"
+    assert insert_section(parse_post("## Intuition\nx"), "Approach", "a", before=[]).endswith("\n\n## Approach\na")
+
+
+def test_replace_section_keeps_the_following_sections():
+    text = replace_section(parse_post(POST), "Approach", "1. Sort.\n2. Scan.")
+    assert "## Approach\n1. Sort.\n2. Scan.\n\n## Time Complexity" in text
+    assert "Walk once" not in text
+    assert text.endswith("```")
+
+
+def test_section_body_is_empty_for_a_bare_heading_and_none_when_missing():
+    post = parse_post("## Intuition\n\n## Approach\n1. Walk.\n### Detail\nx\n## Time Complexity")
+    assert section_body(post, "Intuition") == ""
+    assert section_body(post, "approach") == "1. Walk.\n### Detail\nx"
+    assert section_body(post, "time complexity") == ""
+    assert section_body(post, "space complexity") is None
+
+
+def test_set_title_replaces_or_adds_the_title_line():
+    assert set_title(parse_post(POST), "Short").startswith("Title: Short\n## Intuition")
+    assert set_title(parse_post("## Intuition\nx"), "New") == "Title: New\n\n## Intuition\nx"
+
+
+def test_empty_input():
+    post = parse_post(None)
+    assert post["text"] == "" and post["sections"] == [] and post["titles"] == []
+    assert render_body(post, 10) == ""
+
+
+def test_count_lines_matches_splitlines():
+    for text in ("", "a", "a\n", "a\nb", "a\r\nb\r\n", "\n\n"):
+        assert count_lines(text) == len(text.splitlines())
@@ -0,0 +1,117 @@
+import pytest
+
+from services import prompt_compaction
+from services.prompt_compaction import compact_code, prepare_prompt_code
+
+
+@pytest.fixture
+def four_chars_per_token(monkeypatch):
+    # Keep budgets independent of the llm_runs history the real estimator calibrates on.
+    monkeypatch.setattr(prompt_compaction, "estimate_tokens", lambda text: len(text or "") // 4)
+
+
+def test_python_drops_comments_docstrings_and_blank_lines():
+    code = '''class Solution:
+    """Two pointers."""
+
+    def solve(self, nums):  # entry point
+        # walk both ends
+        return nums[0]
+'''
+    assert compact_code(code, "python") == (
+        "class Solution:\n    def solve(self, nums):\n        return nums[0]"
+    )
+
+
+def test_python_docstring_only_body_becomes_pass():
+    code = 'def f():\n    """Nothing here."""\n\ndef g():\n    return 1\n'
+    assert compact_code(code, "python") == "def f():\n    pass\ndef g():\n    return 1"
+
+
+def test_python_keeps_hashes_and_multiline_strings():
+    code = 'x = "# not a comment"\ny = """\n  keep   this\n\n"""  # gone\n'
+    assert compact_code(code, "python") == 'x = "# not a comment"\ny = """\n  keep   this\n\n"""'
+
+
+def test_python_that_does_not_tokenize_only_loses_blank_lines():
+    code = "def f(:\n\n    # kept\n    return 1   \n"
+    assert compact_code(code, "python") == "def f(:\n    # kept\n    return 1"
+
+
+def test_cpp_strips_comments_but_not_literals():
+    code = (
+        "int main() {\n"
+        "    // line comment\n"
+        '    auto s = "// not a comment"; /* block */ int x = 1\'000;\n'
+        '    auto r = R"x(/* raw */)x";\n'
+        "    char c = '\"';\n"
+        "}\n"
+    )
+    assert compact_code(code, "c++") == (
+        "int main() {\n"
+        '    auto s = "// not a comment"; int x = 1\'000;\n'
+        '    auto r = R"x(/* raw */)x";\n'
+        "    char c = '\"';\n"
+        "}"
+    )
+
+
+def test_java_text_block_is_kept():
+    code = 'class A {\n    String s = """\n      // inside\n    """; // outside\n}\n'
+    assert compact_code(code, "java") == 'class A {\n    String s = """\n      // inside\n    """;\n}'
+
+
+def test_sql_handles_doubled_quotes_and_dash_comments():
+    code = "SELECT 'it''s -- text' AS a, -- trailing\n    `col--name`\nFROM   t; /* done */\n"
+    assert compact_code(code, "sql") == "SELECT 'it''s -- text' AS a,\n    `col--name`\nFROM t;"
+
+
+def test_unterminated_block_comment_drops_the_rest():
+    assert compact_code("int x;\n/* open\nint y;", "java") == "int x;"
+
+
+def test_windows_line_endings_are_normalized():
+    assert compact_code("int x; // a\r\n\r\nint y;\r\n", "c++") == "int x;\nint y;"
+
+
+def test_compaction_is_idempotent():
+    code = "class A {\n  /* c */ int f() { return 1; } // x\n}\n"
+    once = compact_code(code, "java")
+    assert compact_code(once, "java") == once
+
+
+def test_prepare_keeps_code_under_budget(monkeypatch, four_chars_per_token):
+    monkeypatch.setattr(prompt_compaction, "PROMPT_TOKEN_BUDGET", 1000)
+    result = prepare_prompt_code("x = 1  # set x\n", "python", overhead_tokens=100)
+    assert result["code"] == "x = 1"
+    assert result["truncated"] == 0
+    assert result["tokens_saved"] == result["original_tokens"] - result["prompt_code_tokens"]
+
+
+def test_prepare_truncates_at_a_line_boundary_with_a_marker(monkeypatch, four_chars_per_token):
+    monkeypatch.setattr(prompt_compaction, "PROMPT_TOKEN_BUDGET", 150)
+    monkeypatch.setattr(prompt_compaction, "PROMPT_MIN_CODE_TOKENS", 50)
+    code = "\n".join(f"int v{index} = {index};" for index in range(100))
+    result = prepare_prompt_code(code, "java", overhead_tokens=50)
+    lines = result["code"].split("\n")
+    assert result["truncated"] == 1
+    assert lines[-1].startswith("// ... ") and lines[-1].endswith("omitted to fit the prompt token budget")
+    assert all(line in code.split("\n") for line in lines[:-1])
+    omitted = int(lines[-1].split()[2])
+    assert len(lines) - 1 + omitted == 100
+
+
+def test_zero_budget_disables_truncation(monkeypatch, four_chars_per_token):
+    monkeypatch.setattr(prompt_compaction, "PROMPT_TOKEN_BUDGET", 0)
+    code = "\n".join(f"x{index} = {index}" for index in range(500))
+    assert prepare_prompt_code(code, "python", overhead_tokens=10_000)["truncated"] == 0
+
+
+def test_budget_below_the_minimum_code_allowance_sends_the_code_whole(monkeypatch, four_chars_per_token):
+    monkeypatch.setattr(prompt_compaction, "PROMPT_TOKEN_BUDGET", 150)
+    monkeypatch.setattr(prompt_compaction, "PROMPT_MIN_CODE_TOKENS", 200)
+    code = "\n".join(f"int v{index} = {index};" for index in range(100))
+    result = prepare_prompt_code(code, "java", overhead_tokens=50)
+    assert result["truncated"] == 0
+    assert result["over_budget"] == 1
+    assert result["code"] == code
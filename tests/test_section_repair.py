@@ -0,0 +1,62 @@
+import time
+
+from conftest import FakeResponse
+from services.generation_service import _new_outcome, _repair_post, _request_generation, build_generation_request
+from test_hedging import POST, PROBLEM
+
+
+INTUITION = "## Intuition\nRemember what was seen.\n"
+REPAIRED_INTUITION = "## Intuition\nKeep a map of the values seen so far.\n"
+
+
+def _repair(fake_server, text, *replies):
+    request = build_generation_request(**PROBLEM)
+    outcome = _new_outcome()
+    fake_server.queue(FakeResponse(text), *replies)
+    _request_generation(outcome, request, PROBLEM["code"], PROBLEM["language"], False, None, time.perf_counter())
+    repairs = _repair_post(PROBLEM, request, outcome, False)
+    return outcome, repairs
+
+
+def test_a_missing_section_is_spliced_in_and_the_rest_kept_byte_for_byte(fake_server):
+    original = POST.replace(INTUITION, "")
+    outcome, repairs = _repair(fake_server, original, FakeResponse(REPAIRED_INTUITION + "## Approach\nRewritten.\n"))
+    assert len(repairs) == 1
+    assert outcome["repaired_sections"] == "intuition"
+    before, after = original.strip().split("## Approach")
+    assert outcome["response_data"]["response"] == (
+        before + REPAIRED_INTUITION + "\n## Approach" + after
+    )
+    assert outcome["llm_response_text"] == original.strip()
+    assert "Keep a map of the values seen so far." in outcome["response_text"]
+
+
+def test_a_missing_last_section_is_appended(fake_server):
+    original = POST.replace("## Space Complexity\nO(n) for the map.\n", "")
+    outcome, _ = _repair(fake_server, original, FakeResponse("## Space Complexity\nO(n) for the map.\n"))
+    assert outcome["repaired_sections"] == "space_complexity"
+    assert outcome["response_data"]["response"] == original.strip() + "\n\n## Space Complexity\nO(n) for the map."
+
+
+def test_an_empty_section_is_filled_in_place(fake_server):
+    original = POST.replace(INTUITION, "## Intuition\n\n")
+    outcome, repairs = _repair(fake_server, original, FakeResponse(REPAIRED_INTUITION))
+    assert len(repairs) == 1
+    assert outcome["repaired_sections"] == "intuition"
+    before, after = original.strip().split("## Intuition\n\n")
+    assert outcome["response_data"]["response"] == before + REPAIRED_INTUITION + "\n" + after
+
+
+def test_a_complete_post_sends_no_repair(fake_server):
+    outcome, repairs = _repair(fake_server, POST)
+    assert repairs == []
+    assert outcome["repaired_sections"] == ""
+    assert len(fake_server.responses) == 1
+
+
+def test_a_failed_repair_leaves_the_post_untouched(fake_server):
+    original = POST.replace(INTUITION, "")
+    outcome, repairs = _repair(fake_server, original, FakeResponse(status_code=400))
+    assert len(repairs) == 1
+    assert outcome["repaired_sections"] == ""
+    assert outcome["response_data"]["response"] == original
@@ -0,0 +1,124 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from conftest import FakeResponse
+from services import generation_service, single_flight
+from services.single_flight import join_flight, land_flight, wait_for_flight
+from test_hedging import POST, PROBLEM
+
+
+CALLERS = 6
+
+
+@pytest.fixture(autouse=True)
+def flights(monkeypatch):
+    monkeypatch.setattr(single_flight, "_flights", {})
+
+
+def _wait_for_followers(count):
+    deadline = time.perf_counter() + 5
+    while time.perf_counter() < deadline:
+        flights = list(single_flight._flights.values())
+        if flights and flights[0]["followers"] == count:
+            return
+        time.sleep(0.01)
+    raise AssertionError(f"{count} followers never joined")
+
+
+def _run_callers(call):
+    with ThreadPoolExecutor(max_workers=CALLERS) as executor:
+        futures = [executor.submit(call) for _ in range(CALLERS)]
+        return [future.exception() or future.result() for future in futures]
+
+
+def test_concurrent_callers_share_the_leaders_result():
+    computed = []
+
+    def _call():
+        flight, is_leader = join_flight("key")
+        if not is_leader:
+            return wait_for_flight(flight, 5)
+        _wait_for_followers(CALLERS - 1)
+        computed.append(1)
+        result = {"text": "post"}
+        land_flight("key", flight, result)
+        return result
+
+    results = _run_callers(_call)
+    assert len(computed) == 1
+    assert results == [{"text": "post"}] * CALLERS
+    assert single_flight._flights == {}
+
+
+def test_followers_get_none_when_the_leader_raises():
+    def _call():
+        flight, is_leader = join_flight("key")
+        if not is_leader:
+            return wait_for_flight(flight, 5)
+        try:
+            _wait_for_followers(CALLERS - 1)
+            raise RuntimeError("leader failed")
+        finally:
+            land_flight("key", flight, None)
+
+    results = _run_callers(_call)
+    assert sum(isinstance(result, RuntimeError) for result in results) == 1
+    assert results.count(None) == CALLERS - 1
+    # The failed flight is gone; the next caller leads a new one.
+    assert join_flight("key")[1]
+
+
+def test_a_follower_that_times_out_gets_none():
+    flight, _ = join_flight("key")
+    follower, is_leader = join_flight("key")
+    assert not is_leader
+    assert wait_for_flight(follower, 0.05) is None
+    land_flight("key", flight, {"text": "late"})
+    assert wait_for_flight(follower, 0) == {"text": "late"}
+
+
+def _generate():
+    return generation_service.generate_solution_post_with_metadata(**PROBLEM, include_repo_link=False)
+
+
+def _release_once_followers_joined(response):
+    def _release():
+        _wait_for_followers(CALLERS - 1)
+        response.release()
+
+    threading.Thread(target=_release).start()
+
+
+def test_identical_generations_send_one_request(fake_server):
+    leader_response = FakeResponse(POST, hold_after=0)
+    fake_server.queue(leader_response)
+    _release_once_followers_joined(leader_response)
+    results = _run_callers(_generate)
+    assert len(fake_server.responses) == 1
+    assert len({result["text"] for result in results}) == 1
+    assert sorted(result["coalesced"] for result in results) == [0] + [1] * (CALLERS - 1)
+
+
+def test_followers_generate_on_their_own_when_the_leader_raises(fake_server, monkeypatch):
+    leader_response = FakeResponse(POST, hold_after=0)
+    fake_server.queue(leader_response, *(FakeResponse(POST) for _ in range(CALLERS - 1)))
+    repair_winner = generation_service._repair_winner
+    failed = []
+
+    def _repair_once_then_fail(problem, generation, include_repo_link):
+        if not failed:
+            failed.append(1)
+            raise RuntimeError("leader failed")
+        repair_winner(problem, generation, include_repo_link)
+
+    monkeypatch.setattr(generation_service, "_repair_winner", _repair_once_then_fail)
+    _release_once_followers_joined(leader_response)
+    results = _run_callers(_generate)
+    assert sum(isinstance(result, RuntimeError) for result in results) == 1
+    posts = [result for result in results if isinstance(result, dict)]
+    assert len(posts) == CALLERS - 1
+    assert all(not post["coalesced"] and not post["error_type"] for post in posts)
+    assert len(fake_server.responses) == CALLERS
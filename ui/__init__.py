@@ -1 +1 @@
-"""UI package for Streamlit pages, theme, and activity tracking."""
+"""UI package for Streamlit pages, theme, and activity tracking."""
@@ -1,17 +1,17 @@
-LANGUAGE_EXTENSION_MAP = {
-    "Python": "py",
-    "SQL": "sql",
-    "C++": "cpp",
-    "Java": "java",
-}
-
-TAB_NAMES = [
-    "Generate",
-    "Queue",
-    "Metrics",
-    "Activity",
-    "Git",
-    "Settings",
-    "Copy Solutions",
-    "About",
-]
+LANGUAGE_EXTENSION_MAP = {
+    "Python": "py",
+    "SQL": "sql",
+    "C++": "cpp",
+    "Java": "java",
+}
+
+TAB_NAMES = [
+    "Generate",
+    "Queue",
+    "Metrics",
+    "Activity",
+    "Git",
+    "Settings",
+    "Copy Solutions",
+    "About",
+]